@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import OrderedDict, namedtuple
+
+DEFAULT_AGGREGATE_CACHE_SIZE = 256 * 2**20
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "max_bytes", "nbytes"])
+
+
+def _nbytes(source):
+    """
+    approximate device/host memory used by a calculate_source result
+    """
+    if isinstance(source, (tuple, list)):
+        return sum(_nbytes(s) for s in source)
+    if hasattr(source, "memory_usage"):
+        usage = source.memory_usage()
+        return int(usage.sum() if hasattr(usage, "sum") else usage)
+    return int(getattr(source, "nbytes", 8))
+
+
+class AggregateCache:
+    """
+    LRU cache of the chart aggregates (the calculate_source results) of a
+    dashboard, keyed by the chart name and the canonical filter state the
+    aggregate was computed for.
+
+    Used by cuxfilter.DashBoard to serve repeated filter states, like
+    toggling between a few selections or re-applying the same brush,
+    without touching the data. The least recently used aggregates are
+    evicted once the total size exceeds ``max_bytes``, a ``max_bytes`` of
+    0 disables the cache.
+
+    The unfiltered aggregates of the charts, computed once when the charts
+    are initiated, are pinned with ``pin``: they are never evicted and do
+    not count towards ``max_bytes``, so resetting the dashboard filters is
+    always served from the cache.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_AGGREGATE_CACHE_SIZE):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.clear()
+
+    def clear(self):
+        self._entries = OrderedDict()
+        self._pinned = {}
+        self.nbytes = 0
+
+    def discard(self, name):
+        """
+        drop the cached aggregates of the named chart
+        """
+        for key in [key for key in self._entries if key[0] == name]:
+            self.nbytes -= self._entries.pop(key)[1]
+        for key in [key for key in self._pinned if key[0] == name]:
+            self._pinned.pop(key)
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.max_bytes, self.nbytes)
+
+    def _key(self, chart, state):
+        if state is None:
+            # the filter state can not be repeated, see canonical_state
+            return None
+        key = (chart.name, state)
+        try:
+            hash(key)
+        except TypeError:
+            # filter values without a stable hash are not cached
+            return None
+        return key
+
+    def get(self, chart, state):
+        """
+        cached aggregate of the chart for the filter state, None on a miss
+        """
+        key = self._key(chart, state)
+        if key in self._pinned:
+            self.hits += 1
+            return self._pinned[key]
+        if key is None or key not in self._entries:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def pin(self, chart, state, source):
+        """
+        keep the aggregate of the chart for the filter state until cleared
+        """
+        key = self._key(chart, state)
+        if key is not None and source is not None:
+            self._pinned[key] = source
+
+    def put(self, chart, state, source):
+        key = self._key(chart, state)
+        if key is None or source is None or self.max_bytes <= 0:
+            return
+        nbytes = _nbytes(source)
+        if nbytes > self.max_bytes:
+            return
+        if key in self._entries:
+            self.nbytes -= self._entries.pop(key)[1]
+        self._entries[key] = (source, nbytes)
+        self.nbytes += nbytes
+        while self.nbytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.nbytes -= evicted
@@ -0,0 +1,136 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import cudf
+import dask_cudf
+import pandas as pd
+
+from .data_tiles import (
+    _Binning,
+    _bin_sums,
+    _to_host,
+    _values,
+    chart_aggregates,
+    chart_result,
+    is_tile_chart,
+    unique_labels,
+)
+
+
+def _binning_key(binning):
+    if binning.stride is None:
+        return (binning.x, None)
+    return (binning.x, binning.stride, binning.min_value, binning.size)
+
+
+class AggregationPlan:
+    """
+    Single pass computation of the aggregates of the charts of a dashboard
+    over the filtered rows.
+
+    The aggregates of the charts binned by the values or by the stride grid
+    of their x column, with count, sum or mean aggregate functions (the
+    charts the data tiles support, see ``cuxfilter.assets.data_tiles``),
+    are computed together instead of one chart at a time:
+
+    - each column is gathered from the filtered view once
+    - the bin codes of an x column are computed once, and shared by all the
+      charts binned the same way
+    - each per bin table (row counts, sums of a column) is computed once,
+      and shared by all the charts that need it
+
+    The number of selected rows of the datasize indicator is the row count
+    of the filter mask.
+
+    The plan is built for the charts of a dashboard and its source data,
+    and is rebuilt when they change.
+    """
+
+    def __init__(self, charts, data):
+        self.data = data
+        self._charts = {}
+        self._binnings = {}
+        if isinstance(data, dask_cudf.DataFrame):
+            return
+        for chart in charts:
+            if not is_tile_chart(chart, data):
+                continue
+            binning = _Binning(chart)
+            key = _binning_key(binning)
+            self._binnings.setdefault(key, binning)
+            self._charts[chart.name] = (key, chart_aggregates(chart))
+        unique_labels(data, self._binnings.values())
+        self._frame_cls = (
+            pd.DataFrame if isinstance(data, pd.DataFrame) else cudf.DataFrame
+        )
+        self._dtypes = {col: data[col].dtype for col in data.columns}
+
+    def supports(self, chart):
+        """
+        whether the source of the chart is computed by the plan
+        """
+        return (
+            getattr(chart, "is_datasize_indicator", False)
+            or chart.name in self._charts
+        )
+
+    def compute(self, charts, view):
+        """
+        Compute the sources of the supported charts over a FilteredView.
+
+        Returns
+        -------
+        list of (chart, source) tuples, the sources in the format of the
+        calculate_source of each chart
+        """
+        columns, codes, tables = {}, {}, {}
+
+        def column(col):
+            if col not in columns:
+                columns[col] = _values(view[col])
+            return columns[col]
+
+        def bin_codes(key):
+            if key not in codes:
+                binning = self._binnings[key]
+                x, valid, xp = column(binning.x)
+                codes[key] = (binning.codes(x[valid], xp), valid)
+            return codes[key]
+
+        def table(key, col=None):
+            if (key, col) not in tables:
+                size = self._binnings[key].size
+                x_codes, valid = bin_codes(key)
+                if col is None:
+                    result = _bin_sums(x_codes, size)
+                else:
+                    values, valid_col, _ = column(col)
+                    result = _bin_sums(
+                        x_codes, size, values[valid], valid_col[valid]
+                    )
+                tables[(key, col)] = [_to_host(arr) for arr in result]
+            return tables[(key, col)]
+
+        results = []
+        for chart in charts:
+            if getattr(chart, "is_datasize_indicator", False):
+                results.append((chart, len(view)))
+                continue
+            key, aggregates = self._charts[chart.name]
+            chart_tables = list(table(key))
+            for col in aggregates or {}:
+                chart_tables.extend(table(key, col))
+            results.append(
+                (
+                    chart,
+                    chart_result(
+                        chart,
+                        self._binnings[key],
+                        aggregates,
+                        chart_tables,
+                        self._frame_cls,
+                        self._dtypes,
+                    ),
+                )
+            )
+        return results
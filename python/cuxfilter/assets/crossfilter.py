@@ -0,0 +1,533 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+from itertools import count
+import dask_cudf
+
+import cudf
+import cupy as cp
+import pandas as pd
+
+from . import cudf_utils
+from .dimension import (
+    Delta,
+    Dimension,
+    GroupIndex,
+    supports_dimension,
+    supports_group_index,
+)
+from .predicates import (
+    And,
+    Equality,
+    Mask,
+    Range,
+    SetMembership,
+    as_predicate,
+)
+from .selection import Selection
+from .spatial_index import SpatialIndex, supports_spatial_index
+
+_LOCAL_VARIABLE_PATTERN = re.compile(r"@(\w+)")
+_FILTER_VERSIONS = count()
+
+
+class CrossFilter:
+    """
+    Incremental crossfilter engine used by cuxfilter.DashBoard.
+
+    Keeps one cached boolean row mask per active chart filter. When the
+    dashboard query state changes, only the masks of the charts whose
+    filter actually changed are invalidated, and the filtered data is
+    obtained by AND-ing the cached masks. Masks are computed lazily, the
+    first time a combined mask needs them.
+
+    Filters are read from the dashboard query state, where each chart entry
+    is either a Predicate (see ``cuxfilter.assets.predicates``), a query
+    string (with its ``@`` variables resolved from the local variables
+    dict), a compact row Selection or a precomputed boolean mask.
+    Selections stay compact in the cache, they are combined with each other
+    first and only expanded to a row mask once.
+
+    The masks are combined from the most to the least selective one, as
+    far as their selected row counts are known, and the combination stops
+    as soon as no row is left.
+
+    A range filter that is updated again (a brush or a range slider being
+    dragged) gets a sorted Dimension index of its column, for in-memory
+    data. Its mask is then updated in place from the rows between the old
+    and the new bounds only, and those rows are kept as the ``delta`` of
+    the filter, for the aggregates to be updated incrementally. Likewise, an
+    equality or set membership filter that is updated again (a discrete
+    widget) gets a GroupIndex of its column, and its selection is then read
+    from the index instead of scanning the column.
+
+    The x and y columns of the scatter, heatmap and graph charts get a
+    SpatialIndex, requested with ``spatial_index`` when the charts are
+    initiated. Box filters over an indexed pair of columns are read from
+    the index, and the index is rebuilt lazily when the source data
+    changes.
+
+    Works for cudf, dask_cudf and pandas backed dataframes.
+    """
+
+    def __init__(self, data=None):
+        self.data = data
+        # (x, y) column pairs to keep a SpatialIndex of, across data changes
+        self._spatial_columns = set()
+        self.reset()
+
+    def reset(self):
+        """
+        drop all cached masks
+        """
+        self._filters = {}
+        self._masks = {}
+        self._counts = {}
+        self._versions = {}
+        self._dimensions = {}
+        self._dimension_masks = {}
+        self._group_indexes = {}
+        self._spatial_indexes = {}
+        self._deltas = {}
+        self._previous_state = None
+        self._combined = None
+        self._generation = next(_FILTER_VERSIONS)
+
+    @property
+    def active_filters(self):
+        return list(self._filters.keys())
+
+    @property
+    def has_dimensions(self):
+        """
+        whether a range filter is backed by a Dimension index
+        """
+        return len(self._dimension_masks) > 0
+
+    def state(self, ignore=()):
+        """
+        hashable snapshot of the active filters except the ignored ones,
+        changes whenever any of those filters (or the source data) changes
+        """
+        return (self._generation,) + tuple(
+            sorted(
+                (name, version)
+                for name, version in self._versions.items()
+                if name not in ignore
+            )
+        )
+
+    def canonical_state(self, ignore=()):
+        """
+        hashable value of the active filters except the ignored ones, equal
+        for any two identical filter states of the same source data, unlike
+        ``state`` which changes on every filter update.
+
+        None if one of those filters is a Mask, masks are identified by the
+        selection object they hold and a new selection never repeats a
+        previous state, so that state is not worth caching.
+        """
+        if any(
+            isinstance(value, Mask)
+            for name, (value, _) in self._filters.items()
+            if name not in ignore
+        ):
+            return None
+        return (self._generation,) + tuple(
+            sorted(
+                (
+                    (name, key if isinstance(value, str) else value)
+                    for name, (value, key) in self._filters.items()
+                    if name not in ignore
+                ),
+                key=lambda item: item[0],
+            )
+        )
+
+    def _filter_key(self, value, local_dict):
+        """
+        key identifying the current state of a single chart filter
+        """
+        if isinstance(value, str):
+            variables = sorted(set(_LOCAL_VARIABLE_PATTERN.findall(value)))
+            return (value, tuple((v, local_dict.get(v)) for v in variables))
+        return value.key
+
+    def _is_cached(self, name, key):
+        if name not in self._filters:
+            return False
+        try:
+            return bool(self._filters[name][1] == key)
+        except (TypeError, ValueError):
+            return False
+
+    def _compute_mask(self, value, local_dict):
+        if isinstance(value, str):
+            return cudf_utils.query_mask(self.data, value, local_dict)
+        return value.mask(self.data)
+
+    def _dimension(self, column):
+        """
+        Dimension index of a column, None if the column does not support
+        one
+        """
+        if column not in self._dimensions:
+            series = self.data[column]
+            self._dimensions[column] = (
+                Dimension(series) if supports_dimension(series) else None
+            )
+        return self._dimensions[column]
+
+    def _group_index(self, column):
+        """
+        GroupIndex of a column, None if the column does not support one
+        """
+        if column not in self._group_indexes:
+            series = self.data[column]
+            self._group_indexes[column] = (
+                GroupIndex(series) if supports_group_index(series) else None
+            )
+        return self._group_indexes[column]
+
+    def spatial_index(self, x, y):
+        """
+        SpatialIndex of the x and y columns, built once per source data,
+        None if the columns do not support one
+        """
+        self._spatial_columns.add((x, y))
+        if (x, y) not in self._spatial_indexes:
+            self._spatial_indexes[(x, y)] = (
+                SpatialIndex(self.data[x], self.data[y])
+                if supports_spatial_index(self.data[x], self.data[y])
+                else None
+            )
+        return self._spatial_indexes[(x, y)]
+
+    def _spatial_selection(self, value):
+        """
+        Selection of a box filter over a pair of columns with a
+        SpatialIndex, None if the filter is not such a box
+        """
+        if not (
+            isinstance(value, And)
+            and len(value.predicates) == 2
+            and all(isinstance(p, Range) for p in value.predicates)
+        ):
+            return None
+        x_range, y_range = value.predicates
+        if (x_range.column, y_range.column) not in self._spatial_columns:
+            x_range, y_range = y_range, x_range
+        if (x_range.column, y_range.column) not in self._spatial_columns:
+            return None
+        index = self.spatial_index(x_range.column, y_range.column)
+        if index is None:
+            return None
+        return index.box(
+            (x_range.low, x_range.high), (y_range.low, y_range.high)
+        )
+
+    def _index_discrete(self, previous, value):
+        """
+        Build the GroupIndex of the column of an equality or set membership
+        filter that is updated again
+        """
+        discrete = (Equality, SetMembership)
+        if (
+            isinstance(value, discrete)
+            and isinstance(previous, discrete)
+            and value.column == previous.column
+        ):
+            self._group_index(value.column)
+
+    def _group_selection(self, value):
+        """
+        Selection of an equality or set membership filter read from the
+        GroupIndex of its column, None if the column is not indexed
+        """
+        if not isinstance(value, (Equality, SetMembership)):
+            return None
+        index = self._group_indexes.get(value.column)
+        if index is None:
+            return None
+        values = [value.value] if isinstance(value, Equality) else value.values
+        return Selection.from_ids(index.rows(values), index.size)
+
+    def _dimension_mask(self, name):
+        """
+        mask Series of a range filter backed by a Dimension index
+        """
+        if name not in self._dimension_masks:
+            value, _ = self._filters[name]
+            dimension = self._dimensions[value.column]
+            bounds = dimension.bounds(value.low, value.high)
+            self._dimension_masks[name] = (
+                dimension,
+                bounds,
+                dimension.mask(bounds),
+            )
+            self._counts[name] = bounds[1] - bounds[0]
+        series_cls = (
+            pd.Series if isinstance(self.data, pd.DataFrame) else cudf.Series
+        )
+        # a copy, the array is updated in place when the range is moved,
+        # under the readers of the masks handed out before
+        return series_cls(
+            self._dimension_masks[name][2], index=self.data.index, copy=True
+        )
+
+    def _move_range(self, name, previous, value):
+        """
+        Update the mask of a range filter in place from the rows between its
+        previous and its new bounds, returns False if the filter is not a
+        moved range of a column with a Dimension index.
+        """
+        if not (
+            isinstance(value, Range)
+            and isinstance(previous, Range)
+            and value.column == previous.column
+        ):
+            return False
+        if name not in self._dimension_masks:
+            # the range is being dragged, index its column for the next
+            # moves
+            self._dimension(value.column)
+            return False
+        dimension, bounds, array = self._dimension_masks[name]
+        new_bounds = dimension.bounds(value.low, value.high)
+        entered, left = dimension.delta(bounds, new_bounds)
+        array[entered] = True
+        array[left] = False
+        self._dimension_masks[name] = (dimension, new_bounds, array)
+        # the Series of the mask is rebuilt from the array when needed
+        self._masks.pop(name, None)
+        self._counts[name] = new_bounds[1] - new_bounds[0]
+        self._deltas[name] = (entered, left)
+        return True
+
+    def delta(self, name):
+        """
+        Delta of the rows that entered and left the named range filter in
+        the last update, None if the filter was not moved in place
+        """
+        if name not in self._deltas:
+            return None
+        return Delta(self._previous_state, *self._deltas[name])
+
+    def contains(self, rows, ignore=()):
+        """
+        boolean array, whether each of the row positions passes all active
+        filters except the ignored ones
+        """
+        xp = cp.get_array_module(rows)
+        result = xp.ones(len(rows), dtype="bool")
+        for name in self._filters:
+            if name in ignore or len(rows) == 0:
+                continue
+            mask = self._get_mask(name)
+            if isinstance(mask, Selection):
+                result &= mask.contains(rows)
+            else:
+                result &= xp.asarray(mask.values)[rows]
+        return result
+
+    def _get_mask(self, name):
+        if name not in self._masks:
+            value, key = self._filters[name]
+            if name in self._dimension_masks or (
+                isinstance(value, Range)
+                and self._dimensions.get(value.column) is not None
+            ):
+                self._masks[name] = self._dimension_mask(name)
+                return self._masks[name]
+            # the filter key holds the local variables the query string
+            # referenced at the time of the update
+            local_dict = dict(key[1]) if isinstance(value, str) else {}
+            mask = self._group_selection(value)
+            if mask is None:
+                mask = self._spatial_selection(value)
+            if mask is None:
+                mask = self._compute_mask(value, local_dict)
+            self._masks[name] = mask
+            if isinstance(mask, Selection):
+                self._counts[name] = mask.count
+            elif not isinstance(self.data, dask_cudf.DataFrame):
+                self._counts[name] = int(mask.sum())
+        return self._masks[name]
+
+    def _selectivity(self, name):
+        """
+        sort key of the masks, the number of selected rows if known
+        """
+        return self._counts.get(name, float("inf"))
+
+    def update(self, data, query_dict, local_dict):
+        """
+        Sync the cached masks with the current dashboard query state.
+
+        Parameters
+        ----------
+        data: cudf.DataFrame, dask_cudf.DataFrame or pandas.DataFrame
+            unfiltered source dataframe
+        query_dict: dict
+            chart name -> Predicate, query string, Selection or boolean mask
+        local_dict: dict
+            values of the local variables referenced by the query strings
+
+        Returns
+        -------
+        set of chart names whose filter changed since the last update
+        """
+        if data is not self.data:
+            self.data = data
+            self.reset()
+        state = self.state()
+
+        changed = set(self._filters) - set(query_dict)
+        for name in changed:
+            self._filters.pop(name)
+            self._masks.pop(name, None)
+            self._counts.pop(name, None)
+            self._versions.pop(name)
+            self._dimension_masks.pop(name, None)
+
+        deltas = {}
+        for name, value in query_dict.items():
+            value = as_predicate(value)
+            key = self._filter_key(value, local_dict)
+            if self._is_cached(name, key):
+                continue
+            previous = self._filters.get(name, (None,))[0]
+            self._filters[name] = (value, key)
+            self._index_discrete(previous, value)
+            if self._move_range(name, previous, value):
+                deltas[name] = self._deltas[name]
+            else:
+                self._masks.pop(name, None)
+                self._counts.pop(name, None)
+                self._dimension_masks.pop(name, None)
+            self._versions[name] = next(_FILTER_VERSIONS)
+            changed.add(name)
+
+        if changed:
+            self._combined = None
+            self._deltas = deltas
+            self._previous_state = state
+        return changed
+
+    def mask(self, ignore=(), include=None):
+        """
+        Combined row mask of the active filters.
+
+        Parameters
+        ----------
+        ignore: iterable of chart names to leave out
+        include: iterable of chart names to restrict to, default all
+
+        Returns
+        -------
+        boolean series indexed like the source data, or None when no
+        filter applies
+        """
+        names = [
+            name
+            for name in self._filters
+            if name not in ignore and (include is None or name in include)
+        ]
+        use_cache = len(ignore) == 0 and include is None
+        if use_cache and self._combined is not None:
+            return self._combined
+
+        selection, result = None, None
+        for name in sorted(names, key=self._selectivity):
+            mask = self._get_mask(name)
+            if isinstance(mask, Selection):
+                selection = mask if selection is None else selection & mask
+                empty = selection.count == 0
+            else:
+                result = mask if result is None else result & mask
+                empty = not isinstance(
+                    self.data, dask_cudf.DataFrame
+                ) and not bool(result.any())
+            if empty:
+                # no row left, the remaining masks cannot change the result
+                break
+        if selection is not None:
+            mask = selection.to_series(self.data)
+            result = mask if result is None else result & mask
+
+        if use_cache:
+            self._combined = result
+        return result
+
+    def filter(self, ignore=()):
+        """
+        Source data filtered by all active filters except the ignored ones
+        """
+        return self.view(ignore=ignore).frame()
+
+    def view(self, ignore=()):
+        """
+        FilteredView of the source data by all active filters except the
+        ignored ones, nothing is gathered until its columns are requested
+        """
+        return FilteredView(self.data, self.mask(ignore=ignore))
+
+
+class FilteredView:
+    """
+    Lazily filtered dataframe: the source dataframe and the combined row
+    mask of the filters.
+
+    The dashboard hands a view to the charts instead of the filtered
+    dataframe, and each chart gathers the filtered rows of the few columns
+    it reads only, so the full filtered copy of a wide dataframe is never
+    materialized.
+    """
+
+    def __init__(self, data, mask):
+        self.data = data
+        self.mask = mask
+        self._len = None
+        self._frames = {}
+
+    @property
+    def columns(self):
+        return self.data.columns
+
+    def __len__(self):
+        if self._len is None:
+            if self.mask is None:
+                self._len = len(self.data)
+            elif isinstance(self.data, dask_cudf.DataFrame):
+                self._len = int(self.mask.sum().compute())
+            else:
+                self._len = int(self.mask.sum())
+        return self._len
+
+    def __getitem__(self, column):
+        """
+        filtered rows of a single column
+        """
+        if self.mask is None:
+            return self.data[column]
+        return self.data[column][self.mask]
+
+    def frame(self, columns=None):
+        """
+        Filtered rows of the columns, all the columns by default. The
+        frames are kept for the lifetime of the view, charts reading the
+        same columns share them.
+        """
+        key = None if columns is None else tuple(columns)
+        if key in self._frames:
+            return self._frames[key]
+        data = self.data if columns is None else self.data[list(columns)]
+        if self.mask is not None:
+            data = data[self.mask]
+            # cull any empty partitions, since dask_cudf dataframe filtering
+            # may result in one
+            if isinstance(self.data, dask_cudf.DataFrame):
+                data = cudf_utils.cull_empty_partitions(data)
+        self._frames[key] = data
+        return data
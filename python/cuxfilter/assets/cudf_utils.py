@@ -1,10 +1,19 @@
-# SPDX-FileCopyrightText: Copyright (c) 2020-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2020-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import cudf
+import cupy as cp
 import dask_cudf
 import dask.dataframe as dd
+import pandas as pd
 from ..charts.constants import CUDF_DATETIME_TYPES
 
+try:
+    # private cudf API, query_mask falls back to DataFrame.query without it
+    from cudf.utils.queryutils import query_execute
+except ImportError:
+    query_execute = None
+
 
 def get_min_max(df, col_name):
     min, max = df[col_name].min(), df[col_name].max()
@@ -38,7 +47,8 @@ def cull_empty_partitions(df):
             pempty = df.get_partition(ix)
         else:
             df_delayed_new.append(df_delayed[ix])
-    if pempty is not None:
+    # keep a single empty partition if all of them are empty
+    if pempty is not None and len(df_delayed_new) > 0:
         df = dd.from_delayed(df_delayed_new, meta=pempty)
     return df
 
@@ -56,3 +66,107 @@ def query_df(df, query, local_dict, indices=None):
         result = cull_empty_partitions(result)
 
     return result
+
+
+def query_mask(df, query, local_dict):
+    """
+    Evaluate a boolean query expression over df and return the row mask,
+    indexed like df, without materializing the filtered dataframe.
+
+    Supports cudf, dask_cudf and pandas backed dataframes.
+    """
+    if isinstance(df, dask_cudf.DataFrame):
+        return df.map_partitions(
+            query_mask, query, local_dict, meta=(None, "bool")
+        )
+    if isinstance(df, cudf.DataFrame):
+        if len(df) == 0:
+            return cudf.Series([], dtype="bool", index=df.index)
+        if query_execute is None or not hasattr(cudf.Series, "_from_column"):
+            return _cudf_query_mask(df, query, local_dict)
+        # same kernel cudf.DataFrame.query uses, minus the final gather
+        callenv = {
+            "local_dict": local_dict,
+            "global_dict": {},
+            "locals": {},
+            "globals": {},
+        }
+        return cudf.Series._from_column(
+            query_execute(df, query, callenv), index=df.index
+        )
+    return df.eval(query, local_dict=local_dict)
+
+
+def _cudf_query_mask(df, query, local_dict):
+    """
+    row mask of a query over a cudf dataframe with the public
+    DataFrame.query, from the positions of the rows it keeps
+    """
+    positions = (
+        df.reset_index(drop=True)
+        .query(expr=query, local_dict=local_dict)
+        .index.values
+    )
+    mask = cp.zeros(len(df), dtype="bool")
+    mask[positions] = True
+    return cudf.Series(mask, index=df.index)
+
+
+def is_string_dtype(dtype):
+    return str(dtype) in ("object", "string", "str")
+
+
+def _string_codes(series, labels):
+    """
+    int32 codes of the values of an in-memory string series in labels,
+    nulls stay null
+    """
+    if isinstance(series, pd.Series):
+        codes = pd.Categorical(series, categories=labels).codes
+        codes = pd.Series(codes, index=series.index, name=series.name)
+        if (codes < 0).any():
+            return codes.astype("Int32").mask(codes < 0)
+        return codes.astype("int32")
+    dtype = cudf.CategoricalDtype(categories=labels)
+    return series.astype(dtype).cat.codes.astype("int32")
+
+
+def dictionary_encode(df, columns=None):
+    """
+    Dictionary-encode the string columns of df: each column is replaced
+    by the int32 codes of its values in the sorted array of its distinct
+    values, its labels.
+
+    Parameters
+    ----------
+    df: cudf.DataFrame, dask_cudf.DataFrame or pandas.DataFrame
+    columns: list, default None
+        columns to encode, all the string columns of df by default
+
+    Returns
+    -------
+    (encoded dataframe, dict of column -> pandas.Index of labels)
+    """
+    if columns is None:
+        columns = [col for col in df.columns if is_string_dtype(df[col].dtype)]
+    if len(columns) == 0:
+        return df, {}
+    is_dask = isinstance(df, dask_cudf.DataFrame)
+    uniques = [df[col].dropna().unique() for col in columns]
+    if is_dask:
+        uniques = dd.compute(*uniques)
+
+    df = df.copy()
+    dictionaries = {}
+    for col, labels in zip(columns, uniques):
+        if hasattr(labels, "to_pandas"):
+            labels = labels.to_pandas()
+        labels = pd.Index(labels).sort_values()
+        if is_dask:
+            df[col] = df[col].map_partitions(
+                _string_codes, labels, meta=(col, "int32")
+            )
+        else:
+            df[col] = _string_codes(df[col], labels)
+        dictionaries[col] = labels
+    return df, dictionaries
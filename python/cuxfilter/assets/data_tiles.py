@@ -0,0 +1,796 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import cudf
+import cupy as cp
+import dask
+import dask_cudf
+import numpy as np
+import pandas as pd
+
+TILE_AGGREGATES = ("count", "sum", "mean")
+# upper bound on (active bins x passive bins) cells per passive chart
+MAX_TILE_CELLS = 2**24
+# number of grid cells along each axis of the 2D (scatter, heatmap) tiles
+SUMMED_AREA_GRID_SIZE = 128
+
+
+def _is_numeric(dtype):
+    return getattr(dtype, "kind", "O") in "iuf"
+
+
+def _values(series):
+    """
+    values of a series as a (cupy or numpy) array with nulls replaced by
+    zeros, along with the boolean validity array
+    """
+    valid = series.notna().values
+    values = series.fillna(0).values
+    xp = cp.get_array_module(values)
+    return xp.asarray(values), xp.asarray(valid), xp
+
+
+def _to_host(arr):
+    return cp.asnumpy(arr) if cp.get_array_module(arr) is not np else arr
+
+
+def chart_aggregates(chart):
+    """
+    column -> aggregate function of an aggregate chart, None for histograms
+    which only count rows
+    """
+    if hasattr(chart, "aggregate_dict"):
+        return dict(chart.aggregate_dict)
+    if chart.y is None:
+        return None
+    return {chart.y: chart.aggregate_fn}
+
+
+def is_tile_chart(chart, data):
+    """
+    whether the result of an aggregate chart can be computed from data tiles
+    """
+    if not (
+        getattr(chart, "use_data_tiles", False)
+        and hasattr(chart, "update_source")
+        and chart.x in data.columns
+        and _is_numeric(data[chart.x].dtype)
+    ):
+        return False
+    aggregates = chart_aggregates(chart) or {}
+    return all(
+        col != chart.x
+        and col in data.columns
+        and fn in TILE_AGGREGATES
+        and _is_numeric(data[col].dtype)
+        for col, fn in aggregates.items()
+    )
+
+
+class _Binning:
+    """
+    Maps the x column of an aggregate chart to dense bin codes, matching the
+    bins the chart itself displays: the ``stride`` grid for histograms with
+    custom binning, the sorted unique values of x otherwise.
+    """
+
+    def __init__(self, chart):
+        self.x = chart.x
+        self.stride = None
+        self.labels = None
+        if (
+            chart.y is None
+            and getattr(chart, "custom_binning", False)
+            and chart.stride
+        ):
+            self.stride = chart.stride
+            self.min_value = chart.min_value
+            self.labels = (
+                np.arange(chart.n_bins) * self.stride + self.min_value
+            )
+
+    @property
+    def size(self):
+        return len(self.labels)
+
+    def codes(self, values, xp):
+        if self.stride is not None:
+            codes = xp.rint((values - self.min_value) / self.stride)
+            return xp.clip(codes.astype("int64"), 0, self.size - 1)
+        return xp.searchsorted(xp.asarray(self.labels), values)
+
+
+def _bin_sums(codes, size, values=None, valid=None):
+    """
+    per bin row counts, or per bin sums and non-null counts of values
+    """
+    xp = cp.get_array_module(codes)
+    if values is None:
+        return [xp.bincount(codes, minlength=size)]
+    codes, values = codes[valid], values[valid]
+    return [
+        xp.bincount(codes, weights=values, minlength=size),
+        xp.bincount(codes, minlength=size),
+    ]
+
+
+def _map_partitions(data, func, *args):
+    """
+    apply func to every in-memory partition of data, returns the list of
+    the results
+    """
+    if isinstance(data, dask_cudf.DataFrame):
+        return list(
+            dask.compute(
+                *[
+                    dask.delayed(func)(part, *args)
+                    for part in data.to_delayed()
+                ]
+            )
+        )
+    return [func(data, *args)]
+
+
+def _sum_tables(parts):
+    return [sum(tables) for tables in zip(*parts)]
+
+
+def _n_tables(aggregates):
+    # row counts, then sums and non-null counts for each aggregate column
+    return 1 + 2 * len(aggregates or {})
+
+
+def _ranges(starts, ends):
+    """
+    concatenation of the integer ranges [starts[i], ends[i])
+    """
+    lengths = ends - starts
+    offsets = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(lengths.sum()) + offsets
+
+
+def unique_labels(data, binnings):
+    """
+    set the labels of value binned charts to the sorted unique values of
+    their x column
+    """
+    binnings = [b for b in binnings if b.labels is None]
+    uniques = [data[b.x].dropna().drop_duplicates() for b in binnings]
+    if isinstance(data, dask_cudf.DataFrame):
+        uniques = dask.compute(*uniques)
+    for binning, unique in zip(binnings, uniques):
+        binning.labels = _to_host(unique.sort_values().values)
+
+
+def chart_result(chart, binning, aggregates, tables, frame_cls, dtypes):
+    """
+    chart result from per bin tables, in the format of the chart's own
+    calculate_source
+    """
+    rows = tables[0]
+    if aggregates is None and binning.stride is not None:
+        # dense histogram, see calc_dense_histogram
+        return (binning.labels, rows.astype("int64"))
+    keep = rows > 0
+    labels = binning.labels[keep]
+    if aggregates is None:
+        return (labels, rows[keep].astype("int64"))
+    columns = {chart.x: labels}
+    for i, (col, fn) in enumerate(aggregates.items()):
+        sums, counts = tables[1 + 2 * i][keep], tables[2 + 2 * i][keep]
+        if fn == "count":
+            values = counts.astype("int64")
+        elif fn == "sum":
+            values = sums
+            if dtypes[col].kind in "iu":
+                values = values.round().astype(dtypes[col])
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                values = sums / counts
+        columns[col] = values
+    return frame_cls(columns)
+
+
+class _PrefixSumTiles:
+    """
+    Tiles of a 1D aggregate chart: (active bins x passive bins) tables of
+    every passive chart, stored as prefix sums along the active axis.
+
+    A range selection is answered with two lookups per table for the bins
+    strictly between the bins of its bounds, whose rows are all inside the
+    range since the bin codes are monotonic in x, plus an exact pass over
+    the rows of the two boundary bins, which are kept sorted by bin for
+    that purpose.
+    """
+
+    def __init__(self, chart):
+        self.binning = _Binning(chart)
+        self.aggregates = chart_aggregates(chart)
+
+    @staticmethod
+    def supports(chart, data):
+        return is_tile_chart(chart, data)
+
+    @property
+    def binnings(self):
+        return [self.binning]
+
+    @property
+    def size(self):
+        return self.binning.size
+
+    def _partition(self, df, passives):
+        """
+        per bin aggregates of the active chart, and (active bins x passive
+        bins) aggregates of every passive chart, for a single in-memory
+        dataframe, along with its rows sorted by active bin
+        """
+        x_a, valid_a, xp = _values(df[self.binning.x])
+        codes_a = self.binning.codes(x_a, xp)
+        n_a = self.size
+        result = _bin_sums(codes_a[valid_a], n_a)
+
+        codes_v = codes_a[valid_a]
+        order = xp.argsort(codes_v)
+        rows = {
+            "offsets": _to_host(
+                xp.searchsorted(codes_v[order], xp.arange(n_a + 1))
+            ),
+            "x": x_a[valid_a][order],
+            "codes": codes_v[order],
+            "columns": [],
+            "passives": [],
+        }
+        for col in self.aggregates or {}:
+            values, valid, _ = _values(df[col])
+            result.extend(
+                _bin_sums(
+                    codes_a[valid_a], n_a, values[valid_a], valid[valid_a]
+                )
+            )
+            rows["columns"].append(
+                (values[valid_a][order], valid[valid_a][order])
+            )
+
+        for passive in passives:
+            binning = passive["binning"]
+            x_p, valid_p, _ = _values(df[binning.x])
+            valid = valid_a & valid_p
+            size = n_a * binning.size
+            codes = codes_a[valid] * binning.size + binning.codes(
+                x_p[valid], xp
+            )
+            result.extend(_bin_sums(codes, size))
+            columns = []
+            for col in passive["aggregates"] or {}:
+                values, valid_col, _ = _values(df[col])
+                result.extend(
+                    _bin_sums(codes, size, values[valid], valid_col[valid])
+                )
+                columns.append(
+                    (values[valid_a][order], valid_col[valid_a][order])
+                )
+            codes_p = xp.where(valid_p, binning.codes(x_p, xp), -1)
+            rows["passives"].append((codes_p[valid_a][order], columns))
+        return [_to_host(arr) for arr in result], rows
+
+    def build(self, data, passives):
+        parts = _map_partitions(data, self._partition, passives)
+        self.sorted_rows = [rows for _, rows in parts]
+        arrays = iter(_sum_tables([tables for tables, _ in parts]))
+        self.tables = [next(arrays) for _ in range(_n_tables(self.aggregates))]
+        self.passives = passives
+        for passive in passives:
+            shape = (self.size, passive["binning"].size)
+            # prefix sums along the active axis, with a leading zero row
+            passive["tables"] = [
+                np.concatenate(
+                    [
+                        np.zeros((1, shape[1])),
+                        next(arrays).reshape(shape).cumsum(axis=0),
+                    ]
+                )
+                for _ in range(_n_tables(passive["aggregates"]))
+            ]
+
+    def _select_range(self, low, high):
+        """
+        inner bins and exact boundary bin aggregates of a range selection
+        """
+        active = [np.zeros(self.size) for _ in self.tables]
+        edges = [
+            [np.zeros(p["binning"].size) for _ in p["tables"]]
+            for p in self.passives
+        ]
+        selection = {
+            "inner": slice(0, 0),
+            "rows": 0,
+            "active": active,
+            "edges": {
+                p["name"]: edge for p, edge in zip(self.passives, edges)
+            },
+        }
+        if high < low:
+            return selection
+        bins = self.binning.codes(np.asarray([low, high]), np)
+        selection["inner"] = slice(bins[0] + 1, max(bins[0] + 1, bins[1]))
+        # values above the last label have no bin, and no rows
+        boundary = np.unique(bins[bins < self.size])
+
+        # exact pass over the rows of the boundary bins
+        for sorted_rows in self.sorted_rows:
+            offsets = sorted_rows["offsets"]
+            idx = _ranges(offsets[boundary], offsets[boundary + 1])
+            if len(idx) == 0:
+                continue
+            xp = cp.get_array_module(sorted_rows["x"])
+            idx = xp.asarray(idx)
+            x = sorted_rows["x"][idx]
+            inside = (x >= low) & (x <= high)
+            selection["rows"] += int(inside.sum())
+            codes = sorted_rows["codes"][idx][inside]
+            arrays = _bin_sums(codes, self.size)
+            for values, valid in sorted_rows["columns"]:
+                arrays.extend(
+                    _bin_sums(
+                        codes,
+                        self.size,
+                        values[idx][inside],
+                        valid[idx][inside],
+                    )
+                )
+            for table, arr in zip(active, arrays):
+                table += _to_host(arr)
+            for passive, edge, (codes, columns) in zip(
+                self.passives, edges, sorted_rows["passives"]
+            ):
+                codes = codes[idx]
+                keep = inside & (codes >= 0)
+                size = passive["binning"].size
+                arrays = _bin_sums(codes[keep], size)
+                for values, valid in columns:
+                    arrays.extend(
+                        _bin_sums(
+                            codes[keep],
+                            size,
+                            values[idx][keep],
+                            valid[idx][keep],
+                        )
+                    )
+                for table, arr in zip(edge, arrays):
+                    table += _to_host(arr)
+        return selection
+
+    def select(self, chart):
+        """
+        active bins selected by the chart, as a dict of the inner bins and
+        exact boundary aggregates for a range selection, or an array of bin
+        indices for a value selection, None if the selection cannot be
+        served from the tiles
+        """
+        labels = self.binning.labels
+        box_selected_range = getattr(chart, "box_selected_range", None)
+        if box_selected_range:
+            return self._select_range(
+                box_selected_range[chart.x + "_min"],
+                box_selected_range[chart.x + "_max"],
+            )
+        values = getattr(chart, "selected_values", None)
+        if values:
+            values = np.asarray(values, dtype=labels.dtype)
+            idx = np.clip(np.searchsorted(labels, values), 0, len(labels) - 1)
+            return np.unique(idx[labels[idx] == values])
+        return None
+
+    def rows(self, selection):
+        if isinstance(selection, dict):
+            return (
+                int(self.tables[0][selection["inner"]].sum())
+                + selection["rows"]
+            )
+        return int(self.tables[0][selection].sum())
+
+    def active_tables(self, selection):
+        if isinstance(selection, dict):
+            tables = []
+            for table, edge in zip(self.tables, selection["active"]):
+                selected = np.zeros_like(table)
+                selected[selection["inner"]] = table[selection["inner"]]
+                tables.append(selected + edge)
+            return tables
+        tables = []
+        for table in self.tables:
+            selected = np.zeros_like(table)
+            selected[selection] = table[selection]
+            tables.append(selected)
+        return tables
+
+    def passive_tables(self, passive, selection):
+        if isinstance(selection, dict):
+            inner = selection["inner"]
+            return [
+                table[inner.stop] - table[inner.start] + edge
+                for table, edge in zip(
+                    passive["tables"], selection["edges"][passive["name"]]
+                )
+            ]
+        return [
+            (table[selection + 1] - table[selection]).sum(axis=0)
+            for table in passive["tables"]
+        ]
+
+
+class _SummedAreaTiles:
+    """
+    Tiles of a 2D (scatter, heatmap) chart: the x/y plane is divided into a
+    grid, and every passive chart gets a (grid cells x passive bins) table,
+    stored as summed-area tables over the grid.
+
+    A box selection is answered with four lookups per table for the grid
+    cells fully inside the box, plus an exact pass over the rows of the
+    boundary cells, which are kept sorted by cell for that purpose.
+    """
+
+    def __init__(self, chart, grid_size=SUMMED_AREA_GRID_SIZE):
+        self.x, self.y = chart.x, chart.y
+        self.shape = (grid_size, grid_size)
+
+    @staticmethod
+    def supports(chart, data):
+        return (
+            getattr(chart, "use_data_tiles", False)
+            and not hasattr(chart, "update_source")
+            and chart.x in data.columns
+            and chart.y in data.columns
+            and _is_numeric(data[chart.x].dtype)
+            and _is_numeric(data[chart.y].dtype)
+        )
+
+    @property
+    def binnings(self):
+        return []
+
+    @property
+    def size(self):
+        return self.shape[0] * self.shape[1]
+
+    def _cells(self, x, y, xp):
+        """
+        grid cell of every (x, y) point, computed in float64 so that the
+        cells are monotonic in x and y
+        """
+        cells = []
+        for values, start, step, n in zip(
+            (x, y), self.start, self.step, self.shape
+        ):
+            codes = xp.floor((values.astype("float64") - start) / step)
+            cells.append(xp.clip(codes.astype("int64"), 0, n - 1))
+        return cells[0] * self.shape[1] + cells[1]
+
+    def _partition(self, df, passives):
+        """
+        grid cell row counts and (grid cells x passive bins) aggregates of
+        every passive chart for a single in-memory dataframe, along with its
+        rows sorted by grid cell
+        """
+        x, valid_x, xp = _values(df[self.x])
+        y, valid_y, _ = _values(df[self.y])
+        valid = valid_x & valid_y
+        x, y = x[valid], y[valid]
+        cells = self._cells(x, y, xp)
+        result = _bin_sums(cells, self.size)
+
+        order = xp.argsort(cells)
+        rows = {
+            "offsets": _to_host(
+                xp.searchsorted(cells[order], xp.arange(self.size + 1))
+            ),
+            "x": x[order],
+            "y": y[order],
+            "passives": [],
+        }
+        for passive in passives:
+            binning = passive["binning"]
+            x_p, valid_p, _ = _values(df[binning.x])
+            x_p, valid_p = x_p[valid], valid_p[valid]
+            codes = xp.where(valid_p, binning.codes(x_p, xp), -1)
+            size = self.size * binning.size
+            flat = cells[valid_p] * binning.size + codes[valid_p]
+            result.extend(_bin_sums(flat, size))
+            columns = []
+            for col in passive["aggregates"] or {}:
+                values, valid_col = [
+                    arr[valid] for arr in _values(df[col])[:2]
+                ]
+                result.extend(
+                    _bin_sums(flat, size, values[valid_p], valid_col[valid_p])
+                )
+                columns.append((values[order], valid_col[order]))
+            rows["passives"].append((codes[order], columns))
+        return [_to_host(arr) for arr in result], rows
+
+    def build(self, data, passives):
+        bounds = [
+            data[self.x].min(),
+            data[self.x].max(),
+            data[self.y].min(),
+            data[self.y].max(),
+        ]
+        if isinstance(data, dask_cudf.DataFrame):
+            bounds = dask.compute(*bounds)
+        bounds = [float(bound) for bound in bounds]
+        self.start = (bounds[0], bounds[2])
+        self.end = (bounds[1], bounds[3])
+        self.step = tuple(
+            (end - start) / n or 1.0
+            for start, end, n in zip(self.start, self.end, self.shape)
+        )
+
+        parts = _map_partitions(data, self._partition, passives)
+        self.sorted_rows = [rows for _, rows in parts]
+        arrays = iter(_sum_tables([tables for tables, _ in parts]))
+        self.row_table = _summed_area(next(arrays).reshape(self.shape))
+        self.passives = passives
+        for passive in passives:
+            shape = self.shape + (passive["binning"].size,)
+            passive["tables"] = [
+                _summed_area(next(arrays).reshape(shape))
+                for _ in range(_n_tables(passive["aggregates"]))
+            ]
+
+    def _axis_cells(self, axis, lo, hi):
+        """
+        ranges of the cells along an axis that are fully inside [lo, hi],
+        and that intersect it
+        """
+        start, end = self.start[axis], self.end[axis]
+        step, n = self.step[axis], self.shape[axis]
+        if hi < lo or hi < start or lo > end:
+            return (0, 0), (0, 0)
+        a, b = (lo - start) / step, (hi - start) / step
+        touched = (
+            int(np.clip(np.floor(a), 0, n)),
+            int(np.clip(np.floor(b) + 1, 0, n)),
+        )
+        i0 = 0 if lo <= start else int(np.floor(a)) + 1
+        i1 = n if hi >= end else int(np.ceil(b)) - 1
+        i0, i1 = int(np.clip(i0, 0, n)), int(np.clip(i1, 0, n))
+        return (i0, max(i0, i1)), touched
+
+    def select(self, chart):
+        """
+        interior cells and exact boundary aggregates of the chart's box
+        selection, None if the selection cannot be served from the tiles
+        """
+        box = getattr(chart, "box_selected_range", None)
+        if not box:
+            return None
+        x_range = (box[self.x + "_min"], box[self.x + "_max"])
+        y_range = (box[self.y + "_min"], box[self.y + "_max"])
+        inner_x, touched_x = self._axis_cells(0, *x_range)
+        inner_y, touched_y = self._axis_cells(1, *y_range)
+
+        boundary = np.zeros(self.shape, dtype="bool")
+        boundary[slice(*touched_x), slice(*touched_y)] = True
+        boundary[slice(*inner_x), slice(*inner_y)] = False
+        boundary = np.flatnonzero(boundary)
+
+        # exact pass over the rows of the boundary cells
+        rows = 0
+        edges = [
+            [np.zeros(p["binning"].size) for _ in p["tables"]]
+            for p in self.passives
+        ]
+        for sorted_rows in self.sorted_rows:
+            offsets = sorted_rows["offsets"]
+            idx = _ranges(offsets[boundary], offsets[boundary + 1])
+            if len(idx) == 0:
+                continue
+            xp = cp.get_array_module(sorted_rows["x"])
+            idx = xp.asarray(idx)
+            x, y = sorted_rows["x"][idx], sorted_rows["y"][idx]
+            inside = (
+                (x >= x_range[0])
+                & (x <= x_range[1])
+                & (y >= y_range[0])
+                & (y <= y_range[1])
+            )
+            rows += int(inside.sum())
+            for passive, edge, (codes, columns) in zip(
+                self.passives, edges, sorted_rows["passives"]
+            ):
+                codes = codes[idx]
+                keep = inside & (codes >= 0)
+                size = passive["binning"].size
+                arrays = _bin_sums(codes[keep], size)
+                for values, valid in columns:
+                    arrays.extend(
+                        _bin_sums(
+                            codes[keep],
+                            size,
+                            values[idx][keep],
+                            valid[idx][keep],
+                        )
+                    )
+                for table, arr in zip(edge, arrays):
+                    table += _to_host(arr)
+
+        return {
+            "inner": (inner_x, inner_y),
+            "rows": rows,
+            "edges": {
+                p["name"]: edge for p, edge in zip(self.passives, edges)
+            },
+        }
+
+    def rows(self, selection):
+        return int(
+            _rect_sum(self.row_table, selection["inner"]) + selection["rows"]
+        )
+
+    def active_tables(self, selection):
+        return None
+
+    def passive_tables(self, passive, selection):
+        return [
+            _rect_sum(table, selection["inner"]) + edge
+            for table, edge in zip(
+                passive["tables"], selection["edges"][passive["name"]]
+            )
+        ]
+
+
+def _summed_area(table):
+    """
+    summed-area table over the first two axes, with leading zero rows and
+    columns
+    """
+    pad = [(1, 0), (1, 0)] + [(0, 0)] * (table.ndim - 2)
+    return np.pad(table.cumsum(axis=0).cumsum(axis=1), pad)
+
+
+def _rect_sum(table, rect):
+    """
+    sum of the cells [i0, i1) x [j0, j1) of a summed-area table
+    """
+    (i0, i1), (j0, j1) = rect
+    return table[i1, j1] - table[i0, j1] - table[i1, j0] + table[i0, j0]
+
+
+class DataTiles:
+    """
+    Falcon style data tiles for the interactions of a single active chart.
+
+    When the user starts interacting with a chart that uses data tiles (the
+    active chart), the rows passing every other filter are binned once into
+    tables of counts and sums, for every other aggregate chart (the passive
+    charts), binned by the active chart bins and the passive chart bins.
+    Every later selection on the active chart then computes the passive
+    chart results from those tables in O(bins), without scanning the rows
+    again:
+
+    - aggregate charts (histogram, bar, choropleth) use (active bins x
+      passive bins) prefix sums, with an exact pass over the boundary bins
+      of a range
+    - scatter and heatmap charts use (grid cells x passive bins)
+      summed-area tables, with an exact pass over the boundary cells
+
+    Tiles are only valid as long as the filters of the other charts are
+    unchanged, which is tracked with the crossfilter state.
+    """
+
+    def __init__(self, max_cells=MAX_TILE_CELLS):
+        self.max_cells = max_cells
+        self.clear()
+
+    def clear(self):
+        self.chart = None
+        self.state = None
+        self._tiles = None
+        self._passives = {}
+        self._selection = None
+
+    def is_valid(self, chart, state):
+        return (
+            self.chart is chart
+            and self.state == state
+            and self._tiles is not None
+        )
+
+    def build(self, chart, charts, data, state):
+        """
+        Build the data tiles of the active chart.
+
+        Parameters
+        ----------
+        chart: active chart
+        charts: iterable of all the dashboard charts
+        data: source dataframe filtered by all filters except the active
+            chart's own
+        state: crossfilter state of those filters
+        """
+        self.clear()
+        tiles_cls = next(
+            (
+                cls
+                for cls in (_PrefixSumTiles, _SummedAreaTiles)
+                if cls.supports(chart, data)
+            ),
+            None,
+        )
+        if tiles_cls is None or len(data) == 0:
+            return
+        tiles = tiles_cls(chart)
+        passives = {
+            c.name: {
+                "name": c.name,
+                "binning": _Binning(c),
+                "aggregates": chart_aggregates(c),
+            }
+            for c in charts
+            if c is not chart and is_tile_chart(c, data)
+        }
+        unique_labels(
+            data,
+            tiles.binnings + [p["binning"] for p in passives.values()],
+        )
+        if tiles.size == 0:
+            return
+        passives = {
+            name: p
+            for name, p in passives.items()
+            if 0 < tiles.size * p["binning"].size <= self.max_cells
+        }
+        tiles.build(data, list(passives.values()))
+
+        self.chart = chart
+        self.state = state
+        self._tiles = tiles
+        self._passives = passives
+        self._frame_cls = (
+            pd.DataFrame if isinstance(data, pd.DataFrame) else cudf.DataFrame
+        )
+        self._dtypes = {col: data[col].dtype for col in data.columns}
+
+    def _result(self, chart, binning, aggregates, tables):
+        return chart_result(
+            chart, binning, aggregates, tables, self._frame_cls, self._dtypes
+        )
+
+    def serves(self, name, state):
+        """
+        whether the current selection of the named chart can be served from
+        the tiles, in which case it is resolved for source
+        """
+        self._selection = None
+        if (
+            self.chart is not None
+            and self.chart.name == name
+            and self.state == state
+        ):
+            self._selection = self._tiles.select(self.chart)
+        return self._selection is not None
+
+    def source(self, chart):
+        """
+        result of a chart computed from the tiles for the selection resolved
+        by serves, None if the chart cannot be served from the tiles
+        """
+        selection = self._selection
+        if getattr(chart, "is_datasize_indicator", False):
+            return self._tiles.rows(selection)
+        if chart is self.chart:
+            tables = self._tiles.active_tables(selection)
+            if tables is None:
+                return None
+            tiles = self._tiles
+            return self._result(chart, tiles.binning, tiles.aggregates, tables)
+        if chart.name not in self._passives:
+            return None
+        passive = self._passives[chart.name]
+        return self._result(
+            chart,
+            passive["binning"],
+            passive["aggregates"],
+            self._tiles.passive_tables(passive, selection),
+        )
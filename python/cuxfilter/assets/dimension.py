@@ -0,0 +1,313 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import namedtuple
+
+import cudf
+import cupy as cp
+import dask_cudf
+import numpy as np
+import pandas as pd
+
+from .data_tiles import (
+    _Binning,
+    _bin_sums,
+    _to_host,
+    _values,
+    chart_aggregates,
+    chart_result,
+    is_tile_chart,
+    unique_labels,
+)
+
+DIMENSION_KINDS = "iufM"
+# the DeltaAggregates tables are rebuilt from the filtered data after that
+# many updates, or once the moved rows add up to that fraction of the
+# selected rows
+DELTA_REBUILD_UPDATES = 64
+DELTA_REBUILD_FRACTION = 1.0
+
+# rows that entered and left a range filter in its last update, and the
+# crossfilter state before that update
+Delta = namedtuple("Delta", ["state", "entered", "left"])
+
+
+def supports_dimension(series):
+    """
+    whether a sorted Dimension index can be built for an in-memory series
+    """
+    return not isinstance(series, dask_cudf.Series) and (
+        getattr(series.dtype, "kind", "O") in DIMENSION_KINDS
+    )
+
+
+def supports_group_index(series):
+    """
+    whether a GroupIndex can be built for an in-memory series
+    """
+    return not isinstance(series, dask_cudf.Series)
+
+
+def _interval_difference(a, b):
+    """
+    [start, end) intervals of the positions in interval a but not in b
+    """
+    return [
+        (start, end)
+        for start, end in ((a[0], min(a[1], b[0])), (max(a[0], b[1]), a[1]))
+        if start < end
+    ]
+
+
+class Dimension:
+    """
+    Sorted index of a dataframe column, the crossfilter.js Dimension.
+
+    The row positions of the non-null values are kept sorted by value, so
+    the rows of a ``low <= column <= high`` range are found with two binary
+    searches, as a contiguous slice of ``order``. Moving a range only
+    touches the rows between the old and the new bounds.
+
+    Works for numeric and datetime columns of cudf and pandas dataframes.
+    """
+
+    def __init__(self, series):
+        valid = series.notna()
+        values = series[valid]
+        if values.dtype.kind == "M":
+            values = values.astype("int64")
+        if isinstance(series, pd.Series):
+            dtype = getattr(values.dtype, "numpy_dtype", None)
+            positions = np.flatnonzero(valid.to_numpy())
+            values = values.to_numpy(dtype=dtype)
+        else:
+            positions = cp.flatnonzero(valid.values)
+            values = values.values
+        xp = cp.get_array_module(values)
+        sort = xp.argsort(values, kind="stable")
+        index_dtype = "int32" if len(series) < 2**31 else "int64"
+        self.order = positions[sort].astype(index_dtype)
+        self.values = values[sort]
+        self.size = len(series)
+        self.dtype = series.dtype
+        self._xp = xp
+
+    def bounds(self, low, high):
+        """
+        [start, end) positions in ``order`` of the rows in the range
+        """
+        edges = np.array([low, high])
+        if self.dtype.kind == "M":
+            edges = np.array([low, high], dtype=self.dtype).view("int64")
+        edges = self._xp.asarray(edges)
+        start = int(self._xp.searchsorted(self.values, edges[0], "left"))
+        end = int(self._xp.searchsorted(self.values, edges[1], "right"))
+        return (start, max(start, end))
+
+    def rows(self, intervals):
+        """
+        row positions of the [start, end) intervals of ``order``
+        """
+        if len(intervals) == 0:
+            return self.order[:0]
+        return self._xp.concatenate(
+            [self.order[start:end] for start, end in intervals]
+        )
+
+    def mask(self, bounds):
+        """
+        boolean array of the rows in the bounds
+        """
+        mask = self._xp.zeros(self.size, dtype="bool")
+        mask[self.order[bounds[0] : bounds[1]]] = True
+        return mask
+
+    def delta(self, old, new):
+        """
+        row positions that enter and leave the range going from the old to
+        the new bounds
+        """
+        return (
+            self.rows(_interval_difference(new, old)),
+            self.rows(_interval_difference(old, new)),
+        )
+
+
+class GroupIndex:
+    """
+    Grouped index of a discrete dataframe column.
+
+    The row positions of the non-null values are sorted by value, with an
+    offsets table giving the ``[start, end)`` slice of each distinct value,
+    so the rows equal to a value, or to any of a set of values, are found
+    without scanning the column.
+
+    Works for numeric, datetime, boolean and string columns of cudf and
+    pandas dataframes.
+    """
+
+    def __init__(self, series):
+        valid = series.notna()
+        codes, self.keys = series[valid].factorize(sort=True)
+        if isinstance(series, pd.Series):
+            positions = np.flatnonzero(valid.to_numpy())
+        else:
+            positions = cp.flatnonzero(valid.values)
+        xp = cp.get_array_module(codes)
+        index_dtype = "int32" if len(series) < 2**31 else "int64"
+        self.order = positions[xp.argsort(codes, kind="stable")].astype(
+            index_dtype
+        )
+        # offsets are looked up per selected value, keep them on the host
+        self.offsets = np.zeros(len(self.keys) + 1, dtype="int64")
+        np.cumsum(
+            _to_host(xp.bincount(codes, minlength=len(self.keys))),
+            out=self.offsets[1:],
+        )
+        self.size = len(series)
+        self._xp = xp
+
+    def rows(self, values):
+        """
+        sorted row positions of the rows equal to any of the values
+        """
+        groups = _to_host(self.keys.get_indexer(list(values)))
+        groups = np.unique(groups[groups >= 0])
+        if len(groups) == 0:
+            return self.order[:0]
+        rows = self._xp.concatenate(
+            [self.order[self.offsets[i] : self.offsets[i + 1]] for i in groups]
+        )
+        # rows of a single value are already sorted, the sort is stable
+        return rows if len(groups) == 1 else self._xp.sort(rows)
+
+
+class DeltaAggregates:
+    """
+    Per bin tables of the tile charts (see ``cuxfilter.assets.data_tiles``)
+    and the number of selected rows, for the current filter state.
+
+    When a range filter backed by a Dimension moves, the tables are updated
+    from the rows that entered or left the selection only, the
+    crossfilter.js reduceAdd / reduceRemove, instead of being recomputed
+    from the filtered data. A small brush nudge costs in proportion to the
+    rows it moves.
+
+    The tables are only valid for the crossfilter ``state`` they were built
+    or last updated for. Float sums accumulate rounding errors as rows are
+    added and removed, so the updates are refused (and the tables rebuilt
+    from the filtered data by the dashboard) after
+    ``DELTA_REBUILD_UPDATES`` updates, or once the moved rows add up to
+    ``DELTA_REBUILD_FRACTION`` of the selected rows.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.state = None
+        self.rows = 0
+        self._charts = {}
+        self._updates = 0
+        self._moved = 0
+
+    def build(self, charts, data, filtered, state):
+        """
+        Build the tables of the charts.
+
+        Parameters
+        ----------
+        charts: iterable of the dashboard charts
+        data: unfiltered source dataframe
+        filtered: source dataframe filtered by all the active filters
+        state: crossfilter state of the filters
+        """
+        self.clear()
+        if isinstance(data, dask_cudf.DataFrame):
+            return
+        charts = [chart for chart in charts if is_tile_chart(chart, data)]
+        binnings = [_Binning(chart) for chart in charts]
+        unique_labels(data, binnings)
+        for chart, binning in zip(charts, binnings):
+            aggregates = chart_aggregates(chart)
+            self._charts[chart.name] = (
+                binning,
+                aggregates,
+                self._tables(filtered, binning, aggregates),
+            )
+        self.rows = len(filtered)
+        self.state = state
+        self._frame_cls = (
+            pd.DataFrame if isinstance(data, pd.DataFrame) else cudf.DataFrame
+        )
+        self._dtypes = {col: data[col].dtype for col in data.columns}
+
+    def _tables(self, df, binning, aggregates):
+        x, valid, xp = _values(df[binning.x])
+        codes = binning.codes(x[valid], xp)
+        tables = _bin_sums(codes, binning.size)
+        for col in aggregates or {}:
+            values, valid_col, _ = _values(df[col])
+            tables.extend(
+                _bin_sums(codes, binning.size, values[valid], valid_col[valid])
+            )
+        return [_to_host(table) for table in tables]
+
+    def _gather(self, data, rows):
+        columns = {
+            col
+            for binning, aggregates, _ in self._charts.values()
+            for col in [binning.x, *(aggregates or {})]
+        }
+        return {col: data[col].iloc[rows] for col in columns}
+
+    def update(self, crossfilter, name):
+        """
+        Update the tables from the rows that entered or left the selection
+        in the last update of the named range filter, returns False if the
+        tables cannot be updated that way.
+        """
+        delta = crossfilter.delta(name)
+        if self.state is None or delta is None or delta.state != self.state:
+            return False
+        # the rows only enter or leave the selection if they pass the
+        # other filters
+        entered = delta.entered[crossfilter.contains(delta.entered, [name])]
+        left = delta.left[crossfilter.contains(delta.left, [name])]
+        moved = self._moved + len(entered) + len(left)
+        if (
+            self._updates >= DELTA_REBUILD_UPDATES
+            or moved > DELTA_REBUILD_FRACTION * max(self.rows, 1)
+        ):
+            return False
+        added = self._gather(crossfilter.data, entered)
+        removed = self._gather(crossfilter.data, left)
+        for chart_name, (binning, aggregates, tables) in self._charts.items():
+            tables = [
+                table + add - remove
+                for table, add, remove in zip(
+                    tables,
+                    self._tables(added, binning, aggregates),
+                    self._tables(removed, binning, aggregates),
+                )
+            ]
+            self._charts[chart_name] = (binning, aggregates, tables)
+        self.rows += len(entered) - len(left)
+        self.state = crossfilter.state()
+        self._updates += 1
+        self._moved = moved
+        return True
+
+    def source(self, chart):
+        """
+        result of a chart computed from the tables, in the format of its
+        calculate_source, None if the chart has no tables
+        """
+        if getattr(chart, "is_datasize_indicator", False):
+            return self.rows if self.state is not None else None
+        if chart.name not in self._charts:
+            return None
+        binning, aggregates, tables = self._charts[chart.name]
+        return chart_result(
+            chart, binning, aggregates, tables, self._frame_cls, self._dtypes
+        )
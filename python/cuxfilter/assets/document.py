@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+
+import panel as pn
+from bokeh.protocol.messages.patch_doc import patch_doc
+
+UPDATE_STATS_SIZE = 100
+
+UpdateStats = namedtuple("UpdateStats", ["events", "messages", "nbytes"])
+
+# documents whose outgoing PATCH-DOC messages are recorded, and the lists
+# they are recorded in
+_recorders = {}
+_recorders_lock = threading.Lock()
+_create_patch_doc = patch_doc.create
+
+
+def _record_patch_doc(events, **metadata):
+    msg = _create_patch_doc(events, **metadata)
+    messages = _recorders.get(events[0].document)
+    if messages is not None:
+        messages.append((len(events), _message_nbytes(msg)))
+    return msg
+
+
+def _message_nbytes(msg):
+    """
+    size in bytes of a message sent to the browser
+    """
+    return (
+        len(msg.header_json)
+        + len(msg.metadata_json)
+        + len(msg.content_json)
+        + sum(len(buffer.to_bytes()) for buffer in msg.buffers)
+    )
+
+
+@contextmanager
+def _recorded_messages(doc):
+    """
+    Record the number of events and the size of the PATCH-DOC messages
+    created for the changes of doc in the context body, by the bokeh
+    session or by panel, for every connection to the session.
+    """
+    messages = []
+    with _recorders_lock:
+        if not _recorders:
+            patch_doc.create = staticmethod(_record_patch_doc)
+        _recorders[doc] = messages
+    try:
+        yield messages
+    finally:
+        with _recorders_lock:
+            del _recorders[doc]
+            if not _recorders:
+                patch_doc.create = _create_patch_doc
+
+
+@contextmanager
+def held_updates(stats=None):
+    """
+    Hold the bokeh model changes made in the context body on the document
+    of the current server session, and send them to the browser as a
+    single combined PATCH-DOC message when the context exits, instead of
+    one message per change.
+
+    Parameters
+    ----------
+    stats: list
+        if given, an UpdateStats with the number of document change
+        events, the number of messages they were sent in and the total
+        size of these messages in bytes is appended to it, from the
+        messages created when the changes are released. Outside of a
+        server session (notebook comms push their own updates), nothing is
+        held nor recorded.
+    """
+    doc = pn.state.curdoc
+    if doc is None or doc.session_context is None:
+        yield
+        return
+    if stats is None:
+        with pn.io.hold(doc):
+            yield
+        return
+    with _recorded_messages(doc) as messages:
+        with pn.io.hold(doc):
+            yield
+    stats.append(
+        UpdateStats(
+            events=sum(events for events, _ in messages),
+            messages=len(messages),
+            nbytes=sum(nbytes for _, nbytes in messages),
+        )
+    )
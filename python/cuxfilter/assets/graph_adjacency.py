@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import cudf
+import cupy as cp
+import dask_cudf
+import pandas as pd
+
+
+def supports_graph_adjacency(nodes, edges):
+    """
+    whether a GraphAdjacency can be built for in-memory nodes and edges
+    """
+    return not isinstance(nodes, dask_cudf.DataFrame) and not isinstance(
+        edges, dask_cudf.DataFrame
+    )
+
+
+def _values(series):
+    if isinstance(series, pd.Series):
+        return series.to_numpy()
+    return series.values
+
+
+def _csr(keys, size, xp):
+    """
+    offsets and edge positions of a compressed sparse row index of the edges
+    by node row, edges with a key of -1 are left out
+    """
+    edge_ids = xp.flatnonzero(keys >= 0)
+    keys = keys[edge_ids]
+    edges = edge_ids[xp.argsort(keys, kind="stable")]
+    offsets = xp.zeros(size + 1, dtype="int64")
+    offsets[1:] = xp.cumsum(xp.bincount(keys, minlength=size))
+    return offsets, edges
+
+
+def _gather(offsets, values, rows, xp):
+    """
+    concatenated ``values[offsets[row]:offsets[row + 1]]`` slices of the
+    rows
+    """
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    ends = xp.cumsum(lengths)
+    total = int(ends[-1]) if len(rows) > 0 else 0
+    positions = xp.arange(total)
+    # slice of each output position, and the position in the slice
+    slices = xp.searchsorted(ends, positions, side="right")
+    offsets_in_slice = positions - (ends[slices] - lengths[slices])
+    return values[starts[slices] + offsets_in_slice]
+
+
+class GraphAdjacency:
+    """
+    Compressed sparse row adjacency of a graph, by node row.
+
+    The edges are indexed twice, by the node row of their source
+    (``out_offsets``, ``out_edges``) and of their target (``in_offsets``,
+    ``in_edges``), so the edges of a set of nodes are read with offset
+    lookups and a gather instead of merging the nodes with the edges.
+    Nodes and edges are referred to by their row positions in the nodes and
+    edges dataframes.
+
+    Works for cudf and pandas dataframes.
+    """
+
+    def __init__(self, node_ids, sources, targets):
+        ids = _values(node_ids)
+        xp = cp.get_array_module(ids)
+        self._xp = xp
+        self._node_order = xp.argsort(ids, kind="stable")
+        self._sorted_ids = ids[self._node_order]
+        self.num_nodes = len(ids)
+        # node row of the endpoints of each edge, -1 if not a node
+        self.sources = self.node_rows(sources, keep_missing=True)
+        self.targets = self.node_rows(targets, keep_missing=True)
+        self.out_offsets, self.out_edges = _csr(
+            self.sources, self.num_nodes, xp
+        )
+        self.in_offsets, self.in_edges = _csr(self.targets, self.num_nodes, xp)
+
+    def node_rows(self, ids, keep_missing=False):
+        """
+        node rows of the node ids, the ids that are not nodes are left out,
+        or mapped to -1 with keep_missing
+        """
+        xp = self._xp
+        if isinstance(ids, (cudf.Series, pd.Series)):
+            ids = _values(ids)
+        ids = xp.asarray(ids)
+        if self.num_nodes == 0:
+            return xp.full(len(ids) if keep_missing else 0, -1, dtype="int64")
+        position = xp.clip(
+            xp.searchsorted(self._sorted_ids, ids), 0, self.num_nodes - 1
+        )
+        found = self._sorted_ids[position] == ids
+        if keep_missing:
+            return xp.where(found, self._node_order[position], -1)
+        return self._node_order[position[found]]
+
+    def edges(self, rows):
+        """
+        sorted unique edge rows of the edges with an endpoint in the node
+        rows
+        """
+        xp = self._xp
+        return xp.unique(
+            xp.concatenate(
+                [
+                    _gather(self.out_offsets, self.out_edges, rows, xp),
+                    _gather(self.in_offsets, self.in_edges, rows, xp),
+                ]
+            )
+        )
+
+    def endpoints(self, edge_rows):
+        """
+        sorted unique node rows of the endpoints of the edge rows
+        """
+        xp = self._xp
+        rows = xp.concatenate(
+            [self.sources[edge_rows], self.targets[edge_rows]]
+        )
+        return xp.unique(rows[rows >= 0])
+
+    def expand(self, rows, hops=1):
+        """
+        Neighborhood of the node rows, up to ``hops`` edges away.
+
+        Returns
+        -------
+        (node rows, edge rows) tuple, the edges reached from the nodes and
+        their endpoints, as sorted unique row positions
+        """
+        xp = self._xp
+        visited = frontier = xp.unique(xp.asarray(rows, dtype="int64"))
+        edges = xp.zeros(0, dtype="int64")
+        for _ in range(hops):
+            reached = self.edges(frontier)
+            edges = xp.unique(xp.concatenate([edges, reached]))
+            nodes = self.endpoints(reached)
+            frontier = nodes[~xp.isin(nodes, visited)]
+            if len(frontier) == 0:
+                break
+            visited = xp.concatenate([visited, frontier])
+        return self.endpoints(edges), edges
@@ -2,14 +2,77 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import cudf
+import cupy as cp
+import dask
 import dask_cudf
-import gc
+import numpy as np
+import pandas as pd
+from numba import njit
 from typing import Type
 
 from ...charts.core.core_chart import BaseChart
 
 
-def calc_value_counts(a_gpu, stride, min_value, custom_binning=False):
+@njit(nogil=True)
+def _bin_counts_cpu(values, min_value, stride, n_bins):
+    """
+    per bin counts of a float64 array, in a single pass, skipping nulls
+    (NaN) and values outside of the bins
+    """
+    counts = np.zeros(n_bins, dtype=np.int64)
+    for value in values:
+        if value != value:
+            continue
+        code = np.rint((value - min_value) / stride)
+        if 0 <= code < n_bins:
+            counts[int(code)] += 1
+    return counts
+
+
+def _bin_counts(a, stride, min_value, n_bins):
+    """
+    per bin counts of an in-memory (cudf or pandas) series
+    """
+    if isinstance(a, pd.Series):
+        values = a.to_numpy(dtype="float64", na_value=np.nan)
+        return _bin_counts_cpu(values, float(min_value), float(stride), n_bins)
+    codes = cp.rint((a.dropna().values - min_value) / stride)
+    codes = codes[(codes >= 0) & (codes < n_bins)].astype("int64")
+    return cp.asnumpy(cp.bincount(codes, minlength=n_bins))
+
+
+def calc_dense_histogram(a_gpu, stride, min_value, n_bins):
+    """
+    description:
+        histogram with a fixed number of bins of width stride, starting at
+        min_value. Every bin is returned, empty ones included, so that the
+        bins are the same for any subset of the column. Values are assigned
+        to the nearest bin, like calc_value_counts with custom binning.
+    input:
+        - a_gpu: cudf, dask_cudf or pandas series
+        - stride: bin width
+        - min_value: value of the first bin
+        - n_bins: number of bins
+    output:
+        bin_values(ndarray), frequencies(ndarray)
+    """
+    if isinstance(a_gpu, dask_cudf.Series):
+        counts = sum(
+            dask.compute(
+                *[
+                    dask.delayed(_bin_counts)(part, stride, min_value, n_bins)
+                    for part in a_gpu.to_delayed()
+                ]
+            )
+        )
+    else:
+        counts = _bin_counts(a_gpu, stride, min_value, n_bins)
+    return (np.arange(n_bins) * stride + min_value, counts)
+
+
+def calc_value_counts(
+    a_gpu, stride, min_value, custom_binning=False, n_bins=None
+):
     """
     description:
         main function to calculate histograms
@@ -18,10 +81,18 @@ def calc_value_counts(a_gpu, stride, min_value, custom_binning=False):
         - stride: bin width
         - min_value: min value of the column
         - custom_binning: boolean, default False
+        - n_bins: number of bins with custom binning, if known the dense
+          histogram of all bins is returned
     output:
         frequencies(ndarray), bin_edge_values(ndarray)
     """
     custom_binning = custom_binning and stride
+    if (
+        custom_binning
+        and n_bins is not None
+        and getattr(a_gpu.dtype, "kind", "O") in "iuf"
+    ):
+        return calc_dense_histogram(a_gpu, stride, min_value, n_bins)
 
     if isinstance(a_gpu, dask_cudf.Series):
         if not custom_binning:
@@ -60,50 +131,27 @@ def calc_groupby(chart: Type[BaseChart], data, agg=None):
     input:
         - chart
         - data
+        - agg: dict of column -> aggregate function, default
+          {chart.y: chart.aggregate_fn}
     output:
-        frequencies(ndarray), bin_edge_values(ndarray)
+        dataframe of chart.x and the aggregated columns, sorted by chart.x
     """
-    temp_df = data[[chart.x]].dropna(subset=[chart.x])
-
     if agg is None:
-        temp_df[chart.y] = data.dropna(subset=[chart.x])[chart.y]
-        if isinstance(temp_df, dask_cudf.DataFrame):
-            groupby_res = getattr(
-                temp_df.groupby(by=[chart.x], sort=True), chart.aggregate_fn
-            )()
-            groupby_res = groupby_res.reset_index().compute()
-        else:
-            groupby_res = temp_df.groupby(
-                by=[chart.x], sort=True, as_index=False
-            ).agg({chart.y: chart.aggregate_fn})
-    else:
-        for key, agg_fn in agg.items():
-            temp_df[key] = data[key]
-        if isinstance(data, dask_cudf.DataFrame):
-            groupby_res = None
-            for key, agg_fn in agg.items():
-                groupby_res_temp = getattr(
-                    temp_df[[chart.x, key]].groupby(chart.x, sort=True), agg_fn
-                )()
-                if groupby_res is None:
-                    groupby_res = groupby_res_temp.reset_index().compute()
-                else:
-                    groupby_res_temp = groupby_res_temp.reset_index().compute()
-                    groupby_res = groupby_res.merge(
-                        groupby_res_temp, on=chart.x
-                    )
-                del groupby_res_temp
-                gc.collect()
-            groupby_res = groupby_res
-        else:
-            groupby_res = temp_df.groupby(
-                by=[chart.x], sort=True, as_index=False
-            ).agg(agg)
-
-    del temp_df
-    gc.collect()
+        agg = {chart.y: chart.aggregate_fn}
+    # project the needed columns only, and drop the null x rows once
+    columns = list(dict.fromkeys([chart.x, *agg]))
+    temp_df = data[columns].dropna(subset=[chart.x])
 
-    return groupby_res
+    # all the aggregates are computed by a single groupby, a single tree
+    # reduction for dask_cudf
+    if isinstance(temp_df, dask_cudf.DataFrame):
+        return (
+            temp_df.groupby(by=chart.x, sort=True)
+            .agg(agg)
+            .reset_index()
+            .compute()
+        )
+    return temp_df.groupby(by=[chart.x], sort=True, as_index=False).agg(agg)
 
 
 def aggregated_column_unique(chart: Type[BaseChart], data):
@@ -0,0 +1,206 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+
+import dask_cudf
+import numpy as np
+import pandas as pd
+
+from .selection import Selection
+
+
+def _literal(value):
+    """
+    query string literal of a value, strings and datetimes are quoted
+    """
+    if isinstance(value, (np.datetime64, datetime, date)):
+        # pd.Timestamp is a datetime
+        value = str(pd.Timestamp(value))
+    return repr(value) if isinstance(value, str) else str(value)
+
+
+class Predicate(ABC):
+    """
+    Typed chart filter, stored in the dashboard query state instead of a
+    query string.
+
+    Predicates are evaluated directly as vectorized column operations, so
+    no query string is parsed on an interaction. ``to_query_str`` renders
+    the equivalent query string, for display and for the legacy
+    ``DataFrame.query`` code paths.
+
+    Predicates are immutable, two predicates with the same ``key`` select
+    the same rows.
+    """
+
+    @property
+    @abstractmethod
+    def key(self):
+        """
+        hashable value identifying the rows the predicate selects
+        """
+
+    @abstractmethod
+    def mask(self, df):
+        """
+        boolean row mask of the predicate over df, indexed like df
+        """
+
+    @abstractmethod
+    def to_query_str(self):
+        """
+        equivalent query string, empty if there is none
+        """
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.to_query_str()})"
+
+
+class Range(Predicate):
+    """
+    ``low <= column <= high``, rendered with the ``@{column}_min`` and
+    ``@{column}_max`` local variables the charts keep in the dashboard local
+    variables dict
+    """
+
+    def __init__(self, column, low, high):
+        self.column = column
+        self.low = low
+        self.high = high
+
+    @property
+    def key(self):
+        return ("range", self.column, self.low, self.high)
+
+    def mask(self, df):
+        values = df[self.column]
+        return (values >= self.low) & (values <= self.high)
+
+    def to_query_str(self):
+        return f"@{self.column}_min<={self.column}<=@{self.column}_max"
+
+
+class Equality(Predicate):
+    """
+    ``column == value``
+    """
+
+    def __init__(self, column, value):
+        self.column = column
+        self.value = value
+
+    @property
+    def key(self):
+        return ("equality", self.column, self.value)
+
+    def mask(self, df):
+        return df[self.column] == self.value
+
+    def to_query_str(self):
+        return f"{self.column}=={_literal(self.value)}"
+
+
+class SetMembership(Predicate):
+    """
+    ``column in values``, evaluated with a single ``isin`` call however
+    many values are selected
+    """
+
+    def __init__(self, column, values):
+        self.column = column
+        self.values = tuple(values)
+
+    @property
+    def key(self):
+        return ("isin", self.column, self.values)
+
+    def mask(self, df):
+        return df[self.column].isin(list(self.values))
+
+    def to_query_str(self):
+        values = ",".join(map(_literal, self.values))
+        return f"{self.column} in ({values})"
+
+
+class Mask(Predicate):
+    """
+    Precomputed row selection, a compact Selection or a boolean mask
+    Series (or single column DataFrame). Masks with a different index than
+    the source dataframe are treated as positional.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    @property
+    def key(self):
+        # selections are replaced (not mutated) on every new selection, so
+        # the selection object itself identifies the filter state
+        return ("mask", id(self.value))
+
+    def mask(self, df):
+        if isinstance(self.value, Selection):
+            return self.value
+        mask = self.value
+        if mask.ndim == 2:
+            mask = mask[mask.columns[0]]
+        if not isinstance(df, dask_cudf.DataFrame) and not (
+            mask.index.equals(df.index)
+        ):
+            # positional masks, realign to the source dataframe index
+            mask = mask.reset_index(drop=True)
+            mask.index = df.index
+        return mask.fillna(False).astype("bool")
+
+    def to_query_str(self):
+        return ""
+
+
+class And(Predicate):
+    """
+    Conjunction of predicates, the predicates are evaluated in order and
+    the evaluation stops as soon as no row is left
+    """
+
+    def __init__(self, *predicates):
+        self.predicates = predicates
+
+    @property
+    def key(self):
+        return ("and",) + tuple(p.key for p in self.predicates)
+
+    def mask(self, df):
+        result = None
+        for predicate in self.predicates:
+            mask = predicate.mask(df)
+            if isinstance(mask, Selection):
+                mask = mask.to_series(df)
+            result = mask if result is None else result & mask
+            if not isinstance(df, dask_cudf.DataFrame) and not result.any():
+                break
+        return result
+
+    def to_query_str(self):
+        return " and ".join(
+            query
+            for query in (p.to_query_str() for p in self.predicates)
+            if query
+        )
+
+
+def as_predicate(value):
+    """
+    Predicate of a dashboard query state entry, query strings are returned
+    unchanged and selections or boolean masks are wrapped in a Mask
+    """
+    if isinstance(value, (str, Predicate)):
+        return value
+    return Mask(value)
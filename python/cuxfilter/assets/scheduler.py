@@ -0,0 +1,191 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+import panel as pn
+
+DEFAULT_DEBOUNCE = 0.05
+
+
+def create_executor(executor="thread", max_workers=None):
+    """
+    executor to compute the chart aggregates of a reload concurrently.
+
+    Parameters
+    ----------
+    executor: "thread", None or concurrent.futures.Executor
+        "thread" creates a thread pool, None computes the aggregates
+        sequentially, an Executor instance is used as is
+    max_workers: int
+        number of threads of the created pool, default one per CPU core
+
+    Returns
+    -------
+    concurrent.futures.Executor or None
+    """
+    if executor is None or isinstance(executor, Executor):
+        return executor
+    if executor == "thread":
+        return ThreadPoolExecutor(
+            max_workers=max_workers or os.cpu_count() or 1,
+            thread_name_prefix="cuxfilter-chart",
+        )
+    raise ValueError(
+        f"executor must be 'thread', None or a concurrent.futures.Executor,"
+        f" got {executor!r}"
+    )
+
+
+class InteractionScheduler:
+    """
+    Schedules the chart reloads triggered by user interactions in a served
+    dashboard.
+
+    Reload requests are debounced: a request is only run once no new
+    request came in for ``debounce`` seconds. Requests with the same key are
+    coalesced, only the latest one is run. Reloads run on a single worker
+    thread, off the bokeh event loop, one at a time; a running reload whose
+    key got a newer request in the meantime is superseded, and stops at the
+    next ``cancelled`` check.
+
+    ``busy_indicator`` is a panel LoadingSpinner that spins while reloads
+    are queued or running, its value is set on the document thread.
+
+    Model updates of a scheduled request are handed back to the bokeh
+    document of the session with ``run_on_document``.
+
+    Outside of a bokeh server session (in tests, scripts or notebook
+    comms), or with ``debounce=None``, requests are run synchronously.
+    """
+
+    def __init__(self, debounce=DEFAULT_DEBOUNCE):
+        self.debounce = debounce
+        self.busy_indicator = pn.indicators.LoadingSpinner(
+            value=False, width=25, height=25, name=""
+        )
+        self._lock = threading.Lock()
+        self._pending = OrderedDict()
+        self._latest = {}
+        self._queued = 0
+        self._timer = None
+        self._executor = None
+        self._current = threading.local()
+
+    @property
+    def enabled(self):
+        """
+        whether requests are run asynchronously
+        """
+        doc = pn.state.curdoc
+        return (
+            self.debounce is not None
+            and doc is not None
+            and doc.session_context is not None
+        )
+
+    def submit(self, key, fn, *args):
+        """
+        request fn(*args) to be run, superseding any queued or running
+        request with the same key
+        """
+        if not self.enabled:
+            fn(*args)
+            return
+        doc = pn.state.curdoc
+        with self._lock:
+            token = self._latest.get(key, 0) + 1
+            self._latest[key] = token
+            if key not in self._pending:
+                self._queued += 1
+            self._pending[key] = (token, doc, fn, args)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+        self._set_busy(doc, True)
+
+    def _flush(self):
+        with self._lock:
+            jobs = list(self._pending.items())
+            self._pending.clear()
+            self._timer = None
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="cuxfilter-reload"
+                )
+        for key, job in jobs:
+            self._executor.submit(self._run, key, *job)
+
+    def _run(self, key, token, doc, fn, args):
+        self._current.job = (key, token, doc)
+        try:
+            if not self.cancelled():
+                fn(*args)
+        finally:
+            self._current.job = None
+            with self._lock:
+                self._queued -= 1
+                idle = self._queued == 0
+            if idle:
+                self._set_busy(doc, False)
+
+    def _set_busy(self, doc, value):
+        """
+        set the value of the busy indicator on the document thread, bokeh
+        models are not changed from the worker thread
+        """
+        if doc is None:
+            self.busy_indicator.value = value
+            return
+
+        def callback():
+            # stays busy for the requests submitted in the meantime
+            self.busy_indicator.value = value or self._queued > 0
+
+        doc.add_next_tick_callback(callback)
+
+    def cancelled(self):
+        """
+        whether the request run by the current thread was superseded by a
+        newer request with the same key, False outside of a scheduled run
+        """
+        job = getattr(self._current, "job", None)
+        if job is None:
+            return False
+        key, token, _ = job
+        return self._latest.get(key) != token
+
+    def run_on_document(self, fn, *args):
+        """
+        run fn(*args) on the bokeh document the current scheduled request
+        was submitted from, unless the request is superseded by then.
+        Outside of a scheduled run, fn is run right away.
+        """
+        job = getattr(self._current, "job", None)
+        if job is None or job[2] is None:
+            fn(*args)
+            return
+        key, token, doc = job
+
+        def callback():
+            if self._latest.get(key) == token:
+                fn(*args)
+
+        doc.add_next_tick_callback(callback)
+
+    def shutdown(self):
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending.clear()
+            self._queued = 0
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self.busy_indicator.value = False
@@ -0,0 +1,196 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import cudf
+import cupy as cp
+import dask_cudf
+import pandas as pd
+
+SELECTION_KINDS = ("runs", "ids", "bitset")
+
+
+class Selection:
+    """
+    Compact set of selected row positions of a dataframe, used to store the
+    lasso and list selections of the charts instead of full length boolean
+    masks.
+
+    The selection is stored in whichever of the following takes the least
+    memory:
+
+    - ``"runs"``: run-length encoded ``[start, end)`` row ranges, for
+      contiguous selections
+    - ``"ids"``: sorted row positions, for sparse selections
+    - ``"bitset"``: packed bits, one bit per row
+
+    Selections of the same dataframe are combined with ``&`` and ``|``.
+    Arrays are cupy arrays for cudf dataframes and numpy arrays for pandas
+    dataframes.
+    """
+
+    def __init__(self, kind, data, size):
+        if kind not in SELECTION_KINDS:
+            raise ValueError(
+                f"kind must be one of {SELECTION_KINDS}, got {kind}"
+            )
+        self.kind = kind
+        self.data = data
+        self.size = size
+
+    @classmethod
+    def from_mask(cls, mask):
+        """
+        Compact selection of a boolean mask (array or Series)
+        """
+        if isinstance(mask, (cudf.Series, pd.Series)):
+            mask = mask.fillna(False).astype("bool").values
+        xp = cp.get_array_module(mask)
+        mask = xp.asarray(mask, dtype="bool")
+        size = len(mask)
+        dtype = "int32" if size < 2**31 else "int64"
+        itemsize = 4 if dtype == "int32" else 8
+
+        edges = xp.flatnonzero(
+            xp.diff(mask.astype("int8"), prepend=0, append=0)
+        ).astype(dtype)
+        count = int(mask.sum())
+        nbytes = {
+            "runs": len(edges) * itemsize,
+            "ids": count * itemsize,
+            "bitset": (size + 7) // 8,
+        }
+        kind = min(SELECTION_KINDS, key=nbytes.get)
+        if kind == "runs":
+            data = (edges[0::2], edges[1::2])
+        elif kind == "ids":
+            data = xp.flatnonzero(mask).astype(dtype)
+        else:
+            data = xp.packbits(mask)
+        return cls(kind, data, size)
+
+    @classmethod
+    def from_ids(cls, ids, size):
+        """
+        Compact selection of sorted unique row positions, kept as ``"ids"``
+        unless a bitset takes less memory
+        """
+        xp = cp.get_array_module(ids)
+        dtype = "int32" if size < 2**31 else "int64"
+        if len(ids) * xp.dtype(dtype).itemsize <= (size + 7) // 8:
+            return cls("ids", ids.astype(dtype), size)
+        mask = xp.zeros(size, dtype="bool")
+        mask[ids] = True
+        return cls("bitset", xp.packbits(mask), size)
+
+    @property
+    def _xp(self):
+        data = self.data[0] if self.kind == "runs" else self.data
+        return cp.get_array_module(data)
+
+    @property
+    def nbytes(self):
+        if self.kind == "runs":
+            return self.data[0].nbytes + self.data[1].nbytes
+        return self.data.nbytes
+
+    @property
+    def count(self):
+        if self.kind == "runs":
+            return int((self.data[1] - self.data[0]).sum())
+        if self.kind == "ids":
+            return len(self.data)
+        return int(self.to_mask().sum())
+
+    def to_mask(self):
+        """
+        full length boolean mask of the selection
+        """
+        xp = self._xp
+        if self.kind == "bitset":
+            return xp.unpackbits(self.data)[: self.size].astype("bool")
+        mask = xp.zeros(self.size + 1, dtype="int8")
+        if self.kind == "ids":
+            mask[self.data] = 1
+        else:
+            starts, ends = self.data
+            mask[starts] += 1
+            mask[ends] -= 1
+            mask = mask.cumsum()
+        return mask[: self.size].astype("bool")
+
+    def to_bitset(self):
+        if self.kind == "bitset":
+            return self.data
+        return self._xp.packbits(self.to_mask())
+
+    def to_series(self, data):
+        """
+        boolean Series of the selection, indexed like the source dataframe
+        """
+        series_cls = (
+            pd.Series if isinstance(data, pd.DataFrame) else cudf.Series
+        )
+        return series_cls(self.to_mask(), index=data.index)
+
+    def contains(self, ids):
+        """
+        boolean array, whether each of the row positions ids is selected
+        """
+        xp = self._xp
+        if self.kind == "bitset":
+            return ((self.data[ids >> 3] >> (7 - (ids & 7))) & 1).astype(
+                "bool"
+            )
+        if self.kind == "ids":
+            if len(self.data) == 0:
+                return xp.zeros(len(ids), dtype="bool")
+            pos = xp.clip(
+                xp.searchsorted(self.data, ids), 0, len(self.data) - 1
+            )
+            return self.data[pos] == ids
+        starts, ends = self.data
+        if len(starts) == 0:
+            return xp.zeros(len(ids), dtype="bool")
+        run = xp.searchsorted(starts, ids, side="right") - 1
+        return (run >= 0) & (ids < ends[xp.clip(run, 0, None)])
+
+    def _check_size(self, other):
+        if self.size != other.size:
+            raise ValueError(
+                "selections of dataframes of different lengths, "
+                f"{self.size} and {other.size}, cannot be combined"
+            )
+
+    def __and__(self, other):
+        self._check_size(other)
+        if self.kind == "ids" or other.kind == "ids":
+            ids, other = (self, other) if self.kind == "ids" else (other, self)
+            return Selection(
+                "ids", ids.data[other.contains(ids.data)], self.size
+            )
+        return Selection(
+            "bitset", self.to_bitset() & other.to_bitset(), self.size
+        )
+
+    def __or__(self, other):
+        self._check_size(other)
+        if self.kind == "ids" and other.kind == "ids":
+            xp = self._xp
+            return Selection(
+                "ids",
+                xp.unique(xp.concatenate([self.data, other.data])),
+                self.size,
+            )
+        return Selection(
+            "bitset", self.to_bitset() | other.to_bitset(), self.size
+        )
+
+
+def compact_selection(mask):
+    """
+    Compact Selection of an in-memory boolean mask Series, dask_cudf masks
+    are returned unchanged
+    """
+    if isinstance(mask, dask_cudf.Series):
+        return mask
+    return Selection.from_mask(mask)
@@ -0,0 +1,196 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import cudf
+import cupy as cp
+import dask_cudf
+import numpy as np
+import pandas as pd
+
+from .selection import Selection
+from ..charts.core.non_aggregate.utils import (
+    _polygon_vertices,
+    point_in_polygon,
+)
+
+SPATIAL_INDEX_KINDS = "iufM"
+# rows per block of the bounding box table
+SPATIAL_BLOCK_SIZE = 1024
+# bits per coordinate of the z-order key
+_KEY_BITS = 16
+
+
+def supports_spatial_index(x, y):
+    """
+    whether a SpatialIndex can be built for in-memory x and y series
+    """
+    return not isinstance(x, dask_cudf.Series) and all(
+        getattr(series.dtype, "kind", "O") in SPATIAL_INDEX_KINDS
+        for series in (x, y)
+    )
+
+
+def _coordinates(series):
+    """
+    numeric array of the values of a series, int64 for datetimes
+    """
+    if series.dtype.kind == "M":
+        series = series.astype("int64")
+    if isinstance(series, pd.Series):
+        return series.to_numpy(
+            dtype=getattr(series.dtype, "numpy_dtype", None)
+        )
+    return series.values
+
+
+def _spread_bits(values):
+    """
+    interleave zero bits between the low 16 bits of uint32 values
+    """
+    values = (values | (values << 8)) & 0x00FF00FF
+    values = (values | (values << 4)) & 0x0F0F0F0F
+    values = (values | (values << 2)) & 0x33333333
+    return (values | (values << 1)) & 0x55555555
+
+
+def _quantize(values):
+    """
+    values scaled to the 16 bit integer grid of the z-order key
+    """
+    values = values.astype("float64")
+    if len(values) == 0:
+        return values.astype("uint32")
+    low, high = values.min(), values.max()
+    scale = ((1 << _KEY_BITS) - 1) / (high - low) if high > low else 0.0
+    return ((values - low) * scale).astype("uint32")
+
+
+def _block_table(values, block_size, xp):
+    """
+    (min, max) arrays of the values per block of block_size rows
+    """
+    num_blocks = -(-len(values) // block_size)
+    # pad the last block with its last value, which leaves its bounds as is
+    padded = xp.concatenate(
+        [values, xp.repeat(values[-1:], num_blocks * block_size - len(values))]
+    ).reshape(num_blocks, block_size)
+    return padded.min(axis=1), padded.max(axis=1)
+
+
+class SpatialIndex:
+    """
+    Spatial index of the x and y columns of a dataframe, for the box and
+    lasso selections of the scatter, heatmap and graph charts.
+
+    The row positions of the rows with non-null coordinates are sorted by
+    the z-order (Morton) key of their coordinates, so nearby points are
+    stored together, and split into blocks of ``block_size`` rows with a
+    bounding box per block. A box, lasso or viewport query only tests the
+    points of the blocks whose bounding box it overlaps, and takes the
+    blocks fully inside a box as they are.
+
+    Works for numeric and datetime columns of cudf and pandas dataframes.
+    """
+
+    def __init__(self, x, y, block_size=SPATIAL_BLOCK_SIZE):
+        valid = x.notna() & y.notna()
+        xs, ys = _coordinates(x[valid]), _coordinates(y[valid])
+        if isinstance(x, pd.Series):
+            positions = np.flatnonzero(valid.to_numpy())
+        else:
+            positions = cp.flatnonzero(valid.values)
+        xp = cp.get_array_module(xs)
+        key = _spread_bits(_quantize(xs)) | (_spread_bits(_quantize(ys)) << 1)
+        sort = xp.argsort(key, kind="stable")
+        index_dtype = "int32" if len(x) < 2**31 else "int64"
+        self.order = positions[sort].astype(index_dtype)
+        self.x = xs[sort]
+        self.y = ys[sort]
+        self.dtypes = (x.dtype, y.dtype)
+        self.block_size = block_size
+        self.size = len(x)
+        self._xp = xp
+        if len(self.order) > 0:
+            self.x_bounds = _block_table(self.x, block_size, xp)
+            self.y_bounds = _block_table(self.y, block_size, xp)
+        else:
+            empty = xp.zeros(0, dtype="float64")
+            self.x_bounds = self.y_bounds = (empty, empty)
+
+    def _bound(self, value, axis):
+        if self.dtypes[axis].kind == "M":
+            return np.array(value, dtype=self.dtypes[axis]).view("int64")
+        return value
+
+    def _block_rows(self, blocks):
+        """
+        positions in ``order`` of the rows of the blocks
+        """
+        xp = self._xp
+        rows = (
+            blocks[:, None] * self.block_size
+            + xp.arange(self.block_size)[None, :]
+        ).ravel()
+        return rows[rows < len(self.order)]
+
+    def _selection(self, rows):
+        return Selection.from_ids(self._xp.sort(self.order[rows]), self.size)
+
+    def box(self, x_range, y_range):
+        """
+        Selection of the rows with ``x_range[0] <= x <= x_range[1]`` and
+        ``y_range[0] <= y <= y_range[1]``, the rows of a box selection or of
+        a viewport
+        """
+        xp = self._xp
+        x_low, x_high = (self._bound(value, 0) for value in x_range)
+        y_low, y_high = (self._bound(value, 1) for value in y_range)
+        (x_min, x_max), (y_min, y_max) = self.x_bounds, self.y_bounds
+        overlaps = (
+            (x_max >= x_low)
+            & (x_min <= x_high)
+            & (y_max >= y_low)
+            & (y_min <= y_high)
+        )
+        inside = (
+            (x_min >= x_low)
+            & (x_max <= x_high)
+            & (y_min >= y_low)
+            & (y_max <= y_high)
+        )
+        candidates = self._block_rows(xp.flatnonzero(overlaps & ~inside))
+        x, y = self.x[candidates], self.y[candidates]
+        selected = (x >= x_low) & (x <= x_high) & (y >= y_low) & (y <= y_high)
+        rows = xp.concatenate(
+            [
+                self._block_rows(xp.flatnonzero(inside)),
+                candidates[selected],
+            ]
+        )
+        return self._selection(rows)
+
+    def lasso(self, polygon_coords):
+        """
+        Selection of the rows inside a polygon, with the ray casting test
+        of ``point_in_polygon``, empty if the polygon is invalid
+        """
+        xp = self._xp
+        vertices = _polygon_vertices(polygon_coords)
+        if vertices is None or len(self.order) == 0:
+            return self._selection(xp.zeros(0, dtype="int64"))
+        (x_low, y_low), (x_high, y_high) = vertices.min(0), vertices.max(0)
+        # the ray casting intersections may round a few ulps past the
+        # vertices, the blocks that close to the polygon are still tested
+        guard = 8 * np.spacing(max(abs(x_low), abs(x_high)))
+        (x_min, x_max), (y_min, y_max) = self.x_bounds, self.y_bounds
+        overlaps = (
+            (x_max >= x_low - guard)
+            & (x_min <= x_high + guard)
+            & (y_max >= y_low)
+            & (y_min <= y_high)
+        )
+        candidates = self._block_rows(xp.flatnonzero(overlaps))
+        frame_cls = pd.DataFrame if xp is np else cudf.DataFrame
+        points = frame_cls({"x": self.x[candidates], "y": self.y[candidates]})
+        inside = point_in_polygon(points, "x", "y", vertices).values
+        return self._selection(candidates[xp.asarray(inside)])
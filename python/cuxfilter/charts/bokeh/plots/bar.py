@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import holoviews as hv
@@ -42,6 +42,9 @@ class InteractiveBar(param.Parameterized):
         doc=("Transparency of the unselected points. "),
     )
 
+    x_label_map = param.Dict(
+        None, allow_None=True, doc="x value -> label to display"
+    )
     library_specific_params = param.Dict({}, doc="library specific params")
     title = param.String("InteractiveBar", doc="title of the chart")
 
@@ -62,8 +65,12 @@ class InteractiveBar(param.Parameterized):
 
     @param.depends("source_df")
     def bars(self, **kwargs):
+        data = self.source_df
+        if self.x_label_map:
+            data = data.copy()
+            data[self.x] = data[self.x].map(self.x_label_map)
         return hv.Bars(
-            self.source_df,
+            data,
             kdims=self.x,
             **{} if self.y is None else {"vdims": self.y},
         )
@@ -97,10 +104,12 @@ class Bar(BaseAggregateChart):
         """
         generate chart for the x and y columns, and apply aggregate function
         """
+        self.unfiltered_source = self.calculate_source()
         self.chart = InteractiveBar(
             x=self.x,
             y=[self.y] if isinstance(self.y, str) else self.y,
-            source_df=self.calculate_source(),
+            source_df=self.unfiltered_source,
+            x_label_map=self.x_label_map,
             library_specific_params=self.library_specific_params,
             unselected_alpha=self.unselected_alpha,
             title=self.title,
@@ -124,7 +133,13 @@ class Bar(BaseAggregateChart):
         """
         reload chart with new data
         """
-        self.chart.update_data(self.calculate_source(data))
+        self.update_source(self.calculate_source(data))
+
+    def update_source(self, source):
+        """
+        update chart with a precomputed calculate_source result
+        """
+        self.chart.update_data(source)
 
     def view(self, width=800, height=400):
         return pn.panel(
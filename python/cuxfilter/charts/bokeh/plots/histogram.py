@@ -1,7 +1,8 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import holoviews as hv
+import numpy as np
 import param
 from cuxfilter.charts.core.aggregate import BaseAggregateChart
 from cuxfilter.assets.numba_kernels import calc_value_counts
@@ -38,6 +39,9 @@ class InteractiveHistogram(param.Parameterized):
         doc="bounds of the box select tool",
     )
     title = param.String("InteractiveBar", doc="title of the chart")
+    x_label_map = param.Dict(
+        None, allow_None=True, doc="x value -> label to display"
+    )
 
     library_specific_params = param.Dict({}, doc="library specific params")
 
@@ -59,9 +63,13 @@ class InteractiveHistogram(param.Parameterized):
     @param.depends("source_df")
     def histogram(self, **kwargs):
         chart_module = hv.Histogram
-        if self.source_df[0].dtype == "object":
+        data = self.source_df
+        if self.x_label_map:
+            labels = [self.x_label_map.get(x, x) for x in data[0].tolist()]
+            data = (np.array(labels, dtype="object"), data[1])
+        if data[0].dtype == "object":
             chart_module = hv.Bars
-        return chart_module(self.source_df, kdims=self.x)
+        return chart_module(data, kdims=self.x)
 
     def get_base_chart(self):
         return self.histogram().opts(alpha=self.unselected_alpha)
@@ -96,9 +104,11 @@ class Histogram(BaseAggregateChart):
         """
         returns a histogram chart
         """
+        self.unfiltered_source = self.calculate_source()
         self.chart = InteractiveHistogram(
             x=self.x,
-            source_df=self.calculate_source(),
+            source_df=self.unfiltered_source,
+            x_label_map=self.x_label_map,
             unselected_alpha=self.unselected_alpha,
             library_specific_params=self.library_specific_params,
             title=self.title,
@@ -121,13 +131,22 @@ class Histogram(BaseAggregateChart):
             self.stride,
             self.min_value,
             self.custom_binning,
+            n_bins=self.n_bins
+            if self.custom_binning and self.stride
+            else None,
         )
 
     def reload_chart(self, data):
         """
         reload chart with new data
         """
-        self.chart.update_data(self.calculate_source(data))
+        self.update_source(self.calculate_source(data))
+
+    def update_source(self, source):
+        """
+        update chart with a precomputed calculate_source result
+        """
+        self.chart.update_data(source)
 
     def view(self, width=800, height=400):
         return pn.panel(
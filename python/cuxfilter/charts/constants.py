@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2020-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2020-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import numpy as np
@@ -11,3 +11,5 @@ CUDF_DATETIME_TYPES = tuple(
     f"datetime64[{i}]" for i in ["s", "ms", "us", "ns"]
 ) + (np.datetime64,)
 CUDF_TIMEDELTA_TYPE = np.timedelta64
+# edges displayed for the selected nodes of a graph chart
+EDGE_FILTERS = ("both", "either")
@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import numpy as np
@@ -9,7 +9,8 @@ from ..core_chart import BaseChart
 from ...constants import (
     CUDF_DATETIME_TYPES,
 )
-from ....assets.cudf_utils import get_min_max
+from ....assets.predicates import Mask, Range
+from ....assets.selection import compact_selection
 
 
 class BaseAggregateChart(BaseChart):
@@ -46,10 +47,22 @@ class BaseAggregateChart(BaseChart):
     def x_dtype(self, value):
         self._x_dtype = value
 
+    @property
+    def source_columns(self):
+        y = [self.y] if isinstance(self.y, str) else list(self.y or [])
+        return list(dict.fromkeys([self.x, *y]))
+
     @property
     def custom_binning(self):
         return self._stride is not None or self._data_points is not None
 
+    @property
+    def n_bins(self):
+        """
+        number of bins of width stride from min_value to max_value
+        """
+        return int(round((self.max_value - self.min_value) / self.stride)) + 1
+
     def _transformed_source_data(self, property):
         """
         this fixes a bug introduced with panel 0.11, where bokeh CDS
@@ -123,13 +136,14 @@ class BaseAggregateChart(BaseChart):
         if self.x_dtype in CUDF_DATETIME_TYPES:
             source_x = source_x.astype("datetime64[ms]")
         result_array = np.zeros(shape=source_x.shape)
-        indices = [np.where(x_ == source_x)[0][0] for x_ in update_data_x]
+        order = np.argsort(source_x, kind="stable")
+        indices = order[np.searchsorted(source_x, update_data_x, sorter=order)]
         np.put(result_array, indices, update_data_y)
         return result_array
 
     def compute_min_max(self, dashboard_cls):
-        self.min_value, self.max_value = get_min_max(
-            dashboard_cls._cuxfilter_df.data, self.x
+        self.min_value, self.max_value = (
+            dashboard_cls._cuxfilter_df.get_min_max(self.x)
         )
 
     def compute_stride(self):
@@ -158,6 +172,9 @@ class BaseAggregateChart(BaseChart):
 
         """
         self.x_dtype = dashboard_cls._cuxfilter_df.data[self.x].dtype
+        if self.x_label_map is None:
+            # display the labels of dictionary-encoded columns
+            self.x_label_map = dashboard_cls._cuxfilter_df.label_map(self.x)
         # reset data_point to input _data_points
         self.data_points = self._data_points
         # reset stride to input _stride
@@ -191,16 +208,18 @@ class BaseAggregateChart(BaseChart):
         def cb(bounds, x_selection, y_selection):
             self.box_selected_range, self.selected_indices = None, None
             if isinstance(x_selection, tuple):
+                dashboard_cls._prepare_data_tiles(self)
                 self.box_selected_range = {
                     self.x + "_min": x_selection[0],
                     self.x + "_max": x_selection[1],
                 }
             elif isinstance(x_selection, list):
-                self.selected_indices = (
-                    dashboard_cls._cuxfilter_df.data[self.x]
-                    .isin(x_selection)
-                    .reset_index()
-                )[[self.x]]
+                if self.x_label_map:
+                    codes = {v: k for k, v in self.x_label_map.items()}
+                    x_selection = [codes.get(x, x) for x in x_selection]
+                self.selected_indices = compact_selection(
+                    dashboard_cls._cuxfilter_df.data[self.x].isin(x_selection)
+                )
 
             if self.box_selected_range or self.selected_indices is not None:
                 self.compute_query_dict(
@@ -228,13 +247,15 @@ class BaseAggregateChart(BaseChart):
         """
 
         if self.box_selected_range:
-            query_str_dict[self.name] = (
-                f"@{self.x}_min<={self.x}<=@{self.x}_max"
+            query_str_dict[self.name] = Range(
+                self.x,
+                self.box_selected_range[self.x + "_min"],
+                self.box_selected_range[self.x + "_max"],
             )
             query_local_variables_dict.update(self.box_selected_range)
         else:
             if self.selected_indices is not None:
-                query_str_dict[self.name] = self.selected_indices
+                query_str_dict[self.name] = Mask(self.selected_indices)
             else:
                 query_str_dict.pop(self.name, None)
 
@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import Dict
@@ -9,7 +9,7 @@ import panel as pn
 from ..core_chart import BaseChart
 from ....assets.numba_kernels import calc_groupby
 from ....assets import geo_json_mapper
-from ....assets.cudf_utils import get_min_max
+from ....assets.predicates import Equality, SetMembership
 from ...constants import CUXF_NAN_COLOR
 
 np.seterr(divide="ignore", invalid="ignore")
@@ -20,6 +20,7 @@ class BaseChoropleth(BaseChart):
     geo_mapper: Dict[str, str] = {}
     use_data_tiles = True
     source = None
+    selected_values = None
 
     @property
     def name(self):
@@ -137,8 +138,8 @@ class BaseChoropleth(BaseChart):
         Ouput:
 
         """
-        self.min_value, self.max_value = get_min_max(
-            dashboard_cls._cuxfilter_df.data, self.x
+        self.min_value, self.max_value = (
+            dashboard_cls._cuxfilter_df.get_min_max(self.x)
         )
 
         self.geo_mapper, x_range, y_range = geo_json_mapper(
@@ -149,7 +150,10 @@ class BaseChoropleth(BaseChart):
             dashboard_cls._cuxfilter_df.data[self.x].dtype,
         )
 
-        self.calculate_source(dashboard_cls._cuxfilter_df.data)
+        self.unfiltered_source = self.calculate_source(
+            dashboard_cls._cuxfilter_df.data
+        )
+        self.update_source(self.unfiltered_source)
         self.generate_chart()
         self.apply_mappers()
 
@@ -161,6 +165,10 @@ class BaseChoropleth(BaseChart):
     def get_dashboard_view(self):
         return pn.panel(self.chart.view(), sizing_mode="stretch_both")
 
+    @property
+    def source_columns(self):
+        return list(dict.fromkeys([self.x, *self.aggregate_dict]))
+
     def calculate_source(self, data):
         """
         Description:
@@ -172,9 +180,13 @@ class BaseChoropleth(BaseChart):
 
         Ouput:
         """
-        self.format_source_data(
-            calc_groupby(self, data, agg=self.aggregate_dict)
-        )
+        return calc_groupby(self, data, agg=self.aggregate_dict)
+
+    def update_source(self, source):
+        """
+        update chart with a precomputed groupby result
+        """
+        self.format_source_data(source)
 
     def get_selection_callback(self, dashboard_cls):
         """
@@ -188,6 +200,7 @@ class BaseChoropleth(BaseChart):
         """
 
         def selection_callback(old, new):
+            dashboard_cls._prepare_data_tiles(self)
             self.compute_query_dict(dashboard_cls._query_str_dict)
             if old != new and not new:
                 dashboard_cls._reload_charts()
@@ -208,13 +221,14 @@ class BaseChoropleth(BaseChart):
         Ouput:
         """
         list_of_indices = self.get_selected_indices()
+        self.selected_values = list_of_indices
         if len(list_of_indices) == 0 or list_of_indices == [""]:
+            self.selected_values = None
             query_str_dict.pop(self.name, None)
         elif len(list_of_indices) == 1:
-            query_str_dict[self.name] = f"{self.x}=={list_of_indices[0]}"
+            query_str_dict[self.name] = Equality(self.x, list_of_indices[0])
         else:
-            indices_string = ",".join(map(str, list_of_indices))
-            query_str_dict[self.name] = f"{self.x} in ({indices_string})"
+            query_str_dict[self.name] = SetMembership(self.x, list_of_indices)
 
     def add_events(self, dashboard_cls):
         """
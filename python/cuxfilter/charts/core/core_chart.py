@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import cudf
@@ -23,6 +23,9 @@ class BaseChart:
     chart = None
     source = None
     source_backup = None
+    # calculate_source result over the unfiltered data, computed by
+    # initiate_chart, used by the dashboard to reset without recomputing
+    unfiltered_source = None
     data_points: int = 0
     filter_widget = None
     _library_specific_params: Dict[str, str] = {}
@@ -61,6 +64,15 @@ class BaseChart:
     def library_specific_params(self):
         return self._library_specific_params
 
+    @property
+    def source_columns(self):
+        """
+        columns of the source data calculate_source and reload_chart read,
+        the dashboard gathers the filtered rows of these columns only. None
+        for all the columns
+        """
+        return None
+
     @property
     def x_dtype(self):
         if isinstance(self.source, ColumnDataSource):
@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import panel as pn
@@ -52,6 +52,10 @@ class ViewDataFrame:
     def name(self):
         return f"{self.chart_type}_{self.columns}"
 
+    @property
+    def source_columns(self):
+        return self.columns
+
     def initiate_chart(self, dashboard_cls):
         data = dashboard_cls._cuxfilter_df.data
         if isinstance(data, dask_cudf.DataFrame):
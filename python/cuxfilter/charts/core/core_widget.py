@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
@@ -33,6 +33,11 @@ class BaseWidget:
         chart_type = self.chart_type if self.chart_type else "widget"
         return f"{self.x}_{chart_type}"
 
+    @property
+    def source_columns(self):
+        # widgets are not reloaded from the filtered data
+        return []
+
     @property
     def stride(self):
         return self._stride
@@ -1,27 +1,30 @@
-# SPDX-FileCopyrightText: Copyright (c) 2020-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2020-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Tuple
+from typing import Tuple, Union
 import cudf
 import pandas as pd
-import dask.dataframe as dd
 import dask_cudf
 import panel as pn
 
 from .utils import point_in_polygon
 from ..core_chart import BaseChart
+from ....assets.predicates import And, Mask, Range
+from ....assets.selection import Selection, compact_selection
 
-from ...constants import CUXF_DEFAULT_COLOR_PALETTE
+from ...constants import CUXF_DEFAULT_COLOR_PALETTE, EDGE_FILTERS
 
 
 class BaseGraph(BaseChart):
     reset_event = None
     x_range: Tuple = None
     y_range: Tuple = None
-    selected_indices: cudf.Series = None
+    selected_indices: Union[Selection, dask_cudf.Series] = None
     box_selected_range = None
     use_data_tiles = False
     default_palette = CUXF_DEFAULT_COLOR_PALETTE
+    # precomputed line segments of the edges, see EdgeTable
+    _edge_table = None
 
     @property
     def colors_set(self):
@@ -95,6 +98,7 @@ class BaseGraph(BaseChart):
         x_axis_tick_formatter=None,
         y_axis_tick_formatter=None,
         unselected_alpha=0.2,
+        edge_filter="both",
         **library_specific_params,
     ):
         """
@@ -132,6 +136,7 @@ class BaseGraph(BaseChart):
             x_axis_tick_formatter
             y_axis_tick_formatter
             unselected_alpha
+            edge_filter
             **library_specific_params
         -------------------------------------------
 
@@ -169,6 +174,12 @@ class BaseGraph(BaseChart):
         self.x_axis_tick_formatter = x_axis_tick_formatter
         self.y_axis_tick_formatter = y_axis_tick_formatter
         self.unselected_alpha = unselected_alpha
+        if edge_filter not in EDGE_FILTERS:
+            raise ValueError(
+                f"edge_filter must be one of {EDGE_FILTERS}, got "
+                f"{edge_filter!r}"
+            )
+        self.edge_filter = edge_filter
         self.library_specific_params = library_specific_params
 
     @property
@@ -210,20 +221,17 @@ class BaseGraph(BaseChart):
         if dashboard_cls._cuxfilter_df.edges is None:
             raise ValueError("Edges dataframe not provided")
         if self.x_range is None:
-            self.x_range = (
-                dashboard_cls._cuxfilter_df.data[self.node_x].min(),
-                dashboard_cls._cuxfilter_df.data[self.node_x].max(),
-            )
+            self.x_range = dashboard_cls._cuxfilter_df.get_min_max(self.node_x)
         if self.y_range is None:
-            self.y_range = (
-                dashboard_cls._cuxfilter_df.data[self.node_y].min(),
-                dashboard_cls._cuxfilter_df.data[self.node_y].max(),
-            )
-        if isinstance(dashboard_cls._cuxfilter_df.data, dask_cudf.DataFrame):
-            self.x_range = dd.compute(*self.x_range)
-            self.y_range = dd.compute(*self.y_range)
+            self.y_range = dashboard_cls._cuxfilter_df.get_min_max(self.node_y)
+        if self.add_interaction:
+            dashboard_cls._spatial_index(self.node_x, self.node_y)
 
         self.calculate_source(dashboard_cls._cuxfilter_df)
+        if self.add_interaction:
+            # neighbor inspection reads the edges of the selected nodes from
+            # the adjacency of the graph
+            self._graph_adjacency(dashboard_cls)
         self.generate_chart()
         self.add_events(dashboard_cls)
 
@@ -256,7 +264,48 @@ class BaseGraph(BaseChart):
             return dask_cudf.concat
         return cudf.concat
 
-    def query_graph(self, node_ids, nodes, edges):
+    def _graph_adjacency(self, dashboard_cls):
+        """
+        GraphAdjacency of the graph of the dashboard, None if the chart
+        nodes and edges are not those of the dashboard dataframe or for
+        dask_cudf graphs
+        """
+        cuxfilter_df = dashboard_cls._cuxfilter_df
+        if self.nodes is not cuxfilter_df.data or (
+            self.edges is not cuxfilter_df.edges
+        ):
+            return None
+        return cuxfilter_df.graph_adjacency(
+            self.node_id, self.edge_source, self.edge_target
+        )
+
+    def query_graph(self, node_ids, nodes, edges, adjacency=None, hops=1):
+        """
+        Description:
+            nodes and edges within ``hops`` edges of the selected nodes,
+            read from the GraphAdjacency when available, merged otherwise
+        -------------------------------------------
+        Input:
+            node_ids: selected nodes dataframe
+            nodes: nodes dataframe
+            edges: edges dataframe
+            adjacency: GraphAdjacency of nodes and edges
+            hops: number of edges to expand the selection by
+        -------------------------------------------
+
+        Ouput:
+            (nodes, edges) tuple
+        """
+        if adjacency is not None:
+            node_rows, edge_rows = adjacency.expand(
+                adjacency.node_rows(node_ids[self.node_id]), hops
+            )
+            return (
+                nodes.iloc[node_rows][self.node_columns],
+                edges.iloc[edge_rows][self.edge_columns],
+            )
+        for _ in range(hops - 1):
+            node_ids, _ = self.query_graph(node_ids, nodes, edges)
         edges_ = self.concat(
             [
                 node_ids.merge(
@@ -308,10 +357,15 @@ class BaseGraph(BaseChart):
                 dashboard_cls._query_local_variables_dict,
             )
 
-            nodes = dashboard_cls._query(dashboard_cls._generate_query_str())
+            nodes = dashboard_cls._filtered_data()
 
             if self.inspect_neighbors._active:
-                nodes, edges = self.query_graph(nodes, self.nodes, self.edges)
+                nodes, edges = self.query_graph(
+                    nodes,
+                    self.nodes,
+                    self.edges,
+                    adjacency=self._graph_adjacency(dashboard_cls),
+                )
 
             # reload all charts with new queried data (cudf.DataFrame only)
             dashboard_cls._reload_charts(data=nodes, ignore_cols=[self.name])
@@ -350,19 +404,29 @@ class BaseGraph(BaseChart):
                     .persist()
                 )
             else:
-                self.selected_indices = point_in_polygon(self.nodes, *args)
+                index = dashboard_cls._spatial_index(self.node_x, self.node_y)
+                self.selected_indices = (
+                    index.lasso(geometry)
+                    if index is not None
+                    else compact_selection(point_in_polygon(self.nodes, *args))
+                )
 
             self.compute_query_dict(
                 dashboard_cls._query_str_dict,
                 dashboard_cls._query_local_variables_dict,
             )
 
-            nodes = dashboard_cls._query(dashboard_cls._generate_query_str())
+            nodes = dashboard_cls._filtered_data()
             edges = None
 
             if self.inspect_neighbors._active:
                 # node_ids = nodes[self.node_id]
-                nodes, edges = self.query_graph(nodes, self.nodes, self.edges)
+                nodes, edges = self.query_graph(
+                    nodes,
+                    self.nodes,
+                    self.edges,
+                    adjacency=self._graph_adjacency(dashboard_cls),
+                )
 
             # reload all charts with new queried data (cudf.DataFrame only)
             dashboard_cls._reload_charts(data=nodes, ignore_cols=[self.name])
@@ -385,9 +449,9 @@ class BaseGraph(BaseChart):
         Ouput:
         """
         if self.box_selected_range:
-            query_str_dict[self.name] = (
-                f"@{self.node_x}_min<={self.node_x}<=@{self.node_x}_max"
-                + f" and @{self.node_y}_min<={self.node_y}<=@{self.node_y}_max"
+            query_str_dict[self.name] = And(
+                Range(self.node_x, *self.x_range),
+                Range(self.node_y, *self.y_range),
             )
             temp_local_dict = {
                 self.node_x + "_min": self.x_range[0],
@@ -398,7 +462,7 @@ class BaseGraph(BaseChart):
             query_local_variables_dict.update(temp_local_dict)
         else:
             if self.selected_indices is not None:
-                query_str_dict[self.name] = self.selected_indices
+                query_str_dict[self.name] = Mask(self.selected_indices)
             else:
                 query_str_dict.pop(self.name, None)
 
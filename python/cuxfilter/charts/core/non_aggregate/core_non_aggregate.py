@@ -1,14 +1,14 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Tuple
-import cudf
+from typing import Tuple, Union
 import dask_cudf
-import dask.dataframe as dd
 import panel as pn
 
 from .utils import point_in_polygon
 from ..core_chart import BaseChart
+from ....assets.predicates import And, Mask, Range
+from ....assets.selection import Selection, compact_selection
 
 
 class BaseNonAggregate(BaseChart):
@@ -23,10 +23,13 @@ class BaseNonAggregate(BaseChart):
     reset_event = None
     x_range: Tuple = None
     y_range: Tuple = None
-    selected_indices: cudf.Series = None
+    selected_indices: Union[Selection, dask_cudf.Series] = None
     box_selected_range = None
     aggregate_col = None
     use_data_tiles = False
+    # whether the box and lasso selections read from a SpatialIndex of the
+    # x and y columns
+    use_spatial_index = False
 
     @property
     def name(self):
@@ -39,6 +42,13 @@ class BaseNonAggregate(BaseChart):
             f"_{chart_type}_{self.title}"
         )
 
+    @property
+    def source_columns(self):
+        columns = [self.x, self.y]
+        if isinstance(self.aggregate_col, str):
+            columns.append(self.aggregate_col)
+        return list(dict.fromkeys(columns))
+
     def initiate_chart(self, dashboard_cls):
         """
         Description:
@@ -52,18 +62,11 @@ class BaseNonAggregate(BaseChart):
 
         """
         if self.x_range is None:
-            self.x_range = (
-                dashboard_cls._cuxfilter_df.data[self.x].min(),
-                dashboard_cls._cuxfilter_df.data[self.x].max(),
-            )
+            self.x_range = dashboard_cls._cuxfilter_df.get_min_max(self.x)
         if self.y_range is None:
-            self.y_range = (
-                dashboard_cls._cuxfilter_df.data[self.y].min(),
-                dashboard_cls._cuxfilter_df.data[self.y].max(),
-            )
-        if isinstance(dashboard_cls._cuxfilter_df.data, dask_cudf.DataFrame):
-            self.x_range = dd.compute(*self.x_range)
-            self.y_range = dd.compute(*self.y_range)
+            self.y_range = dashboard_cls._cuxfilter_df.get_min_max(self.y)
+        if self.use_spatial_index and self.add_interaction:
+            dashboard_cls._spatial_index(self.x, self.y)
         self.calculate_source(dashboard_cls._cuxfilter_df.data)
         self.generate_chart()
         self.add_events(dashboard_cls)
@@ -104,6 +107,7 @@ class BaseNonAggregate(BaseChart):
                 self.y + "_min": self.y_range[0],
                 self.y + "_max": self.y_range[1],
             }
+            dashboard_cls._prepare_data_tiles(self)
 
             self.compute_query_dict(
                 dashboard_cls._query_str_dict,
@@ -142,7 +146,18 @@ class BaseNonAggregate(BaseChart):
                     .persist()
                 )
             else:
-                self.selected_indices = point_in_polygon(self.source, *args)
+                index = (
+                    dashboard_cls._spatial_index(self.x, self.y)
+                    if self.use_spatial_index
+                    else None
+                )
+                self.selected_indices = (
+                    index.lasso(geometry)
+                    if index is not None
+                    else compact_selection(
+                        point_in_polygon(self.source, *args)
+                    )
+                )
 
             self.compute_query_dict(
                 dashboard_cls._query_str_dict,
@@ -165,14 +180,22 @@ class BaseNonAggregate(BaseChart):
         Ouput:
         """
         if self.box_selected_range:
-            query_str_dict[self.name] = (
-                f"@{self.x}_min<={self.x}<=@{self.x}_max"
-                + f" and @{self.y}_min<={self.y}<=@{self.y}_max"
+            query_str_dict[self.name] = And(
+                Range(
+                    self.x,
+                    self.box_selected_range[self.x + "_min"],
+                    self.box_selected_range[self.x + "_max"],
+                ),
+                Range(
+                    self.y,
+                    self.box_selected_range[self.y + "_min"],
+                    self.box_selected_range[self.y + "_max"],
+                ),
             )
             query_local_variables_dict.update(self.box_selected_range)
         else:
             if self.selected_indices is not None:
-                query_str_dict[self.name] = self.selected_indices
+                query_str_dict[self.name] = Mask(self.selected_indices)
             else:
                 query_str_dict.pop(self.name, None)
 
@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import Tuple
@@ -13,6 +13,7 @@ class BaseScatter(BaseNonAggregate):
     y_range: Tuple = None
     aggregate_col = None
     default_palette = CUXF_DEFAULT_COLOR_PALETTE
+    use_spatial_index = True
 
     @property
     def colors_set(self):
@@ -45,6 +46,7 @@ class BaseScatter(BaseNonAggregate):
         legend=True,
         legend_position="center",
         unselected_alpha=0.2,
+        use_data_tiles=False,
         **library_specific_params,
     ):
         """
@@ -67,6 +69,7 @@ class BaseScatter(BaseNonAggregate):
             pixel_spread
             title
             timeout
+            use_data_tiles
             **library_specific_params
         -------------------------------------------
 
@@ -92,4 +95,5 @@ class BaseScatter(BaseNonAggregate):
         self.legend = legend
         self.legend_position = legend_position
         self.unselected_alpha = unselected_alpha
+        self.use_data_tiles = use_data_tiles
         self.library_specific_params = library_specific_params
@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import cudf
@@ -8,6 +8,7 @@ from typing import Tuple
 import panel as pn
 
 from ..core_chart import BaseChart
+from ....assets.predicates import Range
 
 
 class BaseStackedLine(BaseChart):
@@ -48,6 +49,10 @@ class BaseStackedLine(BaseChart):
             f"_{self.title}"
         )
 
+    @property
+    def source_columns(self):
+        return list(dict.fromkeys([self.x, *self.y]))
+
     @property
     def colors_set(self):
         return self._colors_input != []
@@ -139,16 +144,15 @@ class BaseStackedLine(BaseChart):
                 raise TypeError("All y columns should be of same type")
 
         if self.x_range is None:
-            self.x_range = (
-                dashboard_cls._cuxfilter_df.data[self.x].min(),
-                dashboard_cls._cuxfilter_df.data[self.x].max(),
-            )
+            self.x_range = dashboard_cls._cuxfilter_df.get_min_max(self.x)
         if self.y_range is None:
-            # cudf_df[['a','b','c']].min().min() gives min value
-            # between all values in columns a,b and c
+            # min and max values between all the y columns
+            y_ranges = [
+                dashboard_cls._cuxfilter_df.get_min_max(_y) for _y in self.y
+            ]
             self.y_range = (
-                dashboard_cls._cuxfilter_df.data[self.y].min().min(),
-                dashboard_cls._cuxfilter_df.data[self.y].max().max(),
+                min(y_range[0] for y_range in y_ranges),
+                max(y_range[1] for y_range in y_ranges),
             )
         self.calculate_source(dashboard_cls._cuxfilter_df.data)
         self.generate_chart()
@@ -206,9 +210,7 @@ class BaseStackedLine(BaseChart):
         Ouput:
         """
         if self.box_selected_range:
-            query_str_dict[self.name] = (
-                f"@{self.x}_min<={self.x}<=@{self.x}_max"
-            )
+            query_str_dict[self.name] = Range(self.x, *self.x_range)
             temp_local_dict = {
                 self.x + "_min": self.x_range[0],
                 self.x + "_max": self.x_range[1],
@@ -1,12 +1,19 @@
-# SPDX-FileCopyrightText: Copyright (c) 2023-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2023-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
-from numba import cuda
+from numba import cuda, njit, prange
 from numba.core.errors import NumbaPerformanceWarning
 import cupy as cp
 import cudf
+import numpy as np
+import pandas as pd
 import warnings
 
+# row bands of the edge grid of the CPU implementation, per polygon edge and
+# at most
+POLYGON_BANDS_PER_EDGE = 2
+MAX_POLYGON_BANDS = 4096
+
 
 # Define the CUDA kernel using numba.cuda.jit
 # This kernel implements the ray casting algorithm
@@ -88,14 +95,175 @@ def point_in_polygon_kernel(points_xy, polygon_xy, num_vertices, out):
         out[i] = point_in_polygon_ray_cast(px, py, polygon_xy, num_vertices)
 
 
+@njit(parallel=True)
+def point_in_polygon_cpu_kernel(
+    points_x, points_y, band_edges, band_offsets, bbox, out
+):
+    """
+    CPU kernel to check arrays of points against a single polygon, with the
+    ray casting test of ``point_in_polygon_ray_cast``.
+
+    Points outside the bounding box of the polygon are rejected, the others
+    are only tested against the edges of their row band.
+
+    Parameters
+    ----------
+    points_x, points_y : numpy.ndarray
+        Coordinates of the points.
+    band_edges : numpy.ndarray
+        (num_entries, 4) array of the polygon edges crossing each row band,
+        [vjx, vjy, vj1x, vj1y], ordered by band.
+    band_offsets : numpy.ndarray
+        Offsets in band_edges of the edges of each row band.
+    bbox : numpy.ndarray
+        [x_min, x_max, y_min, y_max, band_height] of the edge grid.
+    out : numpy.ndarray
+        Output boolean array.
+    """
+    x_min, x_max, y_min, y_max, band_height = bbox
+    num_bands = band_offsets.shape[0] - 1
+    for i in prange(points_x.shape[0]):
+        px = points_x[i]
+        py = points_y[i]
+        # no edge crosses the ray of a point outside of the y range, and the
+        # ray of a point outside of the x range crosses either all or none
+        # of the edges of its row, an even number of them
+        if not (y_min <= py < y_max and x_min <= px <= x_max):
+            out[i] = False
+            continue
+        band = min(int((py - y_min) / band_height), num_bands - 1)
+        intersections = 0
+        # branchless, the crossings of random points are unpredictable
+        for k in range(band_offsets[band], band_offsets[band + 1]):
+            vjx = band_edges[k, 0]
+            vjy = band_edges[k, 1]
+            vj1x = band_edges[k, 2]
+            vj1y = band_edges[k, 3]
+            x_intersection = vjx + (py - vjy) * (vj1x - vjx) / (vj1y - vjy)
+            intersections += (
+                (min(vjy, vj1y) <= py)
+                & (py < max(vjy, vj1y))
+                & (px < x_intersection)
+            )
+        out[i] = intersections % 2 == 1
+
+
+def _polygon_vertices(polygon_coords):
+    """
+    (num_vertices, 2) float64 numpy array of the polygon vertices, None if
+    the polygon is invalid
+    """
+    try:
+        polygon_xy = np.asarray(polygon_coords, dtype=np.float64)
+    except (ValueError, TypeError):
+        return None
+    # Flatten if it's a list of pairs (N, 2)
+    if polygon_xy.ndim == 2 and polygon_xy.shape[1] == 2:
+        polygon_xy = polygon_xy.flatten()
+    elif polygon_xy.ndim != 1:
+        return None
+    if polygon_xy.size % 2 != 0 or polygon_xy.size // 2 < 3:
+        return None
+    return polygon_xy.reshape(-1, 2)
+
+
+def _edge_grid(vertices):
+    """
+    Uniform row band grid of the non horizontal edges of a polygon, the
+    inputs of ``point_in_polygon_cpu_kernel`` besides the points
+    """
+    start = vertices
+    end = np.roll(vertices, -1, axis=0)
+    # horizontal edges are never crossed by the ray
+    crossing = start[:, 1] != end[:, 1]
+    edges = np.concatenate([start[crossing], end[crossing]], axis=1)
+    x_min, y_min = vertices.min(axis=0)
+    x_max, y_max = vertices.max(axis=0)
+    # intersections are computed a few ulps away from the vertices
+    guard = 8 * np.spacing(max(abs(x_min), abs(x_max)))
+    num_bands = int(
+        np.clip(len(edges) * POLYGON_BANDS_PER_EDGE, 1, MAX_POLYGON_BANDS)
+    )
+    band_height = (y_max - y_min) / num_bands if y_max > y_min else 1.0
+
+    # an edge covers every band between the bands of its end points, the
+    # points are assigned to bands with the same arithmetic in the kernel
+    def band(y):
+        return np.minimum(
+            ((y - y_min) / band_height).astype(np.int64), num_bands - 1
+        )
+
+    low = band(np.minimum(edges[:, 1], edges[:, 3]))
+    high = band(np.maximum(edges[:, 1], edges[:, 3]))
+    spans = high - low + 1
+    edge_ids = np.repeat(np.arange(len(edges)), spans)
+    bands = np.repeat(low, spans) + (
+        np.arange(len(edge_ids)) - np.repeat(np.cumsum(spans) - spans, spans)
+    )
+    order = np.argsort(bands, kind="stable")
+    band_edges = np.ascontiguousarray(edges[edge_ids[order]])
+    band_offsets = np.searchsorted(
+        bands[order], np.arange(num_bands + 1)
+    ).astype(np.int64)
+    bbox = np.array(
+        [x_min - guard, x_max + guard, y_min, y_max, band_height],
+        dtype=np.float64,
+    )
+    return band_edges, band_offsets, bbox
+
+
+def point_in_polygon_cpu(points_x, points_y, polygon_coords):
+    """
+    Checks which points are inside a given polygon on the CPU.
+
+    Points outside of the bounding box of the polygon are rejected first,
+    the other points are only tested against the polygon edges of their row
+    band of a uniform grid, with the ray casting test of the CUDA kernel.
+
+    Parameters
+    ----------
+    points_x : numpy.ndarray
+        X-coordinates of the points.
+    points_y : numpy.ndarray
+        Y-coordinates of the points.
+    polygon_coords : list of tuples or similar array-like
+        Coordinates of the polygon vertices, e.g., [(x1, y1), (x2, y2), ...].
+
+    Returns
+    -------
+    numpy.ndarray
+        A boolean array indicating whether each point is inside the polygon,
+        all False if the polygon is invalid.
+    """
+    points_x = np.ascontiguousarray(points_x, dtype=np.float64)
+    points_y = np.ascontiguousarray(points_y, dtype=np.float64)
+    out = np.zeros(len(points_x), dtype=np.bool_)
+    vertices = _polygon_vertices(polygon_coords)
+    if vertices is None or len(out) == 0:
+        return out
+    point_in_polygon_cpu_kernel(points_x, points_y, *_edge_grid(vertices), out)
+    return out
+
+
+def _pandas_point_in_polygon(df, x, y, polygon_coords):
+    return pd.Series(
+        point_in_polygon_cpu(
+            df[x].to_numpy(dtype=np.float64, na_value=np.nan),
+            df[y].to_numpy(dtype=np.float64, na_value=np.nan),
+            polygon_coords,
+        ),
+        index=df.index,
+    )
+
+
 def point_in_polygon(df, x, y, polygon_coords):
     """
     Checks which points in a DataFrame are inside a given polygon using a CUDA
-    kernel.
+    kernel, or the CPU kernel for pandas DataFrames.
 
     Parameters
     ----------
-    df : cudf.DataFrame
+    df : cudf.DataFrame or pandas.DataFrame
         DataFrame containing the points.
     x : str
         Column name for the x-coordinates of the points.
@@ -107,9 +275,11 @@ def point_in_polygon(df, x, y, polygon_coords):
 
     Returns
     -------
-    cudf.Series
+    cudf.Series or pandas.Series
         A boolean Series indicating whether each point is inside the polygon.
     """
+    if isinstance(df, pd.DataFrame):
+        return _pandas_point_in_polygon(df, x, y, polygon_coords)
     if not isinstance(df, cudf.DataFrame):
         raise TypeError("Input 'df' must be a cudf.DataFrame")
 
@@ -1,8 +1,8 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 from .graph_inspect_widget import CustomInspectTool
-from .graph_assets import calc_connected_edges
+from .graph_assets import EdgeTable, calc_connected_edges
 from .holoviews_datashader import (
     InteractiveDatashaderPoints,
     InteractiveDatashaderLine,
@@ -1,11 +1,13 @@
-# SPDX-FileCopyrightText: Copyright (c) 2020-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2020-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import cupy as cp
 import cudf
 from cuxfilter.assets import cudf_utils
 import dask_cudf
-from numba import cuda
+import numpy as np
+import pandas as pd
+from numba import cuda, njit, prange
 from math import sqrt, ceil
 
 from ....assets import datetime as dt
@@ -246,6 +248,44 @@ def connect_edges(edges, result):
             result[i, 2, 2] = cp.nan
 
 
+@njit(parallel=True)
+def interleave_segments_cpu_kernel(src, dst, result):
+    for i in prange(src.shape[0]):
+        result[3 * i] = src[i]
+        result[3 * i + 1] = dst[i]
+        result[3 * i + 2] = np.nan
+
+
+def _segment_dtype(*series):
+    """
+    float dtype of a segment column, float64 for integer (and datetime as
+    int64) coordinates
+    """
+    return np.result_type(
+        *(getattr(s.dtype, "numpy_dtype", s.dtype) for s in series),
+        np.float32,
+    )
+
+
+def _segment_values(src, dst):
+    """
+    preallocated 3n array of the src, dst and nan separator values of n
+    edges, interleaved as src[0], dst[0], nan, src[1], dst[1], nan, ...
+    """
+    dtype = _segment_dtype(src, dst)
+    if isinstance(src, pd.Series):
+        src = src.to_numpy(dtype=dtype, na_value=np.nan)
+        dst = dst.to_numpy(dtype=dtype, na_value=np.nan)
+        result = np.empty(3 * len(src), dtype=dtype)
+        interleave_segments_cpu_kernel(src, dst, result)
+        return result
+    result = cp.empty(3 * len(src), dtype=dtype)
+    result[0::3] = src.to_cupy(dtype=dtype, na_value=cp.nan)
+    result[1::3] = dst.to_cupy(dtype=dtype, na_value=cp.nan)
+    result[2::3] = cp.nan
+    return result
+
+
 def directly_connect_edges(edges, x, y, edge_aggregate_col=None):
     """
     edges: cudf DataFrame(x_src, y_src, x_dst, y_dst)
@@ -258,30 +298,27 @@ def directly_connect_edges(edges, x, y, edge_aggregate_col=None):
         row2 -> x_dst, y_dst
         row3 -> nan, nan
         ...
-    ) as the input to datashader.line
+    ) as the input to datashader.line, the rows of edge i are 3 * i to
+    3 * i + 2
     """
-    # dask.distributed throws a not supported error when cudf.NA is used
-    edges[x] = cp.NAN
-    edges[y] = cp.NAN
-
-    src_columns = [f"{x}_src", f"{y}_src"]
-    dst_columns = [f"{x}_dst", f"{y}_dst"]
+    # each column is written once into its 3n rows, instead of
+    # concatenating the src, dst and separator rows and sorting them back
+    # together. The separators are nan and not cudf.NA, which
+    # dask.distributed does not support
+    result = {
+        x: _segment_values(edges[f"{x}_src"], edges[f"{x}_dst"]),
+        y: _segment_values(edges[f"{y}_src"], edges[f"{y}_dst"]),
+    }
     if edge_aggregate_col:
-        src_columns.append(edge_aggregate_col)
-        dst_columns.append(edge_aggregate_col)
-
-    # realign each src -> target row, as 3 rows:
-    #   [[x_src, y_src], [x_dst, y_dst], [nan, nan]]
-    return cudf.concat(
-        [
-            edges[src_columns].rename(columns={f"{x}_src": x, f"{y}_src": y}),
-            edges[dst_columns].rename(columns={f"{x}_dst": x, f"{y}_dst": y}),
-            edges[[x, y]],
-        ]
-    ).sort_index()
+        result[edge_aggregate_col] = _segment_values(
+            edges[edge_aggregate_col], edges[edge_aggregate_col]
+        )
+    if isinstance(edges, pd.DataFrame):
+        return pd.DataFrame(result)
+    return cudf.DataFrame(result)
 
 
-def calc_connected_edges(
+def _connected_edges_table(
     nodes,
     edges,
     node_x,
@@ -292,14 +329,10 @@ def calc_connected_edges(
     edge_aggregate_col,
     node_x_dtype,
     node_y_dtype,
-    edge_render_type="direct",
-    curve_params=None,
 ):
     """
-    calculate directly connected edges
-    nodes: cudf.DataFrame/dask_cudf.DataFrame
-    edges: cudf.DataFrame/dask_cudf.DataFrame
-    edge_type: direct/curved
+    edges joined with the coordinates of their source and target nodes,
+    and the columns of the line segments
     """
     edges_columns = [
         edge_source,
@@ -342,6 +375,131 @@ def calc_connected_edges(
         .drop_duplicates(subset=[edge_source, edge_target])
         .reset_index(drop=True)
     )
+    return connected_edges_df, connected_edge_columns
+
+
+def _empty_connected_edges(node_x, node_y, edge_aggregate_col):
+    result = cudf.DataFrame({k: cp.nan for k in [node_x, node_y]})
+    if edge_aggregate_col is not None:
+        result[edge_aggregate_col] = cp.nan
+    return result
+
+
+class EdgeTable:
+    """
+    Line segments of all the edges of an in-memory graph, in the format of
+    ``directly_connect_edges``, joined with the node coordinates once.
+
+    The graph reloads select the edges of the selected nodes from the
+    table, with a node mask and a gather of their segment rows, instead of
+    joining the selected nodes and the edges again.
+    """
+
+    def __init__(
+        self,
+        nodes,
+        edges,
+        adjacency,
+        node_x,
+        node_y,
+        node_id,
+        edge_source,
+        edge_target,
+        edge_aggregate_col,
+        node_x_dtype,
+        node_y_dtype,
+    ):
+        table, connected_edge_columns = _connected_edges_table(
+            nodes,
+            edges,
+            node_x,
+            node_y,
+            node_id,
+            edge_source,
+            edge_target,
+            edge_aggregate_col,
+            node_x_dtype,
+            node_y_dtype,
+        )
+        self.adjacency = adjacency
+        self.node_id = node_id
+        self.edge_columns = (edge_source, edge_target)
+        self.columns = (node_x, node_y, edge_aggregate_col)
+        # node rows of the endpoints of each edge of the table
+        self.sources = adjacency.node_rows(table[edge_source])
+        self.targets = adjacency.node_rows(table[edge_target])
+        self._xp = cp.get_array_module(self.sources)
+        # the segment rows of edge i are the rows 3 * i to 3 * i + 2
+        self.segments = directly_connect_edges(
+            table[connected_edge_columns], node_x, node_y, edge_aggregate_col
+        )
+
+    def _pairs(self, sources, targets):
+        return sources * (self.adjacency.num_nodes + 1) + targets
+
+    def select(self, nodes, edges=None, edge_filter="both"):
+        """
+        Line segments of the edges with both (``edge_filter="both"``) or
+        either (``"either"``) of their endpoints in the nodes, restricted
+        to the edges dataframe if given
+        """
+        xp = self._xp
+        mask = xp.zeros(self.adjacency.num_nodes, dtype="bool")
+        if len(nodes) > 0:
+            mask[self.adjacency.node_rows(nodes[self.node_id])] = True
+        if edge_filter == "either":
+            keep = mask[self.sources] | mask[self.targets]
+        else:
+            keep = mask[self.sources] & mask[self.targets]
+        if edges is not None:
+            sources, targets = (
+                self.adjacency.node_rows(edges[col], keep_missing=True)
+                for col in self.edge_columns
+            )
+            keep &= xp.isin(
+                self._pairs(self.sources, self.targets),
+                self._pairs(sources, targets),
+            )
+        ids = xp.flatnonzero(keep)
+        # matches calc_connected_edges, which leaves out a single edge
+        if len(ids) <= 1:
+            return _empty_connected_edges(*self.columns)
+        rows = (3 * ids[:, None] + xp.arange(3)[None, :]).ravel()
+        return self.segments.iloc[rows]
+
+
+def calc_connected_edges(
+    nodes,
+    edges,
+    node_x,
+    node_y,
+    node_id,
+    edge_source,
+    edge_target,
+    edge_aggregate_col,
+    node_x_dtype,
+    node_y_dtype,
+    edge_render_type="direct",
+    curve_params=None,
+):
+    """
+    calculate directly connected edges
+    nodes: cudf.DataFrame/dask_cudf.DataFrame
+    edges: cudf.DataFrame/dask_cudf.DataFrame
+    edge_type: direct/curved
+    """
+    connected_edges_df, connected_edge_columns = _connected_edges_table(
+        nodes,
+        edges,
+        node_x,
+        node_y,
+        node_id,
+        edge_source,
+        edge_target,
+        edge_aggregate_col,
+        node_x_dtype,
+        node_y_dtype,
+    )
 
     result = cudf.DataFrame()
 
@@ -391,8 +549,6 @@ def calc_connected_edges(
             )
 
     if get_df_size(result) == 0:
-        result = cudf.DataFrame({k: cp.nan for k in [node_x, node_y]})
-        if edge_aggregate_col is not None:
-            result[edge_aggregate_col] = cp.nan
+        result = _empty_connected_edges(node_x, node_y, edge_aggregate_col)
 
     return result
@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 from . import plots
@@ -26,6 +26,7 @@ def scatter(
     unselected_alpha=0.2,
     xaxis=False,
     yaxis=False,
+    use_data_tiles=False,
 ):
     """
     Parameters
@@ -104,6 +105,11 @@ def scatter(
     yaxis: bool, default False
         if True, displays the yaxis with labels
 
+    use_data_tiles: bool, default False
+        if True, box selections on the chart update the linked aggregate
+        charts from precomputed summed-area tables over a grid of the
+        chart's x/y plane, instead of re-aggregating all the filtered rows
+
     Returns
     -------
     A cudashader scatter plot of type:
@@ -131,6 +137,7 @@ def scatter(
         unselected_alpha=unselected_alpha,
         xaxis=xaxis,
         yaxis=yaxis,
+        use_data_tiles=use_data_tiles,
     )
 
     plot.chart_type = "scatter"
@@ -168,6 +175,7 @@ def graph(
     unselected_alpha=0.2,
     xaxis=False,
     yaxis=False,
+    edge_filter="both",
 ):
     """
     Parameters
@@ -279,6 +287,11 @@ def graph(
     yaxis: bool, default False
         if True, displays the yaxis with labels
 
+    edge_filter: str, default 'both'
+        edges displayed for the selected nodes, the edges with 'both' or
+        'either' of their endpoints selected ('either' applies to direct
+        edge rendering of cudf/pandas graphs)
+
     Returns
     -------
     A cudashader graph plot of type:
@@ -315,6 +328,7 @@ def graph(
         unselected_alpha=unselected_alpha,
         xaxis=xaxis,
         yaxis=yaxis,
+        edge_filter=edge_filter,
     )
 
     plot.chart_type = "graph"
@@ -339,6 +353,7 @@ def heatmap(
     unselected_alpha=0.2,
     xaxis=True,
     yaxis=True,
+    use_data_tiles=False,
 ):
     """
     Heatmap using default datashader.scatter plot with slight modifications.
@@ -411,6 +426,11 @@ def heatmap(
     yaxis: bool, default True
         if True, displays the yaxis with labels
 
+    use_data_tiles: bool, default False
+        if True, box selections on the chart update the linked aggregate
+        charts from precomputed summed-area tables over a grid of the
+        chart's x/y plane, instead of re-aggregating all the filtered rows
+
     Returns
     -------
     A cudashader heatmap (scatter object) of type:
@@ -438,6 +458,7 @@ def heatmap(
         unselected_alpha=unselected_alpha,
         xaxis=xaxis,
         yaxis=yaxis,
+        use_data_tiles=use_data_tiles,
     )
     plot.chart_type = "heatmap"
     return plot
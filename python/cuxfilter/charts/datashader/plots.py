@@ -10,6 +10,7 @@ from ..core.non_aggregate import (
 )
 from .custom_extensions import (
     CustomInspectTool,
+    EdgeTable,
     calc_connected_edges,
     InteractiveDatashaderPoints,
     InteractiveDatashaderLine,
@@ -155,8 +156,11 @@ class Graph(BaseGraph):
         else:
             self.nodes = dataframe.data
             self.edges = dataframe.edges
+            self._edge_table = self._build_edge_table(dataframe)
 
-        if self.edges is not None:
+        if self._edge_table is not None:
+            self.connected_edges = self._edge_table.select(self.nodes)
+        elif self.edges is not None:
             # update connected_edges value for datashaded edges
             self.connected_edges = calc_connected_edges(
                 self.nodes,
@@ -173,6 +177,30 @@ class Graph(BaseGraph):
                 self.curve_params,
             )
 
+    def _build_edge_table(self, cuxfilter_df):
+        """
+        EdgeTable of the graph for direct edge rendering of in-memory
+        graphs, None otherwise
+        """
+        adjacency = cuxfilter_df.graph_adjacency(
+            self.node_id, self.edge_source, self.edge_target
+        )
+        if adjacency is None or self.edge_render_type != "direct":
+            return None
+        return EdgeTable(
+            self.nodes,
+            self.edges,
+            adjacency,
+            self.node_x,
+            self.node_y,
+            self.node_id,
+            self.edge_source,
+            self.edge_target,
+            self.edge_aggregate_col,
+            self.x_dtype,
+            self.y_dtype,
+        )
+
     def generate_chart(self):
         """
         Description:
@@ -253,13 +281,19 @@ class Graph(BaseGraph):
 
         Ouput:
         """
+        selected_nodes = data
         if data is not None:
             if len(data) == 0:
                 data = cudf.DataFrame({k: cp.nan for k in self.nodes.columns})
 
         # update connected_edges value for datashaded edges
         # if display edge toggle is active
-        if self.display_edges._active:
+        if self.display_edges._active and self._edge_table is not None:
+            self.connected_edges = self._edge_table.select(
+                selected_nodes, edges, self.edge_filter
+            )
+            self.chart.update_data(data, self.connected_edges)
+        elif self.display_edges._active:
             self.connected_edges = calc_connected_edges(
                 data,
                 self.edges if edges is None else edges,
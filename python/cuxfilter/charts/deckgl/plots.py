@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2020-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2020-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 from ..core.aggregate import BaseChoropleth
@@ -197,7 +197,7 @@ class Choropleth(BaseChoropleth):
         reload chart
         ---
         """
-        self.calculate_source(data)
+        self.update_source(self.calculate_source(data))
 
     def map_indices_to_values(self, indices: list):
         """
@@ -9,7 +9,7 @@ from ..core.aggregate import BaseNumberChart
 from ..constants import (
     CUDF_DATETIME_TYPES,
 )
-from ...assets.cudf_utils import get_min_max
+from ...assets.predicates import Equality, Range, SetMembership
 from bokeh.models import ColumnDataSource
 import cudf
 import pandas as pd
@@ -98,8 +98,8 @@ class RangeSlider(BaseWidget):
         """
         initiate chart on dashboard creation
         """
-        self.min_value, self.max_value = get_min_max(
-            dashboard_cls._cuxfilter_df.data, self.x
+        self.min_value, self.max_value = (
+            dashboard_cls._cuxfilter_df.get_min_max(self.x)
         )
 
         self.generate_widget()
@@ -147,8 +147,7 @@ class RangeSlider(BaseWidget):
         """
         if self.chart.value != (self.chart.start, self.chart.end):
             min_temp, max_temp = self.chart.value
-            query = f"@{self.x}_min<={self.x}<=@{self.x}_max"
-            query_str_dict[self.name] = query
+            query_str_dict[self.name] = Range(self.x, min_temp, max_temp)
             query_local_variables_dict[self.x + "_min"] = min_temp
             query_local_variables_dict[self.x + "_max"] = max_temp
         else:
@@ -183,17 +182,13 @@ class DateRangeSlider(BaseWidget):
                 "DateRangeSlider: x-column type must be one of "
                 + str(CUDF_DATETIME_TYPES)
             )
-        self.min_value, self.max_value = get_min_max(
-            dashboard_cls._cuxfilter_df.data, self.x
+        self.min_value, self.max_value = (
+            dashboard_cls._cuxfilter_df.get_min_max(self.x)
         )
         if self.data_points is None:
-            _series = dashboard_cls._cuxfilter_df.data[self.x].value_counts()
-            self.data_points = (
-                _series.compute().shape[0]
-                if isinstance(_series, dask_cudf.Series)
-                else _series.shape[0]
-            )
-            del _series
+            self.data_points = dashboard_cls._cuxfilter_df.profile(
+                [self.x]
+            ).loc[self.x, "distinct"]
         self.compute_stride()
         self.generate_widget()
         self.add_events(dashboard_cls)
@@ -241,8 +236,7 @@ class DateRangeSlider(BaseWidget):
                 datetime.datetime.fromordinal(x.toordinal())
                 for x in self.chart.value
             )
-            query = f"@{self.x}_min<={self.x}<=@{self.x}_max"
-            query_str_dict[self.name] = query
+            query_str_dict[self.name] = Range(self.x, min_temp, max_temp)
             query_local_variables_dict[self.x + "_min"] = min_temp
             query_local_variables_dict[self.x + "_max"] = max_temp
         else:
@@ -258,7 +252,7 @@ class IntSlider(BaseWidget):
         """
         initiate chart on dashboard creation
         """
-        min, max = get_min_max(dashboard_cls._cuxfilter_df.data, self.x)
+        min, max = dashboard_cls._cuxfilter_df.get_min_max(self.x)
         self.min_value = int(min)
         self.max_value = int(max)
 
@@ -317,8 +311,7 @@ class IntSlider(BaseWidget):
             reference to dashboard.__cls__.query_dict
         """
         if len(str(self.chart.value)) > 0:
-            query = f"{self.x} == @{self.x}_value"
-            query_str_dict[self.name] = query
+            query_str_dict[self.name] = Equality(self.x, self.chart.value)
             query_local_variables_dict[self.x + "_value"] = self.chart.value
         else:
             query_str_dict.pop(self.name, None)
@@ -332,8 +325,8 @@ class FloatSlider(BaseWidget):
         """
         initiate chart on dashboard creation
         """
-        self.min_value, self.max_value = get_min_max(
-            dashboard_cls._cuxfilter_df.data, self.x
+        self.min_value, self.max_value = (
+            dashboard_cls._cuxfilter_df.get_min_max(self.x)
         )
         self.generate_widget()
         self.add_events(dashboard_cls)
@@ -390,8 +383,7 @@ class FloatSlider(BaseWidget):
             reference to dashboard.__cls__.query_dict
         """
         if len(str(self.chart.value)) > 0:
-            query = f"{self.x} == @{self.x}_value"
-            query_str_dict[self.name] = query
+            query_str_dict[self.name] = Equality(self.x, self.chart.value)
             query_local_variables_dict[self.x + "_value"] = self.chart.value
         else:
             query_str_dict.pop(self.name, None)
@@ -405,10 +397,15 @@ class MultiChoice(BaseWidget):
         """
         initiate chart on dashboard creation
         """
-        self.min_value, self.max_value = get_min_max(
-            dashboard_cls._cuxfilter_df.data, self.x
+        self.min_value, self.max_value = (
+            dashboard_cls._cuxfilter_df.get_min_max(self.x)
         )
         self.source = dashboard_cls._cuxfilter_df.data[self.x]
+        if self.label_map is None:
+            # choose among the labels of dictionary-encoded columns
+            label_map = dashboard_cls._cuxfilter_df.label_map(self.x)
+            if label_map is not None:
+                self.label_map = {v: k for k, v in label_map.items()}
         self.calc_list_of_values(dashboard_cls._cuxfilter_df.data)
         self.generate_widget()
         self.add_events(dashboard_cls)
@@ -474,21 +471,9 @@ class MultiChoice(BaseWidget):
         if len(self.chart.value) == 0:
             query_str_dict.pop(self.name, None)
         else:
-
-            def filter_source(s: cudf.Series, v: list):
-                if s.dtype == "object":
-                    return s.str.contains("|".join(v))
-                else:
-                    return s.isin(v)
-
-            if isinstance(self.source, dask_cudf.Series):
-                query_str_dict[self.name] = self.source.map_partitions(
-                    filter_source, self.chart.value
-                )
-            elif isinstance(self.source, cudf.Series):
-                query_str_dict[self.name] = filter_source(
-                    self.source, self.chart.value
-                )
+            # the options are the exact values of the column, string
+            # columns are filtered by membership as well
+            query_str_dict[self.name] = SetMembership(self.x, self.chart.value)
 
     def apply_theme(self, theme):
         """
@@ -530,17 +515,33 @@ class DataSizeIndicator(BaseNumberChart):
     def name(self):
         return f"{self.chart_type}_{self.title}"
 
+    @property
+    def source_columns(self):
+        # only the number of rows is read
+        return []
+
     def get_df_size(self, df):
         if isinstance(df, dask_cudf.DataFrame):
             return df.shape[0].compute()
         return df.shape[0]
 
+    def calculate_source(self, data):
+        """
+        number of selected rows of data
+        """
+        return self.get_df_size(data)
+
     def reload_chart(self, data):
         """
         reload chart
         """
-        source_dict = {"X": list([1]), "Y": list([self.get_df_size(data)])}
-        self.chart[0].value = int(source_dict["Y"][0])
+        self.update_source(self.calculate_source(data))
+
+    def update_source(self, size):
+        """
+        update chart with a precomputed number of selected rows
+        """
+        self.chart[0].value = int(size)
         self.chart[1].value = int((self.chart[0].value / self.max_value) * 100)
 
     def generate_chart(self, data):
@@ -549,10 +550,11 @@ class DataSizeIndicator(BaseNumberChart):
         """
         self.min_value = 0
         self.max_value = len(data)
+        self.unfiltered_source = self.calculate_source(data)
 
         self.chart = pn.WidgetBox(
             pn.indicators.Number(
-                value=int(self.get_df_size(data)),
+                value=int(self.unfiltered_source),
                 format="{value:,}",
                 font_size="18pt",
                 name=self.title,
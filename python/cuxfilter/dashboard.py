@@ -1,22 +1,37 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 from typing import Dict, Union
 import bokeh.embed.util as u
-import cudf
-import dask_cudf
 import panel as pn
 from panel.io.server import get_server
 from bokeh.embed import server_document
 import os
+import threading
 import urllib
 import warnings
-from collections import Counter
+from collections import Counter, deque
+import numpy as np
 
 from cuxfilter.charts.core import BaseChart, BaseWidget, ViewDataFrame
 from cuxfilter.layouts import single_feature
 from cuxfilter.charts.panel_widgets import data_size_indicator
 from cuxfilter.assets import get_open_port, cudf_utils
+from cuxfilter.assets.aggregation_plan import AggregationPlan
+from cuxfilter.assets.aggregate_cache import (
+    AggregateCache,
+    DEFAULT_AGGREGATE_CACHE_SIZE,
+)
+from cuxfilter.assets.crossfilter import CrossFilter, FilteredView
+from cuxfilter.assets.data_tiles import DataTiles
+from cuxfilter.assets.dimension import DeltaAggregates
+from cuxfilter.assets.document import UPDATE_STATS_SIZE, held_updates
+from cuxfilter.assets.predicates import Mask, Predicate, as_predicate
+from cuxfilter.assets.scheduler import (
+    DEFAULT_DEBOUNCE,
+    InteractionScheduler,
+    create_executor,
+)
 from cuxfilter.themes import default
 
 DEFAULT_NOTEBOOK_URL = "http://localhost:8888"
@@ -66,6 +81,60 @@ def _check_if_duplicates(charts):
         )
 
 
+# chart attributes updated by the user interactions, not chart parameters
+_INTERACTION_STATE = (
+    "box_selected_range",
+    "selected_indices",
+    "selected_values",
+    "x_range",
+    "y_range",
+)
+
+
+def _chart_data(data, chart):
+    """
+    data a chart is reloaded from: for a FilteredView, the filtered rows of
+    the columns the chart reads
+    """
+    if isinstance(data, FilteredView):
+        return data.frame(getattr(chart, "source_columns", None))
+    return data
+
+
+def _chart_sources(charts, data):
+    """
+    (chart, calculate_source result) of each chart
+    """
+    return [
+        (chart, chart.calculate_source(_chart_data(data, chart)))
+        for chart in charts
+    ]
+
+
+def _is_chart_param(value):
+    if isinstance(value, (list, tuple)):
+        return all(_is_chart_param(v) for v in value)
+    if isinstance(value, dict):
+        return all(_is_chart_param(v) for v in value.values())
+    return value is None or isinstance(
+        value, (str, int, float, bool, np.generic, type)
+    )
+
+
+def _chart_params(chart):
+    """
+    snapshot of the plain valued public attributes of an initiated chart,
+    compared to decide whether the chart needs to be initiated again
+    """
+    return sorted(
+        (name, value)
+        for name, value in vars(chart).items()
+        if not name.startswith("_")
+        and name not in _INTERACTION_STATE
+        and _is_chart_param(value)
+    )
+
+
 class DashBoard:
     """
     A cuxfilter GPU DashBoard object.
@@ -107,7 +176,7 @@ class DashBoard:
     """
 
     _charts: Dict[str, Union[BaseChart, BaseWidget, ViewDataFrame]]
-    _query_str_dict: Dict[str, str]
+    _query_str_dict: Dict[str, Union[str, Predicate]]
     _query_local_variables_dict = {}
     _dashboard = None
     _theme = None
@@ -121,39 +190,22 @@ class DashBoard:
         """
         Read-only propery queried_indices returns a merged index
         of all queried index columns present in self._query_str_dict
-        as a `cudf.Series` or `dask_cudf.Series`.
+        as a `cudf.Series`, `dask_cudf.Series` or `pandas.Series`.
 
         Returns None if no index columns are present.
 
         :meta private:
         """
-        result = None
-        df_module = (
-            cudf
-            if isinstance(self._cuxfilter_df.data, cudf.DataFrame)
-            else dask_cudf
-        )
-        selected_indices = {
-            key: value.reset_index(drop=True)
-            for (key, value) in self._query_str_dict.items()
-            if type(value)
-            in [
-                cudf.DataFrame,
-                dask_cudf.DataFrame,
-                cudf.Series,
-                dask_cudf.Series,
-            ]
-        }
-        if len(selected_indices) > 0:
-            result = (
-                df_module.concat(list(selected_indices.values()), axis=1)
-                .set_index(self._cuxfilter_df.data.index)
-                .fillna(False)
-                .all(axis=1)
+        with self._reload_lock:
+            self._sync_crossfilter()
+            return self._crossfilter.mask(
+                include=[
+                    key
+                    for (key, value) in self._query_str_dict.items()
+                    if isinstance(as_predicate(value), Mask)
+                ]
             )
 
-        return result
-
     def __init__(
         self,
         charts=[],
@@ -165,24 +217,41 @@ class DashBoard:
         data_size_widget=True,
         show_warnings=False,
         layout_array=None,
+        aggregate_cache_size=DEFAULT_AGGREGATE_CACHE_SIZE,
+        debounce=DEFAULT_DEBOUNCE,
+        executor="thread",
+        max_workers=None,
     ):
         self._cuxfilter_df = dataframe
         self._charts = dict()
         self._sidebar = dict()
         self._query_str_dict = dict()
+        self._crossfilter = CrossFilter(self._cuxfilter_df.data)
+        self._data_tiles = DataTiles()
+        self._delta_aggregates = DeltaAggregates()
+        self._aggregation_plan = None
+        self._aggregate_cache = AggregateCache(aggregate_cache_size)
+        self._scheduler = InteractionScheduler(debounce)
+        self._reload_lock = threading.RLock()
+        self._executor = create_executor(executor, max_workers)
+        self.measure_updates = False
+        self._update_stats = deque(maxlen=UPDATE_STATS_SIZE)
 
         # check if charts and sidebar lists contain cuxfilter.charts with
         # duplicate names
         _check_if_duplicates(charts)
         _check_if_duplicates(sidebar)
 
+        # profile all the columns used by the charts in a single pass, the
+        # charts read their ranges from the profile
+        self._profile_columns(charts + sidebar)
+
         # widgets can be places both in sidebar area AND chart area
         # but charts cannot be placed in the sidebar area due to size
         # and resolution constraints
         # process all main dashboard charts
         for chart in charts:
-            chart.initiate_chart(self)
-            chart._initialized = True
+            self._initiate_chart(chart)
             self._charts[chart.name] = chart
 
         # add data_size_indicator to sidebar if data_size_widget=True
@@ -192,8 +261,7 @@ class DashBoard:
         # process all sidebar widgets
         for chart in sidebar:
             if chart.is_widget:
-                chart.initiate_chart(self)
-                chart._initialized = True
+                self._initiate_chart(chart)
                 self._sidebar[chart.name] = chart
 
         self.title = title
@@ -275,12 +343,285 @@ class DashBoard:
                 notebook_url=self._notebook_url, port=self.server.port
             )
 
+    def _is_initiated(self, chart):
+        """
+        whether the chart is initiated for this dashboard and the current
+        data, and its parameters did not change since
+        """
+        init_state = getattr(chart, "_init_state", None)
+        if init_state is None or not chart._initialized:
+            return False
+        dashboard, data, params = init_state
+        try:
+            return (
+                dashboard is self
+                and data is self._cuxfilter_df.data
+                and bool(params == _chart_params(chart))
+            )
+        except (TypeError, ValueError):
+            return False
+
     def _reinit_all_charts(self):
-        self._query_str_dict = dict()
+        """
+        Initiate the charts that are new, or whose parameters or source data
+        changed since they were initiated, the other charts are kept as is.
+        """
+        charts = [
+            chart
+            for chart in self.charts.values()
+            if not self._is_initiated(chart)
+        ]
+        if len(charts) == 0:
+            return
+        self._data_tiles.clear()
+        self._delta_aggregates.clear()
+        self._aggregation_plan = None
+        self._profile_columns(charts)
+
+        for chart in charts:
+            self._query_str_dict.pop(chart.name, None)
+            self._aggregate_cache.discard(chart.name)
+            self._initiate_chart(chart)
+        if len(self._query_str_dict) > 0:
+            # the charts are initiated unfiltered, apply the filters of the
+            # other charts
+            self._reload_charts(include_cols=[chart.name for chart in charts])
+
+    def _profile_columns(self, charts):
+        """
+        Profile the source data columns the charts use, in a single pass
+        """
+        columns = []
+        for chart in charts:
+            for attr in ["x", "y", "aggregate_col", "node_x", "node_y"]:
+                value = getattr(chart, attr, None)
+                if isinstance(value, str):
+                    columns.append(value)
+                elif isinstance(value, (list, tuple)):
+                    columns.extend(v for v in value if isinstance(v, str))
+        self._cuxfilter_df.profile(columns, distinct=False)
+
+    def _initiate_chart(self, chart):
+        """
+        Initiate a chart over the unfiltered data, and keep its unfiltered
+        aggregate to reset the dashboard without recomputing it.
+        """
+        chart.initiate_chart(self)
+        chart._initialized = True
+        chart._init_state = (
+            self,
+            self._cuxfilter_df.data,
+            _chart_params(chart),
+        )
+        if getattr(chart, "unfiltered_source", None) is not None:
+            self._aggregate_cache.pin(
+                chart,
+                self._crossfilter.canonical_state(
+                    ignore=self._crossfilter.active_filters
+                ),
+                chart.unfiltered_source,
+            )
+
+    def _sync_crossfilter(self):
+        """
+        Update the cached per-chart filter masks with the current query
+        state, returns the names of the charts whose filter changed.
+        """
+        # copies, the query state may be updated by interactions while a
+        # scheduled reload runs
+        return self._crossfilter.update(
+            self._cuxfilter_df.data,
+            dict(self._query_str_dict),
+            dict(self._query_local_variables_dict),
+        )
+
+    def _spatial_index(self, x, y):
+        """
+        SpatialIndex of the x and y columns of the source data, built once
+        and rebuilt lazily when the source data changes, None for dask_cudf
+        data or columns that do not support one.
+        """
+        with self._reload_lock:
+            if self._crossfilter.data is not self._cuxfilter_df.data:
+                self._sync_crossfilter()
+            return self._crossfilter.spatial_index(x, y)
+
+    def _filtered_data(self, ignore_chart=""):
+        """
+        Source dataframe filtered by the current crossfiltered state of the
+        dashboard, reusing the cached masks of the unchanged charts.
 
-        for chart in self.charts.values():
-            chart.initiate_chart(self)
-            chart._initialized = True
+        Holds the reload lock, the crossfilter caches are also updated by
+        the scheduled reloads off the document thread.
+        """
+        ignore = (
+            [ignore_chart.name]
+            if isinstance(ignore_chart, (BaseChart, BaseWidget, ViewDataFrame))
+            else []
+        )
+        with self._reload_lock:
+            self._sync_crossfilter()
+            return self._crossfilter.filter(ignore=ignore)
+
+    def _prepare_data_tiles(self, chart):
+        """
+        Build the data tiles of a chart the user is interacting with, if the
+        chart uses data tiles and the current tiles are stale.
+        """
+        if not getattr(chart, "use_data_tiles", False):
+            return
+        with self._reload_lock:
+            self._sync_crossfilter()
+            state = self._crossfilter.state(ignore=[chart.name])
+            if not self._data_tiles.is_valid(chart, state):
+                self._data_tiles.build(
+                    chart,
+                    self.charts.values(),
+                    self._crossfilter.filter(ignore=[chart.name]),
+                    state,
+                )
+
+    def _sources_from_data_tiles(self, name, charts, updates):
+        """
+        Collect the sources of the charts that can be served from the data
+        tiles of the chart whose filter changed into updates, returns the
+        remaining charts.
+        """
+        if not self._data_tiles.serves(
+            name, self._crossfilter.state(ignore=[name])
+        ):
+            return charts
+        remaining = []
+        for chart in charts:
+            source = self._data_tiles.source(chart)
+            if source is None:
+                remaining.append(chart)
+            else:
+                updates.append((chart, source))
+        return remaining
+
+    def _sources_from_deltas(self, name, charts, updates):
+        """
+        Collect the sources of the charts that can be updated from the rows
+        that entered or left the moved range filter of the named chart into
+        updates, returns the remaining charts.
+        """
+        if not self._delta_aggregates.update(self._crossfilter, name):
+            return charts
+        remaining = []
+        for chart in charts:
+            source = self._delta_aggregates.source(chart)
+            if source is None:
+                remaining.append(chart)
+            else:
+                updates.append((chart, source))
+        return remaining
+
+    def _sources_from_cache(self, state, charts, updates):
+        """
+        Collect the cached sources of the charts for the filter state into
+        updates, returns the remaining charts.
+        """
+        remaining = []
+        for chart in charts:
+            source = (
+                self._aggregate_cache.get(chart, state)
+                if hasattr(chart, "update_source")
+                else None
+            )
+            if source is None:
+                remaining.append(chart)
+            else:
+                updates.append((chart, source))
+        return remaining
+
+    def _calculate_sources(self, data, state, charts, updates):
+        """
+        Compute the sources of the charts for the filtered data into
+        updates, concurrently on the dashboard executor. Charts without a
+        separate calculate_source are added with a None source, and are
+        reloaded from the data when the updates are applied.
+
+        data is a FilteredView, each chart only gathers the filtered rows of
+        the columns it reads. The charts the aggregation plan supports are
+        computed together, in a single pass over the filtered rows.
+        """
+        aggregates = [
+            chart for chart in charts if hasattr(chart, "update_source")
+        ]
+        for chart in charts:
+            if chart not in aggregates:
+                # gather the rows off the document thread
+                _chart_data(data, chart)
+                updates.append((chart, None))
+        if self._aggregation_plan is None:
+            self._aggregation_plan = AggregationPlan(
+                self.charts.values(), self._cuxfilter_df.data
+            )
+        planned = [
+            chart
+            for chart in aggregates
+            if self._aggregation_plan.supports(chart)
+        ]
+        tasks = [(self._aggregation_plan.compute, planned)] if planned else []
+        tasks.extend(
+            (_chart_sources, [chart])
+            for chart in aggregates
+            if chart not in planned
+        )
+        if self._executor is None or len(tasks) < 2:
+            results = (task(charts, data) for task, charts in tasks)
+        else:
+            futures = [
+                self._executor.submit(task, charts, data)
+                for task, charts in tasks
+            ]
+            results = (future.result() for future in futures)
+        for sources in results:
+            for chart, source in sources:
+                self._aggregate_cache.put(chart, state, source)
+                updates.append((chart, source))
+
+    def _apply_updates(self, updates, data):
+        """
+        Apply the computed chart sources to the chart models, in a single
+        document transaction
+        """
+        stats = self._update_stats if self.measure_updates else None
+        with held_updates(stats):
+            for chart, source in updates:
+                if source is None:
+                    chart.reload_chart(_chart_data(data, chart))
+                else:
+                    chart.update_source(source)
+
+    def cache_info(self):
+        """
+        Statistics of the cache of chart aggregates, used to serve repeated
+        filter states without touching the data.
+
+        Returns
+        -------
+        namedtuple with the cache ``hits``, ``misses``, memory budget
+        ``max_bytes`` and current size ``nbytes`` in bytes
+        """
+        return self._aggregate_cache.info()
+
+    def update_info(self):
+        """
+        Statistics of the browser updates of the last interactions of a
+        served dashboard, recorded while ``measure_updates`` is set to True.
+
+        The chart model changes of an interaction are held and sent as a
+        single combined message, instead of one message per change.
+
+        Returns
+        -------
+        list of namedtuples, one per interaction, with the number of model
+        change ``events``, the number of ``messages`` they were sent in and
+        the total message size ``nbytes`` in bytes
+        """
+        return list(self._update_stats)
 
     def _query(self, query_str):
         """
@@ -308,9 +649,13 @@ class DashBoard:
         ):
             popped_value = query_dict.pop(ignore_chart.name, None)
 
-        # extract string queries from query_dict,
-        # as self.query_dict also contains cudf.Series indices
-        str_queries_list = [x for x in query_dict.values() if type(x) is str]
+        # render the predicates as query strings, row selections and
+        # masks have no query string equivalent
+        str_queries_list = [
+            x if isinstance(x, str) else x.to_query_str()
+            for x in map(as_predicate, query_dict.values())
+        ]
+        str_queries_list = [x for x in str_queries_list if len(x) > 0]
         return_query_str = " and ".join(str_queries_list)
 
         # adding the popped value to the query_str_dict again
@@ -328,7 +673,9 @@ class DashBoard:
 
         Returns
         -------
-        cudf.DataFrame based on the current filtered state of the dashboard.
+        cudf.DataFrame based on the current filtered state of the dashboard,
+        with the downcast and dictionary-encoded columns restored to their
+        original dtypes.
 
         Examples
         --------
@@ -369,10 +716,10 @@ class DashBoard:
             print("final query", self._generate_query_str())
             if self.queried_indices is not None:
                 print("polygon selected using lasso selection tool")
-            return self._query(self._generate_query_str())
+            return self._cuxfilter_df.restore_dtypes(self._filtered_data())
         else:
             print("no querying done, returning original dataframe")
-            return self._cuxfilter_df.data
+            return self._cuxfilter_df.restore_dtypes(self._cuxfilter_df.data)
 
     def __str__(self):
         return self.__repr__()
@@ -559,6 +906,7 @@ class DashBoard:
             render_location="web-app",
             sidebar_width=sidebar_width,
             height=height,
+            busy_indicator=self._scheduler.busy_indicator,
         )
         try:
             self.server = self._get_server(
@@ -596,6 +944,7 @@ class DashBoard:
         """
         stop the bokeh server
         """
+        self._scheduler.shutdown()
         if self.server._stopped is False:
             self.server.stop()
             self.server._started = False
@@ -605,17 +954,71 @@ class DashBoard:
     def _reload_charts(self, data=None, include_cols=[], ignore_cols=[]):
         """
         Reload charts with current self._cuxfilter_df.data state.
+
+        In a served dashboard, reloads of the current filtered state are
+        handed to the interaction scheduler: bursts of interactions are
+        debounced and coalesced, and run off the bokeh event loop.
         """
         if data is None:
-            # get current data as per the active queries
-            data = self._query(self._generate_query_str())
+            self._scheduler.submit(
+                (tuple(include_cols), tuple(ignore_cols)),
+                self._reload_charts_now,
+                None,
+                include_cols,
+                ignore_cols,
+            )
+        else:
+            self._reload_charts_now(data, include_cols, ignore_cols)
+
+    def _reload_charts_now(self, data, include_cols, ignore_cols):
         if len(include_cols) == 0:
             include_cols = self.charts.keys()
-        # reloading charts as per current data state
-        for chart in self.charts.values():
+        charts = [
+            chart
+            for chart in self.charts.values()
             if (
                 chart.name not in ignore_cols
                 and chart.name in include_cols
                 and hasattr(chart, "reload_chart")
+            )
+        ]
+        with self._reload_lock:
+            self._reload(data, charts)
+
+    def _reload(self, data, charts):
+        if data is not None:
+            self._apply_updates([(chart, None) for chart in charts], data)
+            return
+        updates = []
+        changed = self._sync_crossfilter()
+        state = self._crossfilter.canonical_state()
+        charts = self._sources_from_cache(state, charts, updates)
+        if len(changed) == 1 and len(charts) > 0:
+            # a single chart filter changed, serve what is possible from its
+            # data tiles, or from the rows its moved range let in or out
+            name = changed.pop()
+            charts = self._sources_from_data_tiles(name, charts, updates)
+            if len(charts) > 0:
+                charts = self._sources_from_deltas(name, charts, updates)
+        if len(charts) > 0 and not self._scheduler.cancelled():
+            # current filtered view as per the active queries, the charts
+            # gather the columns they read only
+            data = self._crossfilter.view()
+            self._calculate_sources(data, state, charts, updates)
+            if (
+                self._crossfilter.has_dimensions
+                and self._delta_aggregates.state != self._crossfilter.state()
             ):
-                chart.reload_chart(data)
+                # a range filter is being dragged, keep the aggregates of
+                # the current state for its next moves
+                self._delta_aggregates.build(
+                    self.charts.values(),
+                    self._cuxfilter_df.data,
+                    data,
+                    self._crossfilter.state(),
+                )
+        if self._scheduler.cancelled():
+            # a newer reload was requested, which supersedes this one
+            return
+        # the chart models are updated on the bokeh document thread
+        self._scheduler.run_on_document(self._apply_updates, updates, data)
@@ -1,8 +1,11 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import cudf
 import dask_cudf
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
 import pyarrow as pa
 from typing import Type
 
@@ -10,6 +13,81 @@ from cuxfilter.dashboard import DashBoard
 from cuxfilter.layouts import single_feature
 from cuxfilter.themes import default
 from cuxfilter.assets import notebook_assets
+from cuxfilter.assets.aggregate_cache import DEFAULT_AGGREGATE_CACHE_SIZE
+from cuxfilter.assets.graph_adjacency import (
+    GraphAdjacency,
+    supports_graph_adjacency,
+)
+from cuxfilter.assets.cudf_utils import (
+    datetime_dask_fix,
+    dictionary_encode,
+    is_string_dtype,
+)
+from cuxfilter.assets.scheduler import DEFAULT_DEBOUNCE
+from cuxfilter.charts.constants import CUDF_DATETIME_TYPES
+
+PROFILE_FIELDS = ("dtype", "min", "max", "null_count", "distinct")
+DOWNCAST_FIELDS = ("dtype", "downcast_dtype", "nbytes", "downcast_nbytes")
+# string columns with at most this many distinct values are
+# dictionary-encoded by DataFrame.downcast
+DOWNCAST_MAX_CATEGORIES = 2**15
+
+
+def _narrow_dtype(dtype, min, max):
+    """
+    narrowest dtype holding the [min, max] range of a numeric column of
+    dtype, None if dtype cannot be narrowed
+    """
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype) or pd.isna(min):
+        return None
+    if dtype.kind in "iu":
+        candidates = ["int8", "int16", "int32"]
+        if dtype.kind == "u":
+            candidates = ["uint8", "uint16", "uint32"]
+        for candidate in map(np.dtype, candidates):
+            info = np.iinfo(candidate)
+            if candidate.itemsize >= dtype.itemsize:
+                return None
+            if info.min <= min and max <= info.max:
+                return candidate
+    if dtype.kind == "f" and dtype.itemsize > 4:
+        limit = np.finfo("float32").max
+        if -limit <= min and max <= limit:
+            return np.dtype("float32")
+    return None
+
+
+def _lossless_casts(df, casts):
+    """
+    the casts of df columns to float32 that keep every value unchanged,
+    along with the integer casts (which hold the whole column range)
+    """
+    floats = [col for col, dtype in casts.items() if dtype.kind == "f"]
+    if len(floats) == 0:
+        return casts
+    exact = [
+        (
+            (df[col].astype(casts[col]).astype(df[col].dtype) == df[col])
+            | df[col].isna()
+        ).all()
+        for col in floats
+    ]
+    if isinstance(df, dask_cudf.DataFrame):
+        exact = dd.compute(*exact)
+    lossy = {col for col, ok in zip(floats, exact) if not ok}
+    return {col: dtype for col, dtype in casts.items() if col not in lossy}
+
+
+def _memory_usage(df, columns):
+    """
+    column -> bytes used by the columns of df
+    """
+    usage = df[columns].memory_usage(deep=True, index=False)
+    if isinstance(df, dask_cudf.DataFrame):
+        usage = usage.compute()
+    if hasattr(usage, "to_pandas"):
+        usage = usage.to_pandas()
+    return usage.to_dict()
 
 
 def read_arrow(source):
@@ -30,7 +108,9 @@ class DataFrame:
     edges: Type[cudf.DataFrame] = None
 
     @classmethod
-    def from_arrow(cls, dataframe_location):
+    def from_arrow(
+        cls, dataframe_location, encode_strings=False, downcast=False
+    ):
         """
         read an arrow file from disk as cuxfilter.DataFrame
 
@@ -38,6 +118,14 @@ class DataFrame:
         ----------
         dataframe_location: str or arrow in-memory table
 
+        encode_strings: bool or list, default False
+            dictionary-encode the string columns, see
+            ``cuxfilter.DataFrame.from_dataframe``
+
+        downcast: bool or list, default False
+            narrow the dtypes of all (True) or the listed columns, see
+            ``cuxfilter.DataFrame.downcast``
+
         Returns
         -------
         cuxfilter.DataFrame object
@@ -61,10 +149,10 @@ class DataFrame:
             df = cudf.DataFrame.from_arrow(read_arrow(dataframe_location))
         else:
             df = cudf.DataFrame.from_arrow(dataframe_location)
-        return cls(df)
+        return cls(df, encode_strings=encode_strings, downcast=downcast)
 
     @classmethod
-    def from_dataframe(cls, dataframe):
+    def from_dataframe(cls, dataframe, encode_strings=False, downcast=False):
         """
         create a cuxfilter.DataFrame from cudf.DataFrame/dask_cudf.DataFrame
         (zero-copy reference)
@@ -73,6 +161,23 @@ class DataFrame:
         ----------
         dataframe_location: cudf.DataFrame or dask_cudf.DataFrame
 
+        encode_strings: bool or list, default False
+            dictionary-encode the string columns (True) or the listed
+            columns. Each column is replaced by the int32 codes of its
+            values in the sorted list of its distinct values (a copy of the
+            dataframe is made), so the charts and widgets filter and group
+            on integer codes. The bar and histogram charts and the
+            multi_select and drop_down widgets display the labels of the
+            codes, other charts see the codes. Columns matched against
+            external keys, like the x column of a choropleth, should not be
+            encoded
+
+        downcast: bool or list, default False
+            narrow the dtypes of all (True) or the listed columns to the
+            smallest ones holding their values, see
+            ``cuxfilter.DataFrame.downcast``. The report of the bytes saved
+            is kept in ``downcast_report``
+
         Returns
         -------
         cuxfilter.DataFrame object
@@ -92,8 +197,19 @@ class DataFrame:
         >>> )
         >>> cux_df = cuxfilter.DataFrame.from_dataframe(cudf_df)
 
+        Dictionary-encode the string columns
+
+        >>> cudf_df = cudf.DataFrame({'state': ['CA', 'NY', 'CA', 'TX']})
+        >>> cux_df = cuxfilter.DataFrame.from_dataframe(
+        >>>     cudf_df, encode_strings=True
+        >>> )
+        >>> cux_df.data['state'].to_pandas().tolist()
+        [0, 1, 0, 2]
+        >>> cux_df.label_map('state')
+        {0: 'CA', 1: 'NY', 2: 'TX'}
+
         """
-        return cls(dataframe)
+        return cls(dataframe, encode_strings=encode_strings, downcast=downcast)
 
     @classmethod
     def load_graph(cls, graph):
@@ -159,8 +275,342 @@ class DataFrame:
             "Expected value for graph - (nodes[cuDF], edges[cuDF])"
         )
 
-    def __init__(self, data):
+    def __init__(self, data, encode_strings=False, downcast=False):
+        self.dictionaries = {}
+        self.original_dtypes = {}
+        self.downcast_report = None
+        if encode_strings:
+            columns = None if encode_strings is True else list(encode_strings)
+            dtypes = data.dtypes.to_dict()
+            data, self.dictionaries = dictionary_encode(data, columns)
+            self.original_dtypes = {
+                col: dtypes[col] for col in self.dictionaries
+            }
         self.data = data
+        self._profile = {}
+        self._profile_data = data
+        self._adjacency = {}
+        if downcast:
+            self.downcast_report = self.downcast(
+                None if downcast is True else list(downcast)
+            )
+
+    def graph_adjacency(
+        self, node_id="vertex", edge_source="source", edge_target="target"
+    ):
+        """
+        GraphAdjacency of the nodes and edges of a graph (see
+        ``load_graph``), for the neighbor inspection of the graph charts.
+
+        The adjacency is built once per node id and edge columns, and
+        rebuilt if the nodes or edges are replaced. None for dask_cudf
+        graphs and dataframes without edges.
+        """
+        if self.edges is None or not supports_graph_adjacency(
+            self.data, self.edges
+        ):
+            return None
+        key = (node_id, edge_source, edge_target)
+        cached = self._adjacency.get(key)
+        if (
+            cached is None
+            or cached[0] is not self.data
+            or cached[1] is not self.edges
+        ):
+            cached = (
+                self.data,
+                self.edges,
+                GraphAdjacency(
+                    self.data[node_id],
+                    self.edges[edge_source],
+                    self.edges[edge_target],
+                ),
+            )
+            self._adjacency[key] = cached
+        return cached[2]
+
+    def label_map(self, col_name):
+        """
+        code -> label dict of a dictionary-encoded column, None for the
+        other columns
+        """
+        if col_name not in self.dictionaries:
+            return None
+        return dict(enumerate(self.dictionaries[col_name].tolist()))
+
+    def downcast(self, columns=None):
+        """
+        Narrow the dtypes of the columns to the smallest ones holding their
+        values, read from the column profiles:
+
+        - integer columns to int8, int16 or int32 (uint for unsigned ones)
+        - float64 columns to float32, when all their values round-trip
+          through float32 unchanged
+        - string columns with up to DOWNCAST_MAX_CATEGORIES distinct values
+          are dictionary-encoded (see ``from_dataframe``)
+
+        The original dtypes are kept in ``original_dtypes``, the profiles
+        keep the min and max in the original dtypes and
+        ``restore_dtypes`` casts (and decodes) the columns back.
+
+        Parameters
+        ----------
+        columns: list, default None
+            columns to downcast, all the columns of the dataframe by default
+
+        Returns
+        -------
+        pandas.DataFrame indexed by the downcast columns, with their
+        original and new dtypes and their sizes in bytes before and after
+
+        Examples
+        --------
+        >>> import cudf
+        >>> import cuxfilter
+        >>> df = cudf.DataFrame(
+        >>>     {'key': [0, 1, 2, 3], 'lat': [40.5, 40.75, 40.25, 41.0]}
+        >>> )
+        >>> cux_df = cuxfilter.DataFrame.from_dataframe(df)
+        >>> cux_df.downcast()
+               dtype downcast_dtype  nbytes  downcast_nbytes
+        key    int64           int8      32                4
+        lat  float64        float32      32               16
+        """
+        if columns is None:
+            columns = list(self.data.columns)
+        profiles = self._column_profiles(
+            [col for col in columns if col not in self.dictionaries]
+        )
+        # only the string columns need their distinct values counted
+        self._column_profiles(
+            [
+                col
+                for col, profile in profiles.items()
+                if is_string_dtype(profile["dtype"])
+            ],
+            distinct=True,
+        )
+        casts, encode = {}, []
+        for col, profile in profiles.items():
+            if is_string_dtype(profile["dtype"]):
+                if profile["distinct"] <= DOWNCAST_MAX_CATEGORIES:
+                    encode.append(col)
+                continue
+            dtype = _narrow_dtype(
+                profile["dtype"], profile["min"], profile["max"]
+            )
+            if dtype is not None:
+                casts[col] = dtype
+        # float equality predicates compare against the original literals
+        casts = _lossless_casts(self.data, casts)
+        changed = list(casts) + encode
+        if len(changed) == 0:
+            return pd.DataFrame(columns=DOWNCAST_FIELDS)
+
+        nbytes = _memory_usage(self.data, changed)
+        dtypes = {col: self.data[col].dtype for col in changed}
+        data = self.data.astype(casts) if casts else self.data
+        if encode:
+            data, dictionaries = dictionary_encode(data, encode)
+            self.dictionaries.update(dictionaries)
+        downcast_nbytes = _memory_usage(data, changed)
+        self.original_dtypes.update(dtypes)
+        self.data = data
+        return pd.DataFrame(
+            [
+                [
+                    dtypes[col],
+                    data[col].dtype,
+                    nbytes[col],
+                    downcast_nbytes[col],
+                ]
+                for col in changed
+            ],
+            index=changed,
+            columns=DOWNCAST_FIELDS,
+        )
+
+    def restore_dtypes(self, df):
+        """
+        df with the downcast or dictionary-encoded columns cast back to
+        their original dtypes, and their labels decoded
+        """
+        columns = [col for col in self.original_dtypes if col in df.columns]
+        if len(columns) == 0:
+            return df
+        df = df.copy()
+        for col in columns:
+            dtype = self.original_dtypes[col]
+            if col in self.dictionaries:
+                labels = self.label_map(col)
+                if isinstance(df, dask_cudf.DataFrame):
+                    df[col] = df[col].map(labels, meta=(col, dtype))
+                else:
+                    df[col] = df[col].map(labels)
+            df[col] = df[col].astype(dtype)
+        return df
+
+    def _column_profiles(self, columns, distinct=False):
+        """
+        per column profile dicts of columns, computing the missing ones in
+        a single pass over the data. The distinct counts are only computed
+        with distinct=True.
+        """
+        if self._profile_data is not self.data:
+            self._profile = {}
+            self._profile_data = self.data
+        missing = [
+            col
+            for col in dict.fromkeys(columns)
+            if col not in self._profile and col in self.data.columns
+        ]
+        if len(missing) > 0:
+            self._profile.update(self._reduce_profiles(missing))
+        if distinct:
+            self._count_distinct(
+                [
+                    col
+                    for col in dict.fromkeys(columns)
+                    if "distinct" not in self._profile[col]
+                ]
+            )
+        return {col: self._profile[col] for col in columns}
+
+    def _reduce_profiles(self, columns):
+        """
+        dtype, min, max and null count of columns: one compute for
+        dask_cudf dataframes, one min/max aggregation per dtype (cudf
+        reduces columns of a common dtype together) and one count
+        otherwise
+        """
+        data = self.data
+        if isinstance(data, dask_cudf.DataFrame):
+            reductions = dd.compute(
+                *[
+                    reduction
+                    for col in columns
+                    for reduction in (
+                        data[col].min(),
+                        data[col].max(),
+                        data[col].isna().sum(),
+                    )
+                ]
+            )
+            reductions = {
+                col: reductions[3 * i : 3 * i + 3]
+                for i, col in enumerate(columns)
+            }
+        else:
+            groups = {}
+            for col in columns:
+                groups.setdefault(data[col].dtype, []).append(col)
+            null_counts = len(data) - data[columns].count()
+            if hasattr(null_counts, "to_pandas"):
+                null_counts = null_counts.to_pandas()
+            reductions = {}
+            for group in groups.values():
+                ranges = data[group].agg(["min", "max"])
+                if hasattr(ranges, "to_pandas"):
+                    ranges = ranges.to_pandas()
+                for col in group:
+                    reductions[col] = (
+                        ranges.at["min", col],
+                        ranges.at["max", col],
+                        null_counts[col],
+                    )
+
+        profiles = {}
+        for col in columns:
+            min, max, null_count = reductions[col]
+            dtype = data[col].dtype
+            if dtype in CUDF_DATETIME_TYPES and not isinstance(
+                data, pd.DataFrame
+            ):
+                # numpy.datetime64 values, as cudf Series reductions return
+                min, max = datetime_dask_fix(min, max)
+            original = self.original_dtypes.get(col)
+            if original is not None and original.kind in "iuf":
+                # charts compute bins and strides from the min and max,
+                # keep them in the original (wider) dtype
+                min, max = original.type(min), original.type(max)
+            profiles[col] = {
+                "dtype": dtype,
+                "min": min,
+                "max": max,
+                "null_count": int(null_count),
+            }
+        return profiles
+
+    def _count_distinct(self, columns):
+        """
+        add the number of distinct values of columns to their profiles,
+        approximate for dask_cudf dataframes
+        """
+        if len(columns) == 0:
+            return
+        if isinstance(self.data, dask_cudf.DataFrame):
+            counts = dd.compute(
+                *[self.data[col].dropna().nunique_approx() for col in columns]
+            )
+        else:
+            counts = [self.data[col].nunique() for col in columns]
+        for col, count in zip(columns, counts):
+            self._profile[col]["distinct"] = int(count)
+
+    def profile(self, columns=None, distinct=True):
+        """
+        Profile the columns of the dataframe: dtype, min, max, null count
+        and number of distinct values (approximate for dask_cudf
+        dataframes).
+
+        The min, max and null counts of all the columns are computed
+        together (a single compute for dask_cudf dataframes), and the
+        profiles are kept for the dashboard charts, which read their
+        ranges from them instead of reducing the data again. The distinct
+        counts take a pass per column, and are only computed when
+        requested.
+
+        Parameters
+        ----------
+        columns: list, default None
+            columns to profile, all the columns of the dataframe by default
+        distinct: bool, default True
+            whether to count the distinct values of the columns, the
+            ``distinct`` column is left out otherwise
+
+        Returns
+        -------
+        pandas.DataFrame indexed by column name
+
+        Examples
+        --------
+        >>> import cudf
+        >>> import cuxfilter
+        >>> df = cudf.DataFrame(
+        >>>     {'key': [0, 1, 2, 2], 'val': [1.0, None, 3.0, 4.0]}
+        >>> )
+        >>> cuxfilter.DataFrame.from_dataframe(df).profile()
+               dtype  min  max  null_count  distinct
+        key    int64  0.0  2.0           0         3
+        val  float64  1.0  4.0           1         3
+        """
+        if columns is None:
+            columns = list(self.data.columns)
+        columns = [col for col in columns if col in self.data.columns]
+        profiles = self._column_profiles(columns, distinct=distinct)
+        fields = PROFILE_FIELDS if distinct else PROFILE_FIELDS[:-1]
+        return pd.DataFrame(
+            [[profiles[col][f] for f in fields] for col in columns],
+            index=columns,
+            columns=fields,
+        )
+
+    def get_min_max(self, col_name):
+        """
+        (min, max) of a column, from the column profile
+        """
+        profile = self._column_profiles([col_name])[col_name]
+        return profile["min"], profile["max"]
 
     def validate_dask_index(self, data):
         if isinstance(data, dask_cudf.DataFrame) and not (
@@ -184,6 +634,10 @@ class DataFrame:
         data_size_widget=True,
         warnings=False,
         layout_array=None,
+        aggregate_cache_size=DEFAULT_AGGREGATE_CACHE_SIZE,
+        debounce=DEFAULT_DEBOUNCE,
+        executor="thread",
+        max_workers=None,
     ):
         """
         Creates a cuxfilter.DashBoard object
@@ -209,6 +663,28 @@ class DataFrame:
             flag to disable or enable runtime warnings related to layouts,
             default False
 
+        aggregate_cache_size: int
+            memory budget in bytes of the LRU cache of chart aggregates,
+            used to serve repeated filter states without recomputing them,
+            default 256MB. 0 disables the cache
+
+        debounce: float
+            delay in seconds a served dashboard waits for further
+            interactions before reloading the charts, bursts of interactions
+            are coalesced into a single reload, default 0.05. None reloads
+            the charts synchronously on every interaction
+
+        executor: "thread", None or concurrent.futures.Executor
+            executor the aggregates of the charts are computed on when the
+            filters change, default "thread", a thread pool with
+            ``max_workers`` threads (default one per CPU core). None computes
+            them sequentially. The chart models are always updated from the
+            dashboard's own thread. Charts are not picklable, so the executor
+            must run its tasks in-process
+
+        max_workers: int
+            number of threads of the pool created for executor="thread"
+
         Examples
         --------
         >>> import cudf
@@ -246,4 +722,8 @@ class DataFrame:
             data_size_widget=data_size_widget,
             show_warnings=warnings,
             layout_array=layout_array,
+            aggregate_cache_size=aggregate_cache_size,
+            debounce=debounce,
+            executor=executor,
+            max_workers=max_workers,
         )
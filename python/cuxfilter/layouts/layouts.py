@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import re
@@ -75,6 +75,7 @@ class _LayoutBase:
         sidebar_width=280,
         width=1200,
         height=800,
+        busy_indicator=None,
     ):
         self._layout_array = layout_array
         self._render_location = render_location
@@ -110,6 +111,8 @@ class _LayoutBase:
             tmpl = pn.template.FastGridTemplate(**kwargs)
             self._process_widgets(widgets, tmpl)
             self._process_plots(plots, tmpl)
+            if busy_indicator is not None:
+                tmpl.header.append(busy_indicator)
 
         return tmpl
 
@@ -0,0 +1,133 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+from unittest import mock
+
+import cudf
+import dask_cudf
+import pandas as pd
+
+import cuxfilter
+from cuxfilter.assets.aggregate_cache import AggregateCache
+from cuxfilter.charts import bokeh
+
+from charts.utils import brush, initialize_df
+
+n_rows = 100
+df_args = {
+    "key": [i % 20 for i in range(n_rows)],
+    "cat": [i % 6 for i in range(n_rows)],
+}
+
+
+def test_lru_eviction():
+    charts = [mock.Mock(), mock.Mock(), mock.Mock()]
+    for i, chart in enumerate(charts):
+        chart.name = f"chart_{i}"
+    cache = AggregateCache(max_bytes=2 * 80)
+    for chart in charts[:2]:
+        cache.put(chart, ("state",), np.zeros(10))
+    assert cache.get(charts[0], ("state",)) is not None
+
+    # the least recently used aggregate is evicted
+    cache.put(charts[2], ("state",), np.zeros(10))
+    assert cache.get(charts[1], ("state",)) is None
+    assert cache.get(charts[0], ("state",)) is not None
+    assert cache.info() == (2, 1, 160, 160)
+
+    # aggregates larger than the budget are not cached
+    cache.put(charts[1], ("state",), np.zeros(100))
+    assert cache.get(charts[1], ("state",)) is None
+    # unhashable filter states are not cached
+    cache.put(charts[1], ([1],), np.zeros(1))
+    assert cache.get(charts[1], ([1],)) is None
+
+
+@pytest.mark.parametrize(
+    "df_type", [pd.DataFrame, cudf.DataFrame, dask_cudf.DataFrame]
+)
+def test_dashboard_cache(df_type):
+    df = initialize_df(df_type, df_args)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    key_chart, cat_chart = bokeh.bar("key"), bokeh.bar("cat")
+    key_chart.use_data_tiles = False
+    dashboard = cux_df.dashboard([key_chart, cat_chart])
+
+    brush(key_chart, dashboard, (2, 8))
+    expected = cat_chart.chart.source_df
+    brush(key_chart, dashboard, (5, 15))
+    hits, misses = dashboard.cache_info()[:2]
+
+    with mock.patch.object(
+        cat_chart, "calculate_source", wraps=cat_chart.calculate_source
+    ) as calculate_source:
+        # re-applying a previous brush is served from the cache
+        brush(key_chart, dashboard, (2, 8))
+        calculate_source.assert_not_called()
+        assert cat_chart.chart.source_df is expected
+        assert dashboard.cache_info().hits == hits + 3
+        assert dashboard.cache_info().misses == misses
+
+
+@pytest.mark.parametrize(
+    "df_type", [pd.DataFrame, cudf.DataFrame, dask_cudf.DataFrame]
+)
+def test_dashboard_reset(df_type):
+    df = initialize_df(df_type, df_args)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    key_chart, cat_chart = bokeh.bar("key"), bokeh.bar("cat")
+    dashboard = cux_df.dashboard([key_chart, cat_chart])
+    size_indicator = list(dashboard._sidebar.values())[0]
+    expected = cat_chart.chart.source_df
+
+    brush(cat_chart, dashboard, (1, 3))
+    brush(key_chart, dashboard, (5, 15))
+    cat_chart.get_reset_callback(dashboard)(None)
+    with (
+        mock.patch.object(
+            dashboard._crossfilter, "_compute_mask"
+        ) as compute_mask,
+        mock.patch.object(cat_chart, "calculate_source") as calculate_source,
+    ):
+        # resetting to the unfiltered state is served from the unfiltered
+        # aggregates computed when the charts were initiated
+        key_chart.get_reset_callback(dashboard)(None)
+        compute_mask.assert_not_called()
+        calculate_source.assert_not_called()
+
+    assert cat_chart.chart.source_df is expected
+    assert size_indicator.chart[0].value == n_rows
+
+
+def test_dashboard_cache_disabled():
+    df = initialize_df(pd.DataFrame, df_args)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    key_chart, cat_chart = bokeh.bar("key"), bokeh.bar("cat")
+    key_chart.use_data_tiles = False
+    dashboard = cux_df.dashboard([key_chart, cat_chart])
+    dashboard._aggregate_cache.max_bytes = 0
+
+    brush(key_chart, dashboard, (2, 8))
+    brush(key_chart, dashboard, (2, 8))
+    assert dashboard.cache_info().hits == 0
+    assert dashboard.cache_info().nbytes == 0
+
+
+@pytest.mark.parametrize("df_type", [pd.DataFrame, cudf.DataFrame])
+def test_mask_states_not_cached(df_type):
+    df = initialize_df(df_type, df_args)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    key_chart, cat_chart = bokeh.bar("key"), bokeh.bar("cat")
+    dashboard = cux_df.dashboard([key_chart, cat_chart])
+    cache = dashboard._aggregate_cache
+    cache.put(cat_chart, dashboard._crossfilter.canonical_state(), 1)
+
+    # each list or lasso selection is a new mask object, its aggregates
+    # would never be read again
+    dashboard._query_str_dict["lasso"] = df["key"] > 5
+    dashboard._reload_charts()
+    assert dashboard._crossfilter.canonical_state() is None
+    assert dashboard._crossfilter.canonical_state(ignore=["lasso"]) is not None
+    assert cache.info().nbytes == 8
@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+from unittest import mock
+
+import cudf
+import pandas as pd
+
+import cuxfilter
+from cuxfilter.assets.aggregation_plan import AggregationPlan
+from cuxfilter.assets.crossfilter import FilteredView
+from cuxfilter.charts import bokeh
+
+n_rows = 200
+df_args = {
+    "key": [i % 50 for i in range(n_rows)],
+    "val": [float(i % 13) if i % 11 else None for i in range(n_rows)],
+}
+
+
+def to_pandas(df):
+    if isinstance(df, cudf.DataFrame):
+        df = df.to_pandas()
+    return df.reset_index(drop=True)
+
+
+@pytest.mark.parametrize("df_type", [pd.DataFrame, cudf.DataFrame])
+def test_aggregation_plan(df_type):
+    df = df_type(df_args)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    charts = [
+        bokeh.bar("key"),
+        bokeh.bar("key", "val", aggregate_fn="mean", title="mean"),
+        bokeh.bar("key", "val", aggregate_fn="sum", title="sum"),
+        bokeh.bar("val", data_points=6),
+        bokeh.bar("key", "val", aggregate_fn="max", title="max"),
+    ]
+    dashboard = cux_df.dashboard(charts)
+    size_indicator = list(dashboard._sidebar.values())[0]
+    plan = AggregationPlan(dashboard.charts.values(), df)
+    assert [plan.supports(chart) for chart in charts] == [True] * 4 + [False]
+
+    mask = df["key"] >= 20
+    view = FilteredView(df, mask)
+    with mock.patch.object(
+        FilteredView, "__getitem__", wraps=view.__getitem__
+    ) as getitem:
+        results = plan.compute([*charts[:4], size_indicator], view)
+    # each column is gathered once for all the charts
+    assert sorted(c.args[0] for c in getitem.call_args_list) == ["key", "val"]
+
+    filtered = df[mask]
+    assert results[-1] == (size_indicator, len(filtered))
+    for chart, source in results[:-1]:
+        expected = chart.calculate_source(filtered)
+        if isinstance(expected, tuple):
+            np.testing.assert_array_equal(source[0], expected[0])
+            np.testing.assert_array_equal(source[1], expected[1])
+        else:
+            pd.testing.assert_frame_equal(
+                to_pandas(source), to_pandas(expected), check_dtype=False
+            )
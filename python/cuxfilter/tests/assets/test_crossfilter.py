@@ -0,0 +1,139 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from unittest import mock
+
+import cudf
+import dask_cudf
+import pandas as pd
+
+import cuxfilter
+from cuxfilter.assets import cudf_utils
+from cuxfilter.assets.crossfilter import CrossFilter
+from cuxfilter.charts import bokeh
+
+from charts.utils import initialize_df, to_pandas
+
+df_args = {
+    "key": [0, 1, 2, 3, 4, 5, 6, 7],
+    "val": [float(i + 10) for i in range(8)],
+}
+
+
+df_types = [pd.DataFrame, cudf.DataFrame, dask_cudf.DataFrame]
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_filter(df_type):
+    df = initialize_df(df_type, df_args)
+    local_dict = {"key_min": 2, "key_max": 6, "val_min": 13.0}
+    query_dict = {
+        "chart_1": "@key_min<=key<=@key_max",
+        "chart_2": "val>=@val_min",
+    }
+    cf = CrossFilter(df)
+
+    assert cf.update(df, query_dict, local_dict) == {"chart_1", "chart_2"}
+    assert to_pandas(cf.filter()).equals(
+        to_pandas(
+            cudf_utils.query_df(
+                df, " and ".join(query_dict.values()), local_dict
+            )
+        )
+    )
+    assert to_pandas(cf.filter(ignore=["chart_2"]))["key"].tolist() == [
+        2,
+        3,
+        4,
+        5,
+        6,
+    ]
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_view(df_type):
+    df = initialize_df(df_type, df_args)
+    cf = CrossFilter(df)
+    cf.update(df, {"chart_1": "key>=@key_min"}, {"key_min": 5})
+
+    view = cf.view()
+    assert len(view) == 3
+    # only the requested columns are gathered
+    assert list(view.frame(["val"]).columns) == ["val"]
+    assert to_pandas(view.frame(["val"]))["val"].tolist() == [15.0, 16.0, 17.0]
+    assert view.frame(["val"]) is view.frame(["val"])
+    key = view["key"]
+    if isinstance(key, dask_cudf.Series):
+        key = key.compute()
+    assert key.to_numpy().tolist() == [5, 6, 7]
+    assert to_pandas(view.frame()).equals(to_pandas(cf.filter()))
+    assert len(cf.view(ignore=["chart_1"])) == 8
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_update_recomputes_changed_filters_only(df_type):
+    df = initialize_df(df_type, df_args)
+    local_dict = {"key_min": 2, "key_max": 6, "val_min": 13.0}
+    query_dict = {
+        "chart_1": "@key_min<=key<=@key_max",
+        "chart_2": "val>=@val_min",
+    }
+    cf = CrossFilter(df)
+    cf.update(df, query_dict, local_dict)
+    cf.filter()
+
+    with mock.patch.object(
+        cf, "_compute_mask", wraps=cf._compute_mask
+    ) as compute_mask:
+        assert cf.update(df, query_dict, local_dict) == set()
+        cf.filter()
+        assert compute_mask.call_count == 0
+
+        local_dict["key_max"] = 4
+        assert cf.update(df, query_dict, local_dict) == {"chart_1"}
+        # masks are only computed once they are needed
+        assert compute_mask.call_count == 0
+        # the mask is computed with the values of the update
+        local_dict["key_max"] = 7
+        cf.filter()
+        assert compute_mask.call_count == 1
+
+    assert to_pandas(cf.filter())["key"].tolist() == [3, 4]
+
+    query_dict.pop("chart_1")
+    assert cf.update(df, query_dict, local_dict) == {"chart_1"}
+    assert cf.active_filters == ["chart_2"]
+    assert cf.state() == cf.state(ignore=["chart_1"])
+    assert to_pandas(cf.filter())["key"].tolist() == [3, 4, 5, 6, 7]
+
+
+@pytest.mark.parametrize("df_type", [pd.DataFrame, cudf.DataFrame])
+def test_positional_masks(df_type):
+    df = initialize_df(df_type, df_args)
+    df.index = df.index + 10
+    mask = df["key"].isin([1, 5]).reset_index(drop=True)
+    cf = CrossFilter(df)
+    cf.update(df, {"chart_1": mask.to_frame()}, {})
+
+    assert cf.mask().index.equals(df.index)
+    assert to_pandas(cf.filter())["key"].tolist() == [1, 5]
+    # a new selection object replaces the cached mask
+    cf.update(df, {"chart_1": df["key"] > 5}, {})
+    assert to_pandas(cf.filter())["key"].tolist() == [6, 7]
+
+
+def test_dashboard_pandas():
+    df = pd.DataFrame(df_args)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    bac = bokeh.bar("key")
+    dashboard = cux_df.dashboard([bac], title="test_title")
+    bac.box_selected_range = {"key_min": 1, "key_max": 3}
+    bac.compute_query_dict(
+        dashboard._query_str_dict, dashboard._query_local_variables_dict
+    )
+    dashboard._reload_charts()
+
+    assert dashboard._crossfilter.active_filters == [bac.name]
+    assert dashboard.export().equals(df[df.key.between(1, 3)])
+    assert list(bac.chart.source_df[0]) == [1, 2, 3]
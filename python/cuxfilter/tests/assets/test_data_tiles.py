@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+from unittest import mock
+
+import cudf
+import dask_cudf
+import pandas as pd
+
+import cuxfilter
+from cuxfilter.charts import bokeh, datashader
+
+from charts.utils import brush, initialize_df, to_pandas
+
+n_rows = 200
+df_args = {
+    "key": [i % 50 for i in range(n_rows)],
+    "cat": [i % 7 for i in range(n_rows)],
+    "val": [float(i % 13) if i % 11 else None for i in range(n_rows)],
+}
+
+
+def assert_source_equal(result, expected):
+    if isinstance(expected, tuple):
+        np.testing.assert_array_equal(result[0], expected[0])
+        np.testing.assert_array_equal(result[1], expected[1])
+    else:
+        pd.testing.assert_frame_equal(
+            to_pandas(result), to_pandas(expected), check_dtype=False
+        )
+
+
+@pytest.mark.parametrize(
+    "df_type", [pd.DataFrame, cudf.DataFrame, dask_cudf.DataFrame]
+)
+@pytest.mark.parametrize("data_points", [None, 10])
+def test_data_tiles(df_type, data_points):
+    df = initialize_df(df_type, df_args, npartitions=3)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    active = bokeh.bar("key", data_points=data_points)
+    passives = [
+        bokeh.bar("cat"),
+        bokeh.bar("cat", "val", aggregate_fn="mean", title="mean"),
+        bokeh.bar("cat", "val", aggregate_fn="sum", title="sum"),
+        bokeh.bar("cat", "val", aggregate_fn="count", title="count"),
+    ]
+    dashboard = cux_df.dashboard([active] + passives)
+    size_indicator = list(dashboard._sidebar.values())[0]
+
+    # filter on another chart, the tiles are built on the filtered data
+    passives[0].box_selected_range = {"cat_min": 1, "cat_max": 5}
+    passives[0].compute_query_dict(
+        dashboard._query_str_dict, dashboard._query_local_variables_dict
+    )
+    dashboard._reload_charts()
+
+    for x_selection in [
+        (3.2, 17.9),
+        (10, 10),
+        (40, 60),
+        (30, 20),
+        (4.6, 15.2),
+    ]:
+        with mock.patch.object(
+            dashboard._crossfilter,
+            "_compute_mask",
+            wraps=dashboard._crossfilter._compute_mask,
+        ) as compute_mask:
+            brush(active, dashboard, x_selection)
+            # all the charts are served from the tiles
+            assert dashboard._data_tiles.chart is active
+            if x_selection != (3.2, 17.9):
+                assert compute_mask.call_count == 0
+
+        # the brushed range is the filter as is, not snapped to the bins
+        assert active.box_selected_range == {
+            "key_min": x_selection[0],
+            "key_max": x_selection[1],
+        }
+        data = dashboard._filtered_data()
+        expected = df[df.cat.between(1, 5) & df.key.between(*x_selection)]
+        assert len(data) == len(expected)
+        for chart in [active] + passives:
+            assert_source_equal(
+                chart.chart.source_df, chart.calculate_source(data)
+            )
+        assert size_indicator.chart[0].value == len(data)
+
+
+def test_data_tiles_rebuild():
+    df = initialize_df(pd.DataFrame, df_args, npartitions=3)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    key_chart, cat_chart = bokeh.bar("key"), bokeh.bar("cat")
+    dashboard = cux_df.dashboard([key_chart, cat_chart])
+
+    brush(key_chart, dashboard, (0, 20))
+    state = dashboard._data_tiles.state
+    brush(key_chart, dashboard, (5, 30))
+    assert dashboard._data_tiles.state == state
+
+    # brushing another chart changes the active chart of the tiles
+    brush(cat_chart, dashboard, (2, 4))
+    assert dashboard._data_tiles.chart is cat_chart
+    brush(key_chart, dashboard, (5, 30))
+    assert dashboard._data_tiles.chart is key_chart
+    assert dashboard._data_tiles.state != state
+    assert_source_equal(
+        cat_chart.chart.source_df,
+        cat_chart.calculate_source(dashboard._filtered_data()),
+    )
+
+
+def test_data_tiles_disabled():
+    df = initialize_df(pd.DataFrame, df_args, npartitions=3)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    key_chart, cat_chart = bokeh.bar("key"), bokeh.bar("cat")
+    key_chart.use_data_tiles = False
+    dashboard = cux_df.dashboard([key_chart, cat_chart])
+
+    brush(key_chart, dashboard, (0, 20))
+    assert dashboard._data_tiles.chart is None
+    assert_source_equal(
+        cat_chart.chart.source_df,
+        cat_chart.calculate_source(dashboard._filtered_data()),
+    )
+
+
+@pytest.mark.parametrize(
+    "df_type", [pd.DataFrame, cudf.DataFrame, dask_cudf.DataFrame]
+)
+def test_summed_area_tiles(df_type):
+    df = initialize_df(df_type, df_args, npartitions=3)
+    df["lon"] = df["key"] * 0.37 + df["cat"]
+    df["lat"] = df["cat"] * 1.3 - df["key"] * 0.05
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    active = datashader.scatter("lon", "lat", use_data_tiles=True)
+    passives = [
+        bokeh.bar("cat"),
+        bokeh.bar("key", data_points=10),
+        bokeh.bar("cat", "val", aggregate_fn="mean", title="mean"),
+    ]
+    dashboard = cux_df.dashboard([active] + passives)
+    size_indicator = list(dashboard._sidebar.values())[0]
+
+    for x_selection, y_selection in [
+        ((1.3, 14.2), (-1.0, 5.6)),
+        ((-10, 100), (-10, 100)),
+        ((4.0, 6.5), (-1, 8)),
+        ((10, 24), (-1, 0.5)),
+    ]:
+        with mock.patch.object(
+            passives[0], "calculate_source"
+        ) as calculate_source:
+            active.get_box_select_callback(dashboard)(
+                bounds=None, x_selection=x_selection, y_selection=y_selection
+            )
+            # linked charts are served from the tiles
+            assert dashboard._data_tiles.chart is active
+            calculate_source.assert_not_called()
+
+        data = dashboard._filtered_data()
+        for chart in passives:
+            assert_source_equal(
+                chart.chart.source_df, chart.calculate_source(data)
+            )
+        assert size_indicator.chart[0].value == len(data)
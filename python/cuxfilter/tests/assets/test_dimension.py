@@ -0,0 +1,211 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+from unittest import mock
+
+import cudf
+import pandas as pd
+
+import cuxfilter
+from cuxfilter.assets.crossfilter import CrossFilter
+from cuxfilter.assets.dimension import Dimension, GroupIndex
+from cuxfilter.assets.predicates import Equality, Range, SetMembership
+from cuxfilter.charts import bokeh, panel_widgets
+
+from charts.utils import initialize_df
+
+n_rows = 200
+df_args = {
+    "key": [(i * 37) % 50 for i in range(n_rows)],
+    "val": [float(i % 13) if i % 7 else None for i in range(n_rows)],
+    "time": pd.date_range("2020-01-01", periods=n_rows, freq="h"),
+    "cat": [i % 6 for i in range(n_rows)],
+    "label": [["a", "b", None, "c"][i % 4] for i in range(n_rows)],
+}
+df_types = [pd.DataFrame, cudf.DataFrame]
+
+
+def to_numpy(arr):
+    if hasattr(arr, "to_pandas"):
+        arr = arr.to_pandas()
+    if hasattr(arr, "to_numpy"):
+        return arr.to_numpy(dtype="float64")
+    return np.asarray(arr.get() if hasattr(arr, "get") else arr)
+
+
+@pytest.mark.parametrize("df_type", df_types)
+@pytest.mark.parametrize(
+    "column, low, high",
+    [
+        ("key", 10, 30),
+        ("key", 10.5, 29.5),
+        ("val", 2.0, 7.0),
+        ("time", pd.Timestamp("2020-01-02"), pd.Timestamp("2020-01-04 12:00")),
+    ],
+)
+def test_dimension_mask(df_type, column, low, high):
+    df = initialize_df(df_type, df_args)
+    dimension = Dimension(df[column])
+    bounds = dimension.bounds(low, high)
+
+    expected = Range(column, low, high).mask(df).fillna(False)
+    expected = to_numpy(expected.values)
+    assert bounds[1] - bounds[0] == expected.sum()
+    assert np.array_equal(to_numpy(dimension.mask(bounds)), expected)
+
+    # moving the range only touches the rows between the bounds
+    new_bounds = dimension.bounds(low, high + (high - low) / 2)
+    entered, left = dimension.delta(bounds, new_bounds)
+    mask = to_numpy(dimension.mask(bounds))
+    mask[to_numpy(entered)] = True
+    mask[to_numpy(left)] = False
+    assert np.array_equal(mask, to_numpy(dimension.mask(new_bounds)))
+    assert len(entered) == new_bounds[1] - bounds[1]
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_crossfilter_moved_range(df_type):
+    df = initialize_df(df_type, df_args)
+    cf = CrossFilter(df)
+    other = {"cat": Range("cat", 1, 4)}
+    for low, high in [(5, 20), (10, 30), (12, 40)]:
+        query_dict = {"key": Range("key", low, high), **other}
+        with mock.patch.object(
+            cf, "_compute_mask", wraps=cf._compute_mask
+        ) as compute_mask:
+            cf.update(df, query_dict, {})
+            result = cf.filter()
+    # the range is indexed once dragged, and then moved in place
+    compute_mask.assert_not_called()
+    delta = cf.delta("key")
+    assert delta is not None
+    assert len(delta.entered) == int(((df.key > 30) & (df.key <= 40)).sum())
+    assert len(delta.left) == int(((df.key >= 10) & (df.key < 12)).sum())
+    expected = df[df.key.between(12, 40) & df.cat.between(1, 4)]
+    assert result.index.to_numpy().tolist() == (
+        expected.index.to_numpy().tolist()
+    )
+    # rows of the delta are checked against the other filters
+    assert to_numpy(cf.contains(delta.entered, ["key"])).tolist() == (
+        to_numpy(df.cat.iloc[delta.entered].between(1, 4).values).tolist()
+    )
+
+    # masks handed out before a move do not change under their readers
+    mask = cf._get_mask("key")
+    expected = to_numpy(mask.values).copy()
+    cf.update(df, {"key": Range("key", 0, 45), **other}, {})
+    cf.filter()
+    assert cf.delta("key") is not None
+    assert np.array_equal(to_numpy(mask.values), expected)
+
+
+@pytest.mark.parametrize("df_type", df_types)
+@pytest.mark.parametrize(
+    "column, values",
+    [
+        ("cat", [3]),
+        ("cat", [5, 0, 7]),
+        ("val", [2.0, 12.0]),
+        ("label", ["c", "a"]),
+        ("label", ["z"]),
+    ],
+)
+def test_group_index(df_type, column, values):
+    df = initialize_df(df_type, df_args)
+    index = GroupIndex(df[column])
+    rows = to_numpy(index.rows(values))
+
+    expected = df[column].isin(values).fillna(False)
+    expected = np.flatnonzero(to_numpy(expected.values))
+    assert rows.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_crossfilter_discrete_filters(df_type):
+    df = initialize_df(df_type, df_args)
+    cf = CrossFilter(df)
+    for query_dict in [
+        {"cat": Equality("cat", 1), "label": SetMembership("label", ["a"])},
+        {"cat": Equality("cat", 3), "label": SetMembership("label", ["a"])},
+        {"cat": Equality("cat", 2), "label": SetMembership("label", "bc")},
+    ]:
+        with mock.patch.object(
+            cf, "_compute_mask", wraps=cf._compute_mask
+        ) as compute_mask:
+            cf.update(df, query_dict, {})
+            result = cf.filter()
+    # the columns are indexed once the filters change again, and the
+    # selections are then read from the indexes
+    compute_mask.assert_not_called()
+    expected = df[(df.cat == 2) & df.label.isin(["b", "c"]).fillna(False)]
+    assert result.index.to_numpy().tolist() == (
+        expected.index.to_numpy().tolist()
+    )
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_dashboard_delta_aggregates(df_type):
+    df = initialize_df(df_type, df_args)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    slider = panel_widgets.range_slider("key")
+    cat_chart = bokeh.bar("cat")
+    val_chart = bokeh.bar("cat", "val", aggregate_fn="mean", title="mean")
+    dashboard = cux_df.dashboard([slider, cat_chart, val_chart])
+    size_indicator = list(dashboard._sidebar.values())[0]
+
+    for low, high in [(5, 20), (10, 30)]:
+        dashboard._query_str_dict[slider.name] = Range("key", low, high)
+        dashboard._reload_charts()
+    dashboard._query_str_dict[slider.name] = Range("key", 12, 40)
+    with (
+        mock.patch.object(cat_chart, "calculate_source") as cat_source,
+        mock.patch.object(val_chart, "calculate_source") as val_source,
+    ):
+        dashboard._reload_charts()
+        # the aggregates are updated from the rows that entered or left
+        cat_source.assert_not_called()
+        val_source.assert_not_called()
+
+    filtered = df[df.key.between(12, 40)]
+    assert size_indicator.chart[0].value == len(filtered)
+    for chart in [cat_chart, val_chart]:
+        result = chart.chart.source_df
+        expected = chart.calculate_source(filtered)
+        if isinstance(expected, tuple):
+            assert np.array_equal(result[0], expected[0])
+            assert np.array_equal(result[1], expected[1])
+        else:
+            assert np.allclose(
+                to_numpy(result), to_numpy(expected), equal_nan=True
+            )
+
+
+def test_delta_aggregates_rebuild():
+    df = initialize_df(pd.DataFrame, df_args)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    slider = panel_widgets.range_slider("key")
+    val_chart = bokeh.bar("cat", "val", aggregate_fn="mean", title="mean")
+    dashboard = cux_df.dashboard([slider, val_chart])
+
+    ranges = [(5, 20), (10, 30), (12, 31), (13, 32)]
+    delta_aggregates = dashboard._delta_aggregates
+    builds = []
+    with (
+        mock.patch("cuxfilter.assets.dimension.DELTA_REBUILD_UPDATES", 1),
+        mock.patch.object(
+            delta_aggregates, "build", wraps=delta_aggregates.build
+        ) as build,
+    ):
+        for low, high in ranges:
+            dashboard._query_str_dict[slider.name] = Range("key", low, high)
+            dashboard._reload_charts()
+            builds.append(build.call_count)
+    # built once the range is dragged, updated once, then rebuilt from the
+    # filtered data instead of accumulating float rounding errors
+    assert builds == [0, 1, 1, 2]
+    expected = val_chart.calculate_source(df[df.key.between(13, 32)])
+    assert np.allclose(
+        to_numpy(val_chart.chart.source_df), to_numpy(expected), equal_nan=True
+    )
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import mock
+
+import panel as pn
+from bokeh.document import Document
+from bokeh.models import ColumnDataSource
+from bokeh.protocol import Protocol
+from bokeh.protocol.messages.patch_doc import patch_doc
+from bokeh.server.connection import ServerConnection
+from bokeh.server.session import ServerSession
+
+from cuxfilter.assets import document
+from cuxfilter.assets.document import held_updates
+
+
+def test_held_updates():
+    doc = Document()
+    source = ColumnDataSource(data={"x": [1, 2]})
+    doc.add_root(source)
+    session = ServerSession("session", doc)
+    socket = mock.Mock()
+    ServerConnection(Protocol(), socket, mock.Mock(), session)
+    session._pending_writes = []
+    stats = []
+
+    with (
+        mock.patch.object(
+            type(pn.state), "curdoc", new_callable=mock.PropertyMock
+        ) as curdoc,
+        mock.patch.object(
+            Document, "session_context", new_callable=mock.PropertyMock
+        ) as session_context,
+        mock.patch.dict(pn.state._loaded, {doc: True}),
+    ):
+        curdoc.return_value = doc
+        session_context.return_value.session = None
+        with held_updates(stats):
+            source.data = {"x": [3, 4, 5]}
+            source.data = {"x": [3, 4, 5, 6]}
+            source.tags = ["filtered"]
+            # the changes are held until the transaction is done
+            assert not socket.send_message.called
+
+        # the stats are those of the messages the session sent
+        messages = [args[0] for args, _ in socket.send_message.call_args_list]
+        assert len(messages) > 0
+        assert stats[0].events == sum(
+            len(msg.content["events"]) for msg in messages
+        )
+        assert stats[0].messages == len(messages)
+        assert stats[0].nbytes == sum(map(document._message_nbytes, messages))
+
+        # nothing changed, nothing sent
+        with held_updates(stats):
+            pass
+        assert stats[1] == (0, 0, 0)
+
+        curdoc.return_value = None
+        with held_updates(stats):
+            source.data = {"x": [1]}
+
+    assert len(stats) == 2
+    # the message hook is removed once no document is recorded
+    assert patch_doc.create == document._create_patch_doc
@@ -1,11 +1,13 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
 
 from cuxfilter.assets.numba_kernels import gpu_histogram
 import cudf
+import dask_cudf
 import numpy as np
+import pandas as pd
 from numba import cuda
 
 from cuxfilter.charts.core.core_chart import BaseChart
@@ -62,6 +64,40 @@ def test_calc_value_counts(custom_binning, result):
     assert np.array_equal(_result, result)
 
 
+@pytest.mark.parametrize(
+    "series_type", [pd.Series, cudf.Series, dask_cudf.Series]
+)
+@pytest.mark.parametrize("dtype", ["int64", "float64"])
+def test_calc_dense_histogram(series_type, dtype):
+    x = pd.Series(
+        test_arr3 * 50 + [None], dtype="Int64" if dtype == "int64" else dtype
+    )
+    if series_type is not pd.Series:
+        x = cudf.from_pandas(x)
+        if series_type is dask_cudf.Series:
+            x = dask_cudf.from_cudf(x, npartitions=3)
+    bins = 8
+    min_value, max_value = min(test_arr3), max(test_arr3)
+    stride = (max_value - min_value) / bins
+    n_bins = int(round((max_value - min_value) / stride)) + 1
+
+    bin_values, counts = gpu_histogram.calc_value_counts(
+        x, stride, min_value, custom_binning=True, n_bins=n_bins
+    )
+    # every bin is returned, and the non-empty ones match the value counts
+    assert len(bin_values) == len(counts) == n_bins
+    expected = gpu_histogram.calc_value_counts(
+        cudf.Series(np.array(test_arr3 * 50)),
+        stride,
+        min_value,
+        custom_binning=True,
+    )
+    assert np.array_equal(
+        (bin_values[counts > 0], counts[counts > 0]), expected
+    )
+    assert counts.sum() == len(test_arr3) * 50
+
+
 @pytest.mark.parametrize(
     "aggregate_fn, result",
     [
@@ -97,6 +133,41 @@ def test_calc_groupby(aggregate_fn, result):
     )
 
 
+@pytest.mark.parametrize(
+    "df_type", [pd.DataFrame, cudf.DataFrame, dask_cudf.DataFrame]
+)
+def test_calc_groupby_multiple_aggregates(df_type):
+    pdf = pd.DataFrame(
+        {
+            "key": [1.0, 2.0, None, 1.0, 2.0, 3.0] * 3,
+            "a": [float(i) for i in range(18)],
+            "b": [5.0, None, 1.0, 2.0, 4.0, 8.0] * 3,
+            "c": list(range(18)),
+        }
+    )
+    df = pdf if df_type is pd.DataFrame else cudf.from_pandas(pdf)
+    if df_type is dask_cudf.DataFrame:
+        df = dask_cudf.from_cudf(df, npartitions=3)
+    bc = BaseChart()
+    bc.x = "key"
+    agg = {"a": "sum", "b": "mean", "c": "std"}
+
+    result = gpu_histogram.calc_groupby(bc, df, agg=agg)
+    if not isinstance(result, pd.DataFrame):
+        result = result.to_pandas()
+    expected = (
+        pdf.dropna(subset=["key"])
+        .groupby("key", sort=True, as_index=False)
+        .agg(agg)
+    )
+    assert list(result.columns) == ["key", "a", "b", "c"]
+    assert np.allclose(
+        result.to_numpy(dtype="float64"),
+        expected.to_numpy(dtype="float64"),
+        equal_nan=True,
+    )
+
+
 @pytest.mark.parametrize(
     "x, y, aggregate_fn, result",
     [
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+from unittest import mock
+
+import cudf
+import pandas as pd
+
+from cuxfilter import DashBoard, DataFrame
+from cuxfilter.charts.core.non_aggregate.core_graph import BaseGraph
+from cuxfilter.charts.datashader.custom_extensions.graph_inspect_widget import (  # noqa: E501
+    CustomInspectTool,
+)
+
+rng = np.random.default_rng(0)
+n_nodes, n_edges = 300, 900
+nodes_args = {
+    # node ids are not the row positions
+    "vertex": rng.permutation(n_nodes) * 3,
+    "x": rng.uniform(0, 10, n_nodes),
+    "y": rng.uniform(0, 10, n_nodes),
+}
+edges_args = {
+    # a few edges to ids that are not nodes, and self loops
+    "source": rng.integers(0, n_nodes + 10, n_edges) * 3,
+    "target": np.r_[rng.integers(0, n_nodes, n_edges - 5), [0, 3, 6, 9, 12]]
+    * 3,
+    "weight": rng.uniform(0, 1, n_edges),
+}
+df_types = [pd.DataFrame, cudf.DataFrame]
+
+
+def initialize_graph(df_type):
+    return df_type(nodes_args), df_type(edges_args)
+
+
+def graph_chart(nodes, edges):
+    chart = BaseGraph(edge_aggregate_col="weight")
+    chart.chart_type = "adjacency_test"
+    chart.nodes, chart.edges = nodes, edges
+    return chart
+
+
+def sort_frame(df):
+    if isinstance(df, cudf.DataFrame):
+        df = df.to_pandas()
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+
+@pytest.mark.parametrize("df_type", df_types)
+@pytest.mark.parametrize("hops", [1, 2])
+def test_query_graph_adjacency(df_type, hops):
+    nodes, edges = initialize_graph(df_type)
+    cux_df = DataFrame.load_graph((nodes, edges))
+    adjacency = cux_df.graph_adjacency()
+    # built once
+    assert cux_df.graph_adjacency() is adjacency
+    chart = graph_chart(nodes, edges)
+
+    selected = nodes[(nodes.x > 4) & (nodes.x < 5) & (nodes.y < 3)]
+    result_nodes, result_edges = chart.query_graph(
+        selected, nodes, edges, adjacency=adjacency, hops=hops
+    )
+    expected_nodes, expected_edges = chart.query_graph(
+        selected, nodes, edges, hops=hops
+    )
+    pd.testing.assert_frame_equal(
+        sort_frame(result_nodes), sort_frame(expected_nodes)
+    )
+    # the merges keep an edge once per selected endpoint
+    pd.testing.assert_frame_equal(
+        sort_frame(result_edges), sort_frame(expected_edges.drop_duplicates())
+    )
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_box_selection_inspect_neighbors(df_type):
+    nodes, edges = initialize_graph(df_type)
+    dashboard = DashBoard(dataframe=DataFrame.load_graph((nodes, edges)))
+    chart = graph_chart(nodes, edges)
+    chart.inspect_neighbors = CustomInspectTool(_active=True)
+    results = {}
+
+    def reload_chart(data, edges=None):
+        results["nodes"], results["edges"] = data, edges
+
+    chart.reload_chart = reload_chart
+    with mock.patch.object(BaseGraph, "concat") as concat:
+        chart.get_box_select_callback(dashboard)(None, (4, 5), (0, 3))
+        # the neighbors are read from the adjacency instead of merges
+        concat.assert_not_called()
+
+    selected = nodes[nodes.x.between(4, 5) & nodes.y.between(0, 3)]
+    expected_nodes, _ = chart.query_graph(selected, nodes, edges)
+    pd.testing.assert_frame_equal(
+        sort_frame(results["nodes"]), sort_frame(expected_nodes)
+    )
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+from unittest import mock
+
+import cudf
+import dask_cudf
+import pandas as pd
+
+from cuxfilter.assets import cudf_utils
+from cuxfilter.assets.crossfilter import CrossFilter
+from cuxfilter.assets.predicates import (
+    And,
+    Equality,
+    Mask,
+    Range,
+    SetMembership,
+)
+from cuxfilter.assets.selection import Selection
+
+from charts.utils import initialize_df, to_pandas
+
+df_args = {
+    "key": list(range(20)),
+    "val": [float(i % 7) if i % 5 else None for i in range(20)],
+}
+df_types = [pd.DataFrame, cudf.DataFrame, dask_cudf.DataFrame]
+
+
+@pytest.mark.parametrize("df_type", df_types)
+@pytest.mark.parametrize(
+    "predicate, query_str, local_dict",
+    [
+        (
+            Range("key", 3, 11),
+            "@key_min<=key<=@key_max",
+            {"key_min": 3, "key_max": 11},
+        ),
+        (Equality("val", 2.0), "val==2.0", {}),
+        (SetMembership("key", [1, 4, 9, 25]), "key in (1,4,9,25)", {}),
+        (
+            And(Range("key", 2, 15), Range("val", 1.0, 4.0)),
+            "@key_min<=key<=@key_max and @val_min<=val<=@val_max",
+            {"key_min": 2, "key_max": 15, "val_min": 1.0, "val_max": 4.0},
+        ),
+    ],
+)
+def test_predicate_mask(df_type, predicate, query_str, local_dict):
+    df = initialize_df(df_type, df_args)
+
+    assert predicate.to_query_str() == query_str
+    expected = cudf_utils.query_df(df, query_str, local_dict)
+    result = to_pandas(df[predicate.mask(df)])
+    assert result["key"].tolist() == to_pandas(expected)["key"].tolist()
+
+
+@pytest.mark.parametrize(
+    "query_str, local_dict",
+    [
+        ("@key_min<=key<=@key_max", {"key_min": 3, "key_max": 11}),
+        ("val==2.0", {}),
+        ("key in (1,4,9,25) or val>5", {}),
+    ],
+)
+def test_query_mask_public_fallback(query_str, local_dict):
+    df = initialize_df(cudf.DataFrame, df_args)
+    df.index = df.index * 3 + 7
+    expected = cudf_utils.query_mask(df, query_str, local_dict)
+    # without the private cudf query kernel, DataFrame.query is used
+    with mock.patch.object(cudf_utils, "query_execute", None):
+        mask = cudf_utils.query_mask(df, query_str, local_dict)
+    assert to_pandas(mask).tolist() == to_pandas(expected).tolist()
+    assert mask.index.equals(df.index)
+
+
+@pytest.mark.parametrize(
+    "predicate, query_str, local_dict",
+    [
+        (
+            Range(
+                "time",
+                pd.Timestamp("2020-01-03"),
+                np.datetime64("2020-01-09T12"),
+            ),
+            "@time_min<=time<=@time_max",
+            {
+                "time_min": pd.Timestamp("2020-01-03"),
+                "time_max": np.datetime64("2020-01-09T12"),
+            },
+        ),
+        (
+            Equality("time", np.datetime64("2020-01-05")),
+            "time=='2020-01-05 00:00:00'",
+            {},
+        ),
+    ],
+)
+def test_datetime_predicates(predicate, query_str, local_dict):
+    df = pd.DataFrame(
+        {"time": pd.date_range("2020-01-01", periods=20, freq="D")}
+    )
+    # datetime literals are quoted, the query string is a valid query
+    assert predicate.to_query_str() == query_str
+    expected = df.query(query_str, local_dict=local_dict)
+    assert len(expected) > 0
+    assert df[predicate.mask(df)].index.tolist() == expected.index.tolist()
+
+
+def test_datetime_literals():
+    values = [pd.Timestamp("2020-01-02"), np.datetime64("2020-01-07T06")]
+    assert SetMembership("time", values).to_query_str() == (
+        "time in ('2020-01-02 00:00:00','2020-01-07 06:00:00')"
+    )
+
+
+def test_predicate_key():
+    assert Range("key", 1, 2) == Range("key", 1, 2)
+    assert Range("key", 1, 2) != Range("key", 1, 3)
+    assert SetMembership("key", [1, 2]) != Equality("key", 1)
+    mask = pd.Series([True, False])
+    assert Mask(mask) == Mask(mask)
+    assert Mask(mask) != Mask(mask.copy())
+
+
+def test_crossfilter_short_circuit():
+    df = initialize_df(pd.DataFrame, df_args)
+    cf = CrossFilter(df)
+    cf.update(
+        df,
+        {
+            "chart_1": Range("key", 100, 200),
+            "chart_2": Mask(Selection.from_mask(df["key"] < 10)),
+            "chart_3": SetMembership("key", [1, 2, 3]),
+        },
+        {},
+    )
+    with mock.patch.object(
+        cf, "_compute_mask", wraps=cf._compute_mask
+    ) as compute_mask:
+        assert to_pandas(cf.filter()["key"]).tolist() == []
+        # the remaining masks are not needed once no row is left
+        assert compute_mask.call_count == 1
+
+    # known masks are combined from the most selective one
+    cf.update(df, {"chart_2": cf._filters["chart_2"][0]}, {})
+    cf.mask()
+    cf.update(
+        df,
+        {
+            "chart_2": cf._filters["chart_2"][0],
+            "chart_3": SetMembership("key", [1, 2, 3]),
+        },
+        {},
+    )
+    cf.mask()
+    assert sorted(cf._filters, key=cf._selectivity) == ["chart_3", "chart_2"]
+    assert to_pandas(cf.filter()["key"]).tolist() == [1, 2, 3]
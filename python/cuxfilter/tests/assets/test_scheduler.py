@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+from unittest import mock
+
+import pandas as pd
+import panel as pn
+
+import cuxfilter
+from cuxfilter.assets.scheduler import InteractionScheduler
+from cuxfilter.charts import bokeh
+
+
+def test_synchronous_without_session():
+    scheduler = InteractionScheduler()
+    calls = []
+    scheduler.submit("key", calls.append, 1)
+    scheduler.submit("key", calls.append, 2)
+    assert calls == [1, 2]
+    assert scheduler.cancelled() is False
+    assert scheduler.busy_indicator.value is False
+
+
+def test_coalesce_and_cancel():
+    scheduler = InteractionScheduler(debounce=0.01)
+    calls = []
+    started, release, done = (threading.Event() for _ in range(3))
+
+    def slow(value):
+        started.set()
+        release.wait(5)
+        calls.append((value, scheduler.cancelled()))
+
+    def fast(value):
+        calls.append((value, scheduler.cancelled()))
+        done.set()
+
+    with mock.patch.object(
+        InteractionScheduler, "enabled", new_callable=mock.PropertyMock
+    ) as enabled:
+        enabled.return_value = True
+        scheduler.submit("key", slow, 1)
+        assert scheduler.busy_indicator.value is True
+        assert started.wait(5)
+        # the running request is superseded, the queued ones coalesced
+        scheduler.submit("key", fast, 2)
+        scheduler.submit("key", fast, 3)
+        release.set()
+        assert done.wait(5)
+    scheduler.shutdown()
+
+    assert calls == [(1, True), (3, False)]
+    assert scheduler.busy_indicator.value is False
+
+
+def test_run_on_document():
+    scheduler = InteractionScheduler(debounce=0.01)
+    doc, calls, done = mock.Mock(), [], threading.Event()
+
+    def reload(value):
+        scheduler.run_on_document(calls.append, value)
+        done.set()
+
+    # outside of a scheduled run, updates are applied right away
+    reload(0)
+    assert calls == [0]
+
+    with (
+        mock.patch.object(
+            InteractionScheduler, "enabled", new_callable=mock.PropertyMock
+        ) as enabled,
+        mock.patch.object(
+            type(pn.state), "curdoc", new_callable=mock.PropertyMock
+        ) as curdoc,
+    ):
+        enabled.return_value = True
+        curdoc.return_value = doc
+        done.clear()
+        scheduler.submit("key", reload, 1)
+        assert done.wait(5)
+    scheduler.shutdown()
+
+    # the updates of a scheduled run, and the busy indicator value, are
+    # handed to the document thread
+    assert calls == [0]
+    assert scheduler.busy_indicator.value is False
+    busy, callback, idle = (
+        args[0] for args, _ in doc.add_next_tick_callback.call_args_list
+    )
+    busy()
+    assert scheduler.busy_indicator.value is True
+    callback()
+    assert calls == [0, 1]
+    idle()
+    assert scheduler.busy_indicator.value is False
+    # superseded updates are dropped
+    scheduler._latest["key"] += 1
+    callback()
+    assert calls == [0, 1]
+
+
+def test_dashboard_reads_wait_for_reload():
+    df = pd.DataFrame({"key": range(10), "val": range(10)})
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    dashboard = cux_df.dashboard([bokeh.bar("key")])
+    reads = [
+        dashboard._filtered_data,
+        lambda: dashboard.queried_indices,
+        lambda: dashboard._spatial_index("key", "val"),
+    ]
+    for read in reads:
+        done = threading.Event()
+        # a scheduled reload holds the lock while it updates the crossfilter
+        with dashboard._reload_lock:
+            thread = threading.Thread(target=lambda: (read(), done.set()))
+            thread.start()
+            assert not done.wait(0.05)
+        assert done.wait(5)
+        thread.join()
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+import cudf
+import cupy as cp
+import pandas as pd
+
+from cuxfilter.assets.crossfilter import CrossFilter
+from cuxfilter.assets.selection import Selection, compact_selection
+
+n_rows = 1000
+masks = {
+    "runs": np.arange(n_rows) // 100 == 3,
+    "ids": np.isin(np.arange(n_rows), [3, 17, 512, 999]),
+    "bitset": np.arange(n_rows) % 3 == 0,
+    "empty": np.zeros(n_rows, dtype="bool"),
+}
+
+
+@pytest.mark.parametrize("xp", [np, cp])
+@pytest.mark.parametrize("name", list(masks))
+def test_from_mask(xp, name):
+    mask = xp.asarray(masks[name])
+    selection = Selection.from_mask(mask)
+
+    assert selection.kind == ("runs" if name == "empty" else name)
+    assert selection.nbytes < mask.nbytes / 8 or name == "bitset"
+    assert selection.count == int(mask.sum())
+    np.testing.assert_array_equal(cp.asnumpy(selection.to_mask()), masks[name])
+    ids = xp.arange(n_rows)
+    np.testing.assert_array_equal(
+        cp.asnumpy(selection.contains(ids)), masks[name]
+    )
+
+
+@pytest.mark.parametrize("xp", [np, cp])
+@pytest.mark.parametrize("name", ["ids", "bitset", "empty"])
+def test_from_ids(xp, name):
+    ids = xp.flatnonzero(xp.asarray(masks[name]))
+    selection = Selection.from_ids(ids, n_rows)
+
+    assert selection.kind == ("bitset" if name == "bitset" else "ids")
+    assert selection.count == len(ids)
+    np.testing.assert_array_equal(cp.asnumpy(selection.to_mask()), masks[name])
+
+
+@pytest.mark.parametrize("left", list(masks))
+@pytest.mark.parametrize("right", list(masks))
+def test_combine(left, right):
+    a, b = Selection.from_mask(masks[left]), Selection.from_mask(masks[right])
+
+    np.testing.assert_array_equal(
+        cp.asnumpy((a & b).to_mask()), masks[left] & masks[right]
+    )
+    np.testing.assert_array_equal(
+        cp.asnumpy((a | b).to_mask()), masks[left] | masks[right]
+    )
+    with pytest.raises(ValueError):
+        a & Selection.from_mask(masks[right][:-1])
+
+
+@pytest.mark.parametrize("df_type", [pd.DataFrame, cudf.DataFrame])
+def test_crossfilter_selections(df_type):
+    df = df_type({"key": np.arange(n_rows)})
+    df.index = df.index + 10
+    cf = CrossFilter(df)
+    query_dict = {
+        "chart_1": compact_selection(df["key"] < 400),
+        "chart_2": compact_selection(df["key"] % 3 == 0),
+        "chart_3": "key>=@key_min",
+    }
+    cf.update(df, query_dict, {"key_min": 150})
+
+    result = cf.filter()["key"]
+    if isinstance(result, cudf.Series):
+        result = result.to_pandas()
+    assert result.tolist() == list(range(150, 400, 3))
+    assert cf.mask().index.equals(df.index)
@@ -0,0 +1,118 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026, NVIDIA CORPORATION. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+from unittest import mock
+
+import cudf
+import pandas as pd
+
+import cuxfilter
+from cuxfilter.assets.crossfilter import CrossFilter
+from cuxfilter.assets.predicates import And, Range
+from cuxfilter.assets.spatial_index import SpatialIndex
+from cuxfilter.charts import datashader
+from cuxfilter.charts.core.non_aggregate import core_non_aggregate
+from cuxfilter.charts.core.non_aggregate.utils import point_in_polygon
+
+from charts.utils import initialize_df
+
+n_rows = 5000
+rng = np.random.default_rng(0)
+df_args = {
+    "lon": rng.uniform(-10, 10, n_rows),
+    "lat": np.where(
+        np.arange(n_rows) % 17 == 0, np.nan, rng.normal(0, 4, n_rows)
+    ),
+    "time": pd.Timestamp("2020-01-01")
+    + pd.to_timedelta(rng.integers(0, 10**6, n_rows), unit="s"),
+}
+df_types = [pd.DataFrame, cudf.DataFrame]
+polygon = [(-6.0, -3.0), (2.0, -7.5), (8.5, 1.0), (0.5, 0.0), (-2.0, 6.5)]
+
+
+def to_list(arr):
+    if hasattr(arr, "to_pandas"):
+        arr = arr.to_pandas()
+    if hasattr(arr, "to_numpy"):
+        arr = arr.to_numpy()
+    return np.asarray(arr.get() if hasattr(arr, "get") else arr).tolist()
+
+
+@pytest.mark.parametrize("df_type", df_types)
+@pytest.mark.parametrize(
+    "x, y, x_range, y_range",
+    [
+        ("lon", "lat", (-3.5, 4.25), (-2.0, 9.0)),
+        ("lon", "lat", (-20, 20), (-20, 20)),
+        ("lon", "lat", (11, 12), (0, 1)),
+        (
+            "time",
+            "lon",
+            (pd.Timestamp("2020-01-03"), pd.Timestamp("2020-01-07")),
+            (-1.5, 2.5),
+        ),
+    ],
+)
+def test_spatial_index_box(df_type, x, y, x_range, y_range):
+    df = initialize_df(df_type, df_args)
+    index = SpatialIndex(df[x], df[y], block_size=64)
+    mask = And(Range(x, *x_range), Range(y, *y_range)).mask(df).fillna(False)
+    assert to_list(index.box(x_range, y_range).to_mask()) == to_list(mask)
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_spatial_index_lasso(df_type):
+    df = initialize_df(df_type, df_args)
+    index = SpatialIndex(df["lon"], df["lat"], block_size=64)
+    expected = point_in_polygon(df, "lon", "lat", polygon)
+    assert to_list(index.lasso(polygon).to_mask()) == to_list(expected)
+    # invalid polygons select no row
+    assert index.lasso(polygon[:2]).count == 0
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_crossfilter_spatial_box(df_type):
+    df = initialize_df(df_type, df_args)
+    cf = CrossFilter(df)
+    cf.spatial_index("lon", "lat")
+    box = And(Range("lon", -3.5, 4.25), Range("lat", -2.0, 9.0))
+    with mock.patch.object(
+        cf, "_compute_mask", wraps=cf._compute_mask
+    ) as compute_mask:
+        cf.update(df, {"scatter": box}, {})
+        result = cf.filter()
+    # the box is read from the spatial index
+    compute_mask.assert_not_called()
+    expected = df[box.mask(df).fillna(False)]
+    assert to_list(result.index) == to_list(expected.index)
+
+    # the index is rebuilt lazily for new source data
+    new_df = df.iloc[::2].reset_index(drop=True)
+    cf.update(new_df, {"scatter": box}, {})
+    assert cf._spatial_indexes == {}
+    result = cf.filter()
+    assert cf._spatial_indexes[("lon", "lat")].size == len(new_df)
+    expected = new_df[box.mask(new_df).fillna(False)]
+    assert to_list(result.index) == to_list(expected.index)
+
+
+@pytest.mark.parametrize("df_type", df_types)
+def test_dashboard_scatter_lasso(df_type):
+    df = initialize_df(df_type, df_args)
+    cux_df = cuxfilter.DataFrame.from_dataframe(df)
+    scatter = datashader.scatter("lon", "lat")
+    dashboard = cux_df.dashboard([scatter])
+    # the index is built when the chart is initiated
+    assert ("lon", "lat") in dashboard._crossfilter._spatial_indexes
+
+    with mock.patch.object(
+        core_non_aggregate, "point_in_polygon"
+    ) as scan_points:
+        scatter.get_lasso_select_callback(dashboard)(geometry=polygon)
+        scan_points.assert_not_called()
+    expected = point_in_polygon(df, "lon", "lat", polygon)
+    assert to_list(scatter.selected_indices.to_mask()) == to_list(expected)
+    result = dashboard._filtered_data()
+    assert to_list(result.index) == to_list(df[expected].index)
@@ -1,13 +1,17 @@
-# SPDX-FileCopyrightText: Copyright (c) 2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2025-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
 import cudf
 import numpy as np
+import pandas as pd
 from cudf.testing import assert_series_equal
 
 # Assume the function is in this path relative to the tests
-from cuxfilter.charts.core.non_aggregate.utils import point_in_polygon
+from cuxfilter.charts.core.non_aggregate.utils import (
+    point_in_polygon,
+    point_in_polygon_cpu,
+)
 
 
 @pytest.fixture
@@ -115,3 +119,46 @@ def test_point_in_polygon_all_points_inside():
     result = point_in_polygon(points_df, "x", "y", large_polygon)
     expected = cudf.Series([True, True, True], index=points_df.index)
     assert_series_equal(result, expected)
+
+
+def ray_cast_all_edges(px, py, polygon):
+    """Ray casting test of every point against every polygon edge."""
+    polygon = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+    intersections = np.zeros(len(px), dtype=np.int64)
+    for (vjx, vjy), (vj1x, vj1y) in zip(polygon, np.roll(polygon, -1, 0)):
+        if vjy == vj1y:
+            continue
+        crosses = ((vjy <= py) & (py < vj1y)) | ((vj1y <= py) & (py < vjy))
+        x_intersection = vjx + (py - vjy) * (vj1x - vjx) / (vj1y - vjy)
+        intersections += crosses & (px < x_intersection)
+    return intersections % 2 == 1
+
+
+def test_point_in_polygon_pandas(sample_points_df, simple_polygon_list):
+    """Test the CPU implementation with a pandas DataFrame."""
+    points_df = sample_points_df.to_pandas()
+    points_df.index = [10, 11, 12, 13]
+    result = point_in_polygon(points_df, "x", "y", simple_polygon_list)
+    expected = pd.Series([True, False, False, False], index=points_df.index)
+    pd.testing.assert_series_equal(result, expected)
+
+    invalid = point_in_polygon(points_df, "x", "y", [(0, 0), (1, 1)])
+    assert not invalid.any()
+
+
+@pytest.mark.parametrize("num_vertices", [3, 40, 300])
+@pytest.mark.parametrize("snap", [False, True])
+def test_point_in_polygon_cpu_matches_ray_cast(num_vertices, snap):
+    """The CPU grid gives the results of testing every edge."""
+    rng = np.random.default_rng(num_vertices)
+    # self intersecting polygon, with vertices and points on a coarse grid
+    # when snapped, so that points lie on edges, vertices and horizontals
+    polygon = rng.uniform(-1, 1, (num_vertices, 2))
+    px = rng.uniform(-1.5, 1.5, 10000)
+    py = rng.uniform(-1.5, 1.5, 10000)
+    if snap:
+        polygon, px, py = (np.round(a * 4) / 4 for a in (polygon, px, py))
+    px[:10] = np.nan
+
+    result = point_in_polygon_cpu(px, py, polygon)
+    np.testing.assert_array_equal(result, ray_cast_all_edges(px, py, polygon))
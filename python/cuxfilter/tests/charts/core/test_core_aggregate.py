@@ -1,6 +1,7 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import numpy as np
 import pytest
 import panel as pn
 
@@ -43,6 +44,15 @@ class TestBaseAggregateChart:
         assert bb.stride is None
         assert bb.stride_type is int
 
+    def test_compute_array_all_bins(self):
+        bb = BaseAggregateChart(x="key")
+        result = bb._compute_array_all_bins(
+            np.array([4.0, 0.0, 2.0, 1.0]),
+            np.array([2.0, 4.0]),
+            np.array([7, 3]),
+        )
+        assert result.tolist() == [3.0, 0.0, 7.0, 0.0]
+
     @pytest.mark.parametrize("chart, _chart", [(None, None), (1, 1)])
     def test_view(self, chart, _chart):
         bac = BaseAggregateChart(x="test_x", add_interaction=False)
@@ -79,7 +89,12 @@ class TestBaseAggregateChart:
             dashboard._query_local_variables_dict,
         )
 
-        assert dashboard._query_str_dict[f"key_count_bar_{bb.title}"] == query
+        assert (
+            dashboard._query_str_dict[
+                f"key_count_bar_{bb.title}"
+            ].to_query_str()
+            == query
+        )
         for key in local_dict:
             assert (
                 dashboard._query_local_variables_dict[key] == local_dict[key]
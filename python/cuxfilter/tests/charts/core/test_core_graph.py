@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2020-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2020-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import dask_cudf
@@ -55,6 +55,11 @@ class TestCoreGraph:
         assert bg.chart_type is None
         assert bg.use_data_tiles is False
         assert bg.reset_event is None
+        assert bg.edge_filter == "both"
+
+    def test_exceptions(self):
+        with pytest.raises(ValueError, match="edge_filter"):
+            BaseGraph(edge_filter="any")
 
     def test_view(self):
         bg = BaseGraph()
@@ -259,7 +264,9 @@ class TestCoreGraph:
             dashboard._query_str_dict, dashboard._query_local_variables_dict
         )
         assert (
-            dashboard._query_str_dict[f"x_y_vertex_count_test_{bg.title}"]
+            dashboard._query_str_dict[
+                f"x_y_vertex_count_test_{bg.title}"
+            ].to_query_str()
             == query
         )
         for key in local_dict:
@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
@@ -264,7 +264,7 @@ class TestCoreNonAggregateChart:
             f"_{bnac.aggregate_fn}_{bnac.chart_type}_{bnac.title}"
         )
 
-        assert dashboard._query_str_dict[bnac_key] == query
+        assert dashboard._query_str_dict[bnac_key].to_query_str() == query
         for key in local_dict:
             assert (
                 dashboard._query_local_variables_dict[key] == local_dict[key]
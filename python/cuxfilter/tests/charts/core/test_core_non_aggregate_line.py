@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2020-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2020-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
@@ -87,7 +87,9 @@ class TestNonAggregateBaseLine:
         )
 
         assert (
-            dashboard._query_str_dict["x_y_non_aggregate_line_custom_title"]
+            dashboard._query_str_dict[
+                "x_y_non_aggregate_line_custom_title"
+            ].to_query_str()
             == query
         )
         for key in local_dict:
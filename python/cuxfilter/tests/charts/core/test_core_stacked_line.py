@@ -1,4 +1,4 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
@@ -164,7 +164,7 @@ class TestBaseStackedLine:
         assert (
             dashboard._query_str_dict[
                 f"x_{'_'.join(['y'])}_stacked_lines_{bsl.title}"
-            ]
+            ].to_query_str()
             == query
         )
         for key in local_dict:
@@ -1,9 +1,12 @@
-# SPDX-FileCopyrightText: Copyright (c) 2020-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2020-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import numpy as np
+import pandas as pd
 import pytest
 import cudf
 import cupy as cp
+from cuxfilter.assets.graph_adjacency import GraphAdjacency
 from cuxfilter.charts.datashader.custom_extensions import graph_assets
 from dask.dataframe import assert_eq
 
@@ -54,3 +57,102 @@ class TestGraphAssets:
         ).reset_index(drop=True)
 
         assert_eq(res, result, check_divisions=False, check_index=False)
+
+
+def segments(df):
+    """sorted (endpoints, color) tuples of the 3 row segments of the edges"""
+    if hasattr(df, "to_pandas"):
+        df = df.to_pandas()
+    points = df[["x", "y", "color"]].to_numpy().reshape(-1, 3, 3)
+    result = []
+    for segment in points:
+        segment = segment[~np.isnan(segment[:, 0])]
+        result.append((sorted(map(tuple, segment[:, :2])), segment[0, 2]))
+    return sorted(result)
+
+
+@pytest.mark.parametrize("df_type", [cudf.DataFrame, pd.DataFrame])
+@pytest.mark.parametrize("edge_filter", ["both", "either"])
+def test_edge_table(df_type, edge_filter):
+    rng = np.random.default_rng(0)
+    nodes = df_type(
+        {
+            "vertex": rng.permutation(200) * 2,
+            "x": rng.uniform(0, 1, 200),
+            "y": rng.uniform(0, 1, 200),
+        }
+    )
+    edges = df_type(
+        {
+            "source": rng.integers(0, 210, 600) * 2,
+            "target": rng.integers(0, 200, 600) * 2,
+            "color": rng.uniform(0, 1, 600),
+        }
+    )
+    args = ("x", "y", "vertex", "source", "target", "color")
+    dtypes = (cp.float64, cp.float64)
+    table = graph_assets.EdgeTable(
+        nodes,
+        edges,
+        GraphAdjacency(nodes.vertex, edges.source, edges.target),
+        *args,
+        *dtypes,
+    )
+    selected = nodes[nodes.x < 0.4]
+    if edge_filter == "both":
+        expected = graph_assets.calc_connected_edges(
+            selected, edges, *args, *dtypes
+        )
+    else:
+        ids = selected.vertex
+        expected = graph_assets.calc_connected_edges(
+            nodes,
+            edges[edges.source.isin(ids) | edges.target.isin(ids)],
+            *args,
+            *dtypes,
+        )
+    result = table.select(selected, edge_filter=edge_filter)
+    assert segments(result) == segments(expected)
+
+    # restricted to a subset of the edges, as for neighbor inspection
+    subset = edges.iloc[::3]
+    expected = graph_assets.calc_connected_edges(
+        selected, subset, *args, *dtypes
+    )
+    assert segments(table.select(selected, subset)) == segments(expected)
+
+
+@pytest.mark.parametrize("df_type", [cudf.DataFrame, pd.DataFrame])
+@pytest.mark.parametrize("edge_aggregate_col", [None, "color"])
+def test_directly_connect_edges(df_type, edge_aggregate_col):
+    rng = np.random.default_rng(0)
+    edges = df_type(
+        {
+            "x_src": rng.uniform(0, 1, 100).astype("float32"),
+            "y_src": rng.integers(0, 10, 100),
+            "x_dst": rng.uniform(0, 1, 100),
+            "y_dst": rng.integers(0, 10, 100),
+            "color": rng.integers(0, 5, 100),
+        }
+    )
+    result = graph_assets.directly_connect_edges(
+        edges, "x", "y", edge_aggregate_col
+    )
+    columns = ["x", "y"] + ([edge_aggregate_col] if edge_aggregate_col else [])
+    assert list(result.columns) == columns
+    assert len(result) == 3 * len(edges)
+    if hasattr(result, "to_pandas"):
+        result = result.to_pandas()
+    # rows 3 * i to 3 * i + 2 are the src, dst and separator of edge i
+    points = result.to_numpy().reshape(-1, 3, len(columns))
+    for column, names in enumerate([("x_src", "x_dst"), ("y_src", "y_dst")]):
+        for row, name in enumerate(names):
+            np.testing.assert_allclose(
+                points[:, row, column], cp.asnumpy(edges[name].values)
+            )
+    if edge_aggregate_col:
+        np.testing.assert_array_equal(
+            points[:, :2, 2],
+            np.repeat(cp.asnumpy(edges["color"].values)[:, None], 2, axis=1),
+        )
+    assert np.isnan(points[:, 2]).all()
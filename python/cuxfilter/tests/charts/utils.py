@@ -1,15 +1,32 @@
-# SPDX-FileCopyrightText: Copyright (c) 2022-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2022-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import cudf
 import dask_cudf
+import pandas as pd
 
 
-def initialize_df(type, *df_args):
+def initialize_df(type, *df_args, npartitions=2):
+    if type == pd.DataFrame:
+        return pd.DataFrame(*df_args)
     df = cudf.DataFrame(*df_args)
     if type == cudf.DataFrame:
         return df
-    return dask_cudf.from_cudf(df, npartitions=2)
+    return dask_cudf.from_cudf(df, npartitions=npartitions)
+
+
+def to_pandas(df):
+    if isinstance(df, (dask_cudf.DataFrame, dask_cudf.Series)):
+        df = df.compute()
+    if isinstance(df, (cudf.DataFrame, cudf.Series)):
+        df = df.to_pandas()
+    return df.reset_index(drop=True)
+
+
+def brush(chart, dashboard, x_selection):
+    chart.get_box_select_callback(dashboard)(
+        bounds=None, x_selection=x_selection, y_selection=None
+    )
 
 
 def df_equals(df1, df2):
@@ -1,7 +1,8 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
+from unittest import mock
 
 import cuxfilter
 from cuxfilter.charts import bokeh, panel_widgets
@@ -41,6 +42,90 @@ class TestDashBoard:
             f"key_count_chart_3_{bac.title}",
         ]
 
+    def test_reinit_charts(self):
+        key_chart, val_chart = bokeh.bar("key"), bokeh.bar("val")
+        dashboard = self.cux_df.dashboard(charts=[key_chart, val_chart])
+        charts = list(dashboard.charts.values())
+        key_chart.box_selected_range = {"key_min": 1, "key_max": 3}
+        key_chart.compute_query_dict(
+            dashboard._query_str_dict, dashboard._query_local_variables_dict
+        )
+
+        with mock.patch.object(
+            dashboard, "_initiate_chart", wraps=dashboard._initiate_chart
+        ) as initiate_chart:
+            # charts are initiated once
+            dashboard._reinit_all_charts()
+            initiate_chart.assert_not_called()
+            assert key_chart.name in dashboard._query_str_dict
+
+            # new charts, or charts whose parameters changed, are initiated
+            # again
+            new_chart = bokeh.bar("val", title="new")
+            dashboard.add_charts([new_chart])
+            val_chart.unselected_alpha = 0.5
+            dashboard._reinit_all_charts()
+            assert [c.args[0] for c in initiate_chart.call_args_list] == [
+                new_chart,
+                val_chart,
+            ]
+            assert key_chart.name in dashboard._query_str_dict
+
+            # all charts are initiated again for new data
+            dashboard._cuxfilter_df.data = self.df.copy()
+            dashboard._reinit_all_charts()
+            assert initiate_chart.call_count == 2 + len(charts) + 1
+            assert dashboard._query_str_dict == {}
+        dashboard._cuxfilter_df.data = self.df
+
+    @pytest.mark.parametrize("executor", ["thread", None])
+    def test_reload_charts_executor(self, executor):
+        key_chart, val_chart = bokeh.bar("key"), bokeh.bar("val")
+        max_chart = bokeh.bar("key", "val", aggregate_fn="max")
+        dashboard = self.cux_df.dashboard(
+            charts=[key_chart, val_chart, max_chart],
+            executor=executor,
+            aggregate_cache_size=0,
+        )
+        key_chart.box_selected_range = {"key_min": 1, "key_max": 3}
+        key_chart.compute_query_dict(
+            dashboard._query_str_dict, dashboard._query_local_variables_dict
+        )
+        if executor is None:
+            assert dashboard._executor is None
+            dashboard._reload_charts()
+        else:
+            with mock.patch.object(
+                dashboard._executor,
+                "submit",
+                wraps=dashboard._executor.submit,
+            ) as submit:
+                dashboard._reload_charts()
+            # the histograms and the datasize indicator are computed in a
+            # single pass, concurrently with the max aggregate
+            assert submit.call_count == 2
+        assert val_chart.chart.source_df[0].tolist() == [11.0, 12.0, 13.0]
+        assert max_chart.chart.source_df["val"].tolist() == [11.0, 12.0, 13.0]
+        assert dashboard._sidebar[self._datasize_title].chart[0].value == 3
+
+    def test_reload_charts_source_columns(self):
+        df = cudf.DataFrame(
+            {"key": [0, 1, 2, 3, 4], "val": [float(i + 10) for i in range(5)]}
+        )
+        cux_df = cuxfilter.DataFrame.from_dataframe(df)
+        key_chart = bokeh.bar("key", "val", aggregate_fn="max")
+        dashboard = cux_df.dashboard(charts=[key_chart], executor=None)
+        dashboard._query_str_dict["val_filter"] = "val>=12"
+        with mock.patch.object(
+            key_chart, "calculate_source", wraps=key_chart.calculate_source
+        ) as calculate_source:
+            dashboard._reload_charts()
+        # the chart only gets the filtered rows of the columns it reads
+        data = calculate_source.call_args[0][0]
+        assert list(data.columns) == ["key", "val"]
+        assert data["key"].to_numpy().tolist() == [2, 3, 4]
+        assert dashboard._sidebar[self._datasize_title].chart[0].value == 3
+
     def test_add_sidebar(self):
         dashboard = self.cux_df.dashboard(charts=[], title="test_title")
         dashboard1 = self.cux_df.dashboard(charts=[], title="test_title")
@@ -1,11 +1,16 @@
-# SPDX-FileCopyrightText: Copyright (c) 2019-2025, NVIDIA CORPORATION. All rights reserved.
+# SPDX-FileCopyrightText: Copyright (c) 2019-2026, NVIDIA CORPORATION. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
 import pytest
+from unittest import mock
 
 from cuxfilter import DataFrame
+from cuxfilter.charts import bokeh, panel_widgets
 import cuxfilter
 import cudf
+import dask_cudf
+import dask.dataframe as dd
+import pandas as pd
 
 
 class TestDataFrame:
@@ -32,3 +37,169 @@ class TestDataFrame:
             dashboard._dashboard.__class__ == cuxfilter.layouts.single_feature
         )
         assert dashboard._theme == cuxfilter.themes.default
+
+    @pytest.mark.parametrize(
+        "df_type", [pd.DataFrame, cudf.DataFrame, dask_cudf.DataFrame]
+    )
+    def test_profile(self, df_type):
+        df = cudf.DataFrame(
+            {"key": [0, 1, 2, 2, 4], "val": [1.0, None, 3.0, 4.0, 4.0]}
+        )
+        if df_type == pd.DataFrame:
+            df = df.to_pandas()
+        elif df_type == dask_cudf.DataFrame:
+            df = dask_cudf.from_cudf(df, npartitions=2)
+        cux_df = DataFrame.from_dataframe(df)
+
+        profile = cux_df.profile()
+        assert list(profile.index) == ["key", "val"]
+        assert list(profile.columns) == [
+            "dtype",
+            "min",
+            "max",
+            "null_count",
+            "distinct",
+        ]
+        assert profile.loc["key", ["min", "max"]].tolist() == [0, 4]
+        assert profile.loc["val", ["min", "max"]].tolist() == [1.0, 4.0]
+        assert profile["null_count"].tolist() == [0, 1]
+        assert profile["distinct"].tolist() == [4, 3]
+        assert cux_df.get_min_max("val") == (1.0, 4.0)
+
+    @pytest.mark.parametrize("df_type", [pd.DataFrame, cudf.DataFrame])
+    def test_profile_reductions(self, df_type):
+        df = cudf.DataFrame(
+            {
+                "x": [0.5, 1.5, None, 2.5],
+                "y": [1.0, 2.0, 3.0, 4.0],
+                "key": [0, 1, 2, 2],
+            }
+        )
+        if df_type == pd.DataFrame:
+            df = df.to_pandas()
+        cux_df = DataFrame.from_dataframe(df)
+        with (
+            mock.patch.object(
+                df_type, "agg", autospec=True, side_effect=df_type.agg
+            ) as agg,
+            mock.patch.object(pd.Series, "nunique") as nunique,
+        ):
+            profile = cux_df.profile(distinct=False)
+            # one min/max aggregation per dtype, distinct values not counted
+            assert agg.call_count == 2
+            assert not nunique.called
+        assert "distinct" not in profile.columns
+        assert profile["null_count"].tolist() == [1, 0, 0]
+        assert cux_df.get_min_max("x") == (0.5, 2.5)
+        # distinct counts are computed on request, from the kept profiles
+        with mock.patch.object(df_type, "agg") as agg:
+            profile = cux_df.profile(["key"])
+            assert not agg.called
+        assert profile.loc["key", "distinct"] == 3
+
+    def test_dashboard_profile(self):
+        df = dask_cudf.from_cudf(
+            cudf.DataFrame(
+                {"key": [0, 1, 2, 3, 4], "val": [float(i) for i in range(5)]}
+            ),
+            npartitions=2,
+        )
+        cux_df = DataFrame.from_dataframe(df)
+        charts = [
+            bokeh.bar("key"),
+            panel_widgets.range_slider("val"),
+            panel_widgets.int_slider("key"),
+        ]
+        with mock.patch(
+            "cuxfilter.dataframe.dd.compute", wraps=dd.compute
+        ) as compute:
+            cux_df.dashboard(charts)
+            # all the chart columns are profiled in a single compute
+            assert compute.call_count == 1
+        assert charts[1].min_value == 0.0
+        assert charts[1].max_value == 4.0
+
+    @pytest.mark.parametrize(
+        "df_type", [pd.DataFrame, cudf.DataFrame, dask_cudf.DataFrame]
+    )
+    def test_encode_strings(self, df_type):
+        df = cudf.DataFrame(
+            {"state": ["NY", "CA", None, "TX", "CA"], "key": [0, 1, 2, 3, 4]}
+        )
+        if df_type == pd.DataFrame:
+            df = df.to_pandas()
+        elif df_type == dask_cudf.DataFrame:
+            df = dask_cudf.from_cudf(df, npartitions=2)
+        cux_df = DataFrame.from_dataframe(df, encode_strings=True)
+
+        codes = cux_df.data["state"]
+        if df_type == dask_cudf.DataFrame:
+            codes = codes.compute()
+        if hasattr(codes, "to_pandas"):
+            codes = codes.to_pandas()
+        assert codes.fillna(-1).tolist() == [1, 0, -1, 2, 0]
+        assert cux_df.label_map("state") == {0: "CA", 1: "NY", 2: "TX"}
+        assert cux_df.label_map("key") is None
+        # the source dataframe is left unchanged
+        assert df["state"].dtype != cux_df.data["state"].dtype
+
+    def test_dashboard_encoded_strings(self):
+        df = cudf.DataFrame({"state": ["NY", "CA", "TX", "CA", "CA", "NY"]})
+        cux_df = DataFrame.from_dataframe(df, encode_strings=["state"])
+        bar = bokeh.bar("state")
+        multi_select = panel_widgets.multi_select("state")
+        dashboard = cux_df.dashboard([bar], sidebar=[multi_select])
+
+        # labels are only used for display
+        assert multi_select.chart.options == {"CA": 0, "NY": 1, "TX": 2}
+        bars = bar.chart.histogram()
+        assert list(bars.dimension_values("state")) == ["CA", "NY", "TX"]
+
+        multi_select.chart.value = [0, 2]
+        assert dashboard._query_str_dict[multi_select.name].values == (0, 2)
+        assert len(dashboard._filtered_data()) == 4
+
+    @pytest.mark.parametrize(
+        "df_type", [pd.DataFrame, cudf.DataFrame, dask_cudf.DataFrame]
+    )
+    def test_downcast(self, df_type):
+        df = cudf.DataFrame(
+            {
+                "small": [0, 1, 2, 3, 100],
+                "large": [0, 1, 2, 3, 2**40],
+                "lat": [40.5, 40.75, None, 40.25, 41.0],
+                "val": [0.1, 0.2, 0.3, 0.4, 0.5],
+                "state": ["NY", "CA", "CA", "TX", "CA"],
+                "time": cudf.date_range("2020-01-01", periods=5, freq="D"),
+            }
+        )
+        if df_type == pd.DataFrame:
+            df = df.to_pandas()
+        elif df_type == dask_cudf.DataFrame:
+            df = dask_cudf.from_cudf(df, npartitions=2)
+        cux_df = DataFrame.from_dataframe(df, downcast=True)
+
+        report = cux_df.downcast_report
+        assert list(report.index) == ["small", "lat", "state"]
+        assert report["downcast_dtype"].astype(str).tolist() == [
+            "int8",
+            "float32",
+            "int32",
+        ]
+        assert (report["downcast_nbytes"] < report["nbytes"]).all()
+        assert cux_df.data["large"].dtype == "int64"
+        # float32 would not hold the values of val exactly
+        assert cux_df.data["val"].dtype == "float64"
+        assert cux_df.label_map("state") == {0: "CA", 1: "NY", 2: "TX"}
+        # ranges are kept in the original dtypes for the charts
+        assert cux_df.get_min_max("small") == (0, 100)
+        assert cux_df.get_min_max("small")[0].dtype == "int64"
+
+        restored = cux_df.restore_dtypes(cux_df.data)
+        if df_type == dask_cudf.DataFrame:
+            restored, df = restored.compute(), df.compute()
+        assert restored.dtypes.to_dict() == df.dtypes.to_dict()
+        assert restored["small"].to_numpy().tolist() == [0, 1, 2, 3, 100]
+        assert restored["state"].to_numpy().tolist() == (
+            df["state"].to_numpy().tolist()
+        )